@@ -0,0 +1,98 @@
+"""
+Benchmark of the ensemble evaluation of many in profiles through one roll pass against solving the roll pass
+for each member, reporting the deviations of the ensemble results from the full solutions of sampled members.
+
+Run with ``python benchmarks/bench_ensemble.py`` having the package installed.
+"""
+
+import copy
+import time
+
+import numpy as np
+
+from pyroll.core import Profile, RollPass, Roll, CircularOvalGroove, root_hooks
+from pyroll.pillar_model.ensemble import solve_ensemble
+
+MEMBER_COUNTS = [10, 100]
+SAMPLED_MEMBERS = 3
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.3
+
+
+def members(count, rng):
+    return [
+        Profile.round(
+            diameter=rng.normal(19.5e-3, 0.1e-3),
+            temperature=1200 + 273.15,
+            strain=0,
+            material=["C45", "steel"],
+            flow_stress=rng.normal(100e6, 3e6),
+            density=7.5e3,
+            specific_heat_capcity=690,
+        )
+        for _ in range(count)
+    ]
+
+
+def roll_pass():
+    return RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=5e-3,
+                r1=0.2e-3,
+                r2=16e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=15,
+    )
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    with RollPass.DiskElement.pillar_spreads(pillar_spreads):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+        try:
+            print(
+                f"{'members':>8} {'ensemble [s]':>13} {'serial [s]':>11} {'speedup':>9} "
+                f"{'strain dev':>11} {'force dev':>10}"
+            )
+            for n in MEMBER_COUNTS:
+                profiles = members(n, rng)
+                rp = roll_pass()
+
+                start = time.perf_counter()
+                result = solve_ensemble(rp, profiles)
+                t_ensemble = time.perf_counter() - start
+
+                # serial time extrapolated from full solutions of sampled members
+                strain_deviation = force_deviation = 0
+                start = time.perf_counter()
+                for i in rng.choice(n, SAMPLED_MEMBERS, replace=False):
+                    member = copy.deepcopy(rp)
+                    member.solve(profiles[i])
+                    strain_deviation = max(
+                        strain_deviation, np.max(np.abs(result.total_pillar_strains[i] - member.total_pillar_strains))
+                    )
+                    force_deviation = max(
+                        force_deviation, abs(result.roll_forces[i] - member.roll_force) / member.roll_force
+                    )
+                t_serial = (time.perf_counter() - start) / SAMPLED_MEMBERS * n
+
+                print(
+                    f"{n:>8} {t_ensemble:>13.2f} {t_serial:>11.2f} {t_serial / t_ensemble:>9.1f} "
+                    f"{strain_deviation:>11.1e} {force_deviation:>10.1e}"
+                )
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of the coarse-to-fine multilevel solution of a roll pass against its direct solution at 300 pillars.
+
+The iteration limit is raised above the default, so that the direct reference converges instead of stopping at the
+limit, which would understate its iteration count and distort the strain deviations.
+
+Run with ``python benchmarks/bench_multilevel_solve.py`` having the package installed.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import pyroll.pillar_model
+from pyroll.pillar_model.resolution import multilevel_solve, solve_level
+from pyroll.pillar_model.roll_pass.warm_start import solution_converged
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "tests"))
+from scenarios import round_oval, pillar_spreads
+
+PILLAR_COUNT = 300
+COARSE_PILLAR_COUNTS = [[30], [20, 60]]
+MAX_ITERATION_COUNT = 1000
+
+
+def roll_pass():
+    (rp,), in_profile = round_oval()
+    rp.max_iteration_count = MAX_ITERATION_COUNT
+    return rp, in_profile
+
+
+def main():
+    pyroll.pillar_model.Config.PILLAR_COUNT = PILLAR_COUNT
+
+    with pillar_spreads(-0.3):
+        rp, in_profile = roll_pass()
+        direct_rp, direct = solve_level(rp, in_profile, PILLAR_COUNT)
+
+        print(
+            f"{'levels':>12} {'time [s]':>9} {'iterations':>11} {'fine iterations':>16} "
+            f"{'strain dev':>11} {'speedup':>9} {'converged':>10}"
+        )
+        print(f"{PILLAR_COUNT:>12} {direct.duration:>9.2f} {direct.iteration_count:>11} "
+              f"{direct.iteration_count:>16} {0:>11.1e} {1:>9.2f} {solution_converged(direct_rp)!s:>10}")
+
+        for coarse_pillar_counts in COARSE_PILLAR_COUNTS:
+            rp, in_profile = roll_pass()
+            levels = multilevel_solve(rp, in_profile, coarse_pillar_counts)
+
+            duration = sum(level.duration for level in levels)
+            iterations = sum(level.iteration_count for level in levels)
+            deviation = np.max(np.abs(levels[-1].total_pillar_strains - direct.total_pillar_strains))
+            label = "/".join(str(level.pillar_count) for level in levels)
+
+            print(f"{label:>12} {duration:>9.2f} {iterations:>11} {levels[-1].iteration_count:>16} "
+                  f"{deviation:>11.1e} {direct.duration / duration:>9.2f} {solution_converged(rp)!s:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark of the bracketed pillar entry point search against the former secant search per pillar.
+
+Run with ``python benchmarks/bench_pillar_entry_angles.py`` having the package installed.
+"""
+
+import timeit
+
+import numpy as np
+from scipy.optimize import root_scalar
+
+import pyroll.pillar_model
+from pyroll.core import Profile, RollPass, Roll, CircularOvalGroove
+from pyroll.pillar_model.roll_pass import sweep
+
+PILLAR_COUNTS = [30, 200]
+
+
+def secant_entry_angles(roll: RollPass.Roll):
+    rp = roll.roll_pass
+
+    entry_points = []
+    for center, height in zip(rp.in_profile.pillars, rp.in_profile.pillar_heights):
+        try:
+            sol = root_scalar(lambda x: height - rp.gap - 2 * roll.surface_interpolation(x, center),
+                              x0=rp.entry_point * 0.9,
+                              x1=rp.entry_point * 1.1)
+            entry_points.append(np.asarray(sol.root).flatten()[0])
+        except ValueError:
+            entry_points.append(0)
+
+    local_roll_radii = np.concatenate(
+        [roll.max_radius - roll.surface_interpolation(0, center) for center in rp.in_profile.pillars],
+        axis=0).flatten()
+
+    return np.asarray([np.arcsin(p / r) for p, r in zip(entry_points, local_roll_radii)])
+
+
+def bracketed_entry_angles(roll: RollPass.Roll):
+    rp = roll.roll_pass
+    x = np.append(roll.surface_x[roll.surface_x < 0], 0)
+    depths = roll.surface_interpolation(x, rp.in_profile.pillars)
+    entry_points, _ = sweep.pillar_entry_points(x, depths, rp.in_profile.pillar_heights, rp.gap)
+    local_roll_radii = roll.max_radius - depths[:, -1]
+    return np.arcsin(entry_points / local_roll_radii)
+
+
+def roll_pass(pillar_count: int) -> RollPass:
+    pyroll.pillar_model.Config.PILLAR_COUNT = pillar_count
+    in_profile = Profile.round(diameter=19.5e-3, temperature=1200 + 273.15, strain=0, material="C45",
+                               flow_stress=100e6)
+    rp = RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(depth=5e-3, r1=0.2e-3, r2=16e-3),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=15,
+    )
+    rp.init_solve(in_profile)
+    return rp
+
+
+def main():
+    print(f"{'pillars':>8} {'secant [ms]':>12} {'bracketed [ms]':>15} {'speedup':>9} {'max. deviation':>15}")
+    for n in PILLAR_COUNTS:
+        rp = roll_pass(n)
+        roll = rp.roll
+        deviation = np.max(np.abs(secant_entry_angles(roll) - bracketed_entry_angles(roll)))
+
+        secant = min(timeit.repeat(lambda: secant_entry_angles(roll), number=3, repeat=3)) / 3
+        bracketed = min(timeit.repeat(lambda: bracketed_entry_angles(roll), number=30, repeat=3)) / 30
+        print(f"{n:>8} {secant * 1e3:>12.2f} {bracketed * 1e3:>15.3f} {secant / bracketed:>9.1f} {deviation:>15.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark of the chord height table (built and evaluated) against the former loop of one shapely intersection per pillar.
+
+Run with ``python benchmarks/bench_pillar_heights.py`` having the package installed.
+"""
+
+import timeit
+
+import numpy as np
+import shapely
+
+from pyroll.core import Profile
+from pyroll.pillar_model.geometry import ChordHeightTable
+
+PILLAR_COUNTS = [30, 100, 500, 2000]
+
+
+def loop_chord_heights(cross_section, z):
+    return np.array(
+        [
+            shapely.intersection(
+                cross_section,
+                shapely.LineString([(p, cross_section.bounds[1]), (p, cross_section.bounds[3])])
+            ).length
+            for p in z
+        ]
+    )
+
+
+def main():
+    cs = Profile.round(diameter=19.5e-3).cross_section
+
+    print(f"{'pillars':>8} {'loop [ms]':>12} {'table [ms]':>14} {'speedup':>9}")
+    for n in PILLAR_COUNTS:
+        z = np.linspace(0, cs.bounds[2], n)
+        number = max(1, 2000 // n)
+        loop = min(timeit.repeat(lambda: loop_chord_heights(cs, z), number=number, repeat=3)) / number
+        table = min(timeit.repeat(lambda: ChordHeightTable(cs)(z), number=number, repeat=3)) / number
+        print(f"{n:>8} {loop * 1e3:>12.3f} {table * 1e3:>14.3f} {loop / table:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of the batched construction of pillar sections against clipping the cross-section once per pillar.
+
+Run with ``python benchmarks/bench_pillar_sections.py`` having the package installed.
+"""
+
+import math
+import timeit
+
+import numpy as np
+import shapely
+
+from pyroll.core import Profile
+from pyroll.pillar_model.geometry import pillar_sections, LazyPillarSections
+
+PILLAR_COUNTS = [30, 100, 500, 2000]
+
+
+def loop_pillar_sections(cross_section, boundaries):
+    a = np.zeros(len(boundaries) - 1, dtype=object)
+
+    for i in range(0, len(a)):
+        a[i] = shapely.clip_by_rect(cross_section, boundaries[i], -math.inf, boundaries[i + 1], math.inf)
+
+    return a
+
+
+def main():
+    cs = Profile.round(diameter=19.5e-3).cross_section
+
+    print(f"{'pillars':>8} {'loop [ms]':>12} {'batched [ms]':>14} {'speedup':>9} {'lazy, one pillar [ms]':>23}")
+    for n in PILLAR_COUNTS:
+        dw = cs.bounds[2] / (n - 0.5)
+        boundaries = np.arange(n + 1) * dw - dw / 2
+        number = max(1, 2000 // n)
+        loop = min(timeit.repeat(lambda: loop_pillar_sections(cs, boundaries), number=number, repeat=3)) / number
+        batched = min(timeit.repeat(lambda: pillar_sections(cs, boundaries), number=number, repeat=3)) / number
+        lazy = min(
+            timeit.repeat(lambda: LazyPillarSections(cs, boundaries)[n // 2], number=number, repeat=3)
+        ) / number
+        print(f"{n:>8} {loop * 1e3:>12.3f} {batched * 1e3:>14.3f} {loop / batched:>9.1f} {lazy * 1e3:>23.3f}")
+
+
+if __name__ == "__main__":
+    main()
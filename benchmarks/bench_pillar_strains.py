@@ -0,0 +1,80 @@
+"""
+Benchmark of the per disk element cost of the masked pillar strain and strain rate evaluation
+against the former per-pillar loops.
+
+Run with ``python benchmarks/bench_pillar_strains.py`` having the package installed.
+"""
+
+import timeit
+
+import numpy as np
+
+PILLAR_COUNTS = [30, 500]
+
+
+def loop_strains(log_elongations, log_spreads, log_draughts, contacts, previous_contacts, corner_strains):
+    strains = np.sqrt(2 / 3 * (log_elongations ** 2 + log_spreads ** 2 + log_draughts ** 2))
+
+    for i in range(len(strains)):
+        if contacts[i] and not previous_contacts[i]:
+            strains[i] = strains[i] + corner_strains[i]
+
+    return strains
+
+
+def loop_strain_rates(velocities, strains, contacts, length):
+    strain_rates = np.zeros_like(strains)
+    for i, _ in enumerate(strains):
+        if contacts[i]:
+            strain_rates[i] = velocities[i] * strains[i] / length
+
+    return strain_rates
+
+
+def masked_strains(log_elongations, log_spreads, log_draughts, contacts, previous_contacts, corner_strains):
+    strains = np.sqrt(2 / 3 * (log_elongations ** 2 + log_spreads ** 2 + log_draughts ** 2))
+
+    entering = contacts & ~previous_contacts
+    strains[entering] += corner_strains[entering]
+
+    return strains
+
+
+def masked_strain_rates(velocities, strains, contacts, length):
+    strain_rates = np.zeros_like(strains)
+    strain_rates[contacts] = velocities[contacts] * strains[contacts] / length
+    return strain_rates
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    print(f"{'pillars':>8} {'loop [us]':>12} {'masked [us]':>13} {'speedup':>9}")
+    for n in PILLAR_COUNTS:
+        log_draughts = rng.uniform(-0.3, 0, n)
+        log_spreads = rng.uniform(0, 0.1, n)
+        log_elongations = -log_draughts - log_spreads
+        contacts = rng.uniform(size=n) < 0.7
+        previous_contacts = contacts & (rng.uniform(size=n) < 0.8)
+        corner_strains = rng.uniform(0, 0.05, n)
+        velocities = rng.uniform(1, 2, n)
+        args = (log_elongations, log_spreads, log_draughts, contacts, previous_contacts, corner_strains)
+
+        def loop():
+            strains = loop_strains(*args)
+            loop_strain_rates(velocities, strains, contacts, 1e-3)
+
+        def masked():
+            strains = masked_strains(*args)
+            masked_strain_rates(velocities, strains, contacts, 1e-3)
+
+        assert np.allclose(loop_strains(*args), masked_strains(*args))
+
+        number = 2000
+        t_loop = min(timeit.repeat(loop, number=number, repeat=3)) / number
+        t_masked = min(timeit.repeat(masked, number=number, repeat=3)) / number
+        print(f"{n:>8} {t_loop * 1e6:>12.1f} {t_masked * 1e6:>13.1f} {t_loop / t_masked:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark of the overhead of the pillar profiler, solving a roll pass without, with disabled and with enabled
+instrumentation, and printing the profiler's table of the hottest functions.
+
+Run with ``python benchmarks/bench_profiling.py`` having the package installed.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from pyroll.pillar_model.profiling import PillarProfiler
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "tests"))
+from scenarios import round_oval, pillar_spreads
+
+
+def solve():
+    (rp,), in_profile = round_oval()
+
+    start = time.perf_counter()
+    rp.solve(in_profile)
+    return time.perf_counter() - start
+
+
+def main():
+    with pillar_spreads(-0.3):
+        t_plain = solve()
+
+        profiler = PillarProfiler()
+        profiler.enable()
+        profiler.disable()
+        t_disabled = solve()
+
+        with profiler:
+            t_enabled = solve()
+
+    print(f"{'profiler':>9} {'time [s]':>9} {'overhead':>9}")
+    for label, t in [("none", t_plain), ("disabled", t_disabled), ("enabled", t_enabled)]:
+        print(f"{label:>9} {t:>9.2f} {t / t_plain - 1:>9.1%}")
+
+    print()
+    print(profiler.table(limit=15))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark of the process pool runner against solving the variants of a pass sequence serially,
+reporting the parallel efficiency per worker count and the size of the results sent back by the workers.
+At least two workers are always measured, also on single processor machines, where the efficiency then shows
+the overhead of the pool. The sweep is repeated with multiple workers and the warm start of the spread correction
+enabled, reporting the iterations of a cold and of a warm started sweep sharing the store through the parent.
+
+Run with ``python benchmarks/bench_runner.py`` having the package installed.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from pyroll.core import Profile, PassSequence, RollPass, Roll, CircularOvalGroove, root_hooks
+from pyroll.pillar_model.roll_pass.warm_start import WarmStartStore
+from pyroll.pillar_model.runner import run_variants, solve_variant
+
+GAPS = [3.5e-3 + i * 0.1e-3 for i in range(16)]
+WORKER_COUNTS = sorted({1, 2, 4, 8, 16, 32, os.cpu_count()})
+MIN_WORKER_COUNT = 2
+"""Worker count measured even if exceeding the count of processors."""
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.3
+
+
+def register_pillar_spreads():
+    RollPass.DiskElement.pillar_spreads.add_function(pillar_spreads)
+    root_hooks.add(RollPass.DiskElement.pillar_spreads)
+
+
+def variant(gap):
+    in_profile = Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+    sequence = PassSequence([
+        RollPass(
+            label="Oval",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    depth=5e-3,
+                    r1=0.2e-3,
+                    r2=16e-3,
+                ),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                neutral_point=-20e-3
+            ),
+            gap=gap,
+            disk_element_count=15,
+        ),
+    ])
+
+    return sequence, in_profile
+
+
+def main():
+    register_pillar_spreads()
+
+    start = time.perf_counter()
+    serial = [solve_variant(variant, i, gap) for i, gap in enumerate(GAPS)]
+    t_serial = time.perf_counter() - start
+
+    result_bytes = sum(len(pickle.dumps(r)) for r in serial) / len(serial)
+    print(f"{len(GAPS)} variants, {result_bytes / 1024:.1f} KiB of results per variant")
+
+    print(f"{'workers':>8} {'time [s]':>9} {'speedup':>9} {'efficiency':>11}")
+    print(f"{'serial':>8} {t_serial:>9.2f} {1:>9.2f} {1:>11.2f}")
+
+    for n in WORKER_COUNTS:
+        if n > max(os.cpu_count(), MIN_WORKER_COUNT):
+            continue
+
+        start = time.perf_counter()
+        results = run_variants(variant, GAPS, max_workers=n, initializer=register_pillar_spreads)
+        t_pool = time.perf_counter() - start
+
+        assert all(r.succeeded for r in results)
+        print(f"{n:>8} {t_pool:>9.2f} {t_serial / t_pool:>9.2f} {t_serial / t_pool / n:>11.2f}")
+
+    n = max(os.cpu_count(), MIN_WORKER_COUNT)
+    print(f"\nwarm start with {n} workers")
+    print(f"{'sweep':>8} {'time [s]':>9} {'iterations':>11} {'entries':>8}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "warm_start.json"
+        config = dict(SPREAD_CORRECTION_WARM_START=True, SPREAD_CORRECTION_WARM_START_FILE=path)
+
+        for sweep in ["cold", "warm"]:
+            start = time.perf_counter()
+            results = run_variants(variant, GAPS, max_workers=n, config=config, initializer=register_pillar_spreads)
+            t_pool = time.perf_counter() - start
+
+            assert all(r.succeeded for r in results)
+            iterations = sum(p.iteration_count for r in results for p in r.passes)
+            entries = sum(len(counts) for counts in WarmStartStore(path).entries.values())
+            print(f"{sweep:>8} {t_pool:>9.2f} {iterations:>11} {entries:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark suite of the scaling of the pillar model in the pillar count and the disk element count.
+
+Solves the scenarios shared with the tests in ``tests/scenarios.py`` over a grid of pillar counts and disk element
+counts for equidistant and uniform pillars, recording the solution time, the count of outer iterations
+and the peak traced memory of each grid cell into a JSON results file.
+
+As absolute times depend on the machine, the scaling is judged by the time per outer iteration of each cell
+relative to the one of the cheapest cell of the same scenario and pillar type.
+A cell is flagged if this relative cost exceeds the one stored in the baseline file by more than the tolerance.
+The fitted exponents of the time per iteration over pillar count and disk element count are printed for orientation.
+
+Run with ``python benchmarks/bench_scaling.py`` having the package installed,
+``--update-baseline`` stores the results as new baseline, ``--help`` lists the further options.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+import pyroll.pillar_model
+from pyroll.core import PassSequence
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "tests"))
+from scenarios import SCENARIOS, pillar_spreads
+
+PILLAR_COUNTS = [10, 30]
+DISK_ELEMENT_COUNTS = [5, 15]
+PILLAR_TYPES = ["EQUIDISTANT", "UNIFORM"]
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "scaling.json"
+RESULTS_FILE = Path("scaling_results.json")
+
+TOLERANCE = 0.25
+"""Allowed relative excess of a cell's relative cost over the baseline's one."""
+
+
+def measure(scenario, pillar_type, pillar_count, disk_element_count, trace_memory=True):
+    """Solve one grid cell and get its measurements."""
+    factory, exponent = SCENARIOS[scenario]
+    units, in_profile = factory(disk_element_count)
+    sequence = PassSequence(units, pillar_type=pillar_type, pillar_count=pillar_count)
+
+    with pillar_spreads(exponent):
+        try:
+            if trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            sequence.solve(in_profile)
+            duration = time.perf_counter() - start
+            peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        finally:
+            tracemalloc.stop()
+
+    return dict(
+        scenario=scenario,
+        pillar_type=pillar_type,
+        pillar_count=pillar_count,
+        disk_element_count=disk_element_count,
+        time=duration,
+        iterations=sum(len(rp.convergence_history) for rp in sequence.roll_passes),
+        peak_memory=peak_memory,
+    )
+
+
+def relative_costs(results):
+    """Get the time of each cell per outer iteration relative to the cheapest cell of its scenario and pillar type."""
+    cheapest = dict()
+    for r in results:
+        key = (r["scenario"], r["pillar_type"])
+        cost = r["time"] / r["iterations"]
+        cheapest[key] = min(cheapest.get(key, np.inf), cost)
+
+    return {
+        (r["scenario"], r["pillar_type"], r["pillar_count"], r["disk_element_count"]):
+            r["time"] / r["iterations"] / cheapest[(r["scenario"], r["pillar_type"])]
+        for r in results
+    }
+
+
+def scaling_exponents(results):
+    """Fit the exponents of the time per iteration over pillar count and disk element count by least squares."""
+    exponents = dict()
+    for scenario in sorted({r["scenario"] for r in results}):
+        for pillar_type in sorted({r["pillar_type"] for r in results}):
+            cells = [r for r in results if r["scenario"] == scenario and r["pillar_type"] == pillar_type]
+            if len(cells) < 3:
+                continue
+            a = np.array([[1, np.log(r["pillar_count"]), np.log(r["disk_element_count"])] for r in cells])
+            b = np.log([r["time"] / r["iterations"] for r in cells])
+            exponents[(scenario, pillar_type)] = np.linalg.lstsq(a, b, rcond=None)[0][1:]
+    return exponents
+
+
+def regressions(results, baseline, tolerance=TOLERANCE):
+    """Get the cells whose relative cost exceeds the baseline's one by more than the tolerance."""
+    current = relative_costs(results)
+    reference = relative_costs(baseline)
+
+    return [
+        (key, value, reference[key])
+        for key, value in current.items()
+        if key in reference and value > reference[key] * (1 + tolerance)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--pillar-types", nargs="+", choices=PILLAR_TYPES, default=PILLAR_TYPES)
+    parser.add_argument("--pillar-counts", nargs="+", type=int, default=PILLAR_COUNTS)
+    parser.add_argument("--disk-element-counts", nargs="+", type=int, default=DISK_ELEMENT_COUNTS)
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="do not trace the peak memory, which slows down the solution"
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'scenario':<22} {'pillars':<12} {'count':>6} {'disks':>6} {'time [s]':>9} {'iterations':>11} "
+        f"{'peak [MiB]':>11}"
+    )
+    results = []
+    for scenario in args.scenarios:
+        for pillar_type in args.pillar_types:
+            for pillar_count in args.pillar_counts:
+                for disk_element_count in args.disk_element_counts:
+                    r = measure(scenario, pillar_type, pillar_count, disk_element_count, not args.no_memory)
+                    results.append(r)
+                    peak = f"{r['peak_memory'] / 2 ** 20:>11.1f}" if r["peak_memory"] is not None else f"{'-':>11}"
+                    print(
+                        f"{scenario:<22} {pillar_type:<12} {pillar_count:>6} {disk_element_count:>6} "
+                        f"{r['time']:>9.2f} {r['iterations']:>11} {peak}"
+                    )
+
+    print()
+    print(f"{'scenario':<22} {'pillars':<12} {'pillar exp':>11} {'disk exp':>9}")
+    for (scenario, pillar_type), (pillar_exponent, disk_exponent) in scaling_exponents(results).items():
+        print(f"{scenario:<22} {pillar_type:<12} {pillar_exponent:>11.2f} {disk_exponent:>9.2f}")
+
+    document = dict(
+        python=sys.version.split()[0],
+        machine=platform.machine(),
+        pillar_model=pyroll.pillar_model.VERSION,
+        trace_memory=not args.no_memory,
+        results=results,
+    )
+    args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    print(f"\nResults written to {args.output}.")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline["trace_memory"] != document["trace_memory"]:
+        print("The baseline was recorded with different memory tracing, the relative costs may not be comparable.")
+
+    flagged = regressions(results, baseline["results"], args.tolerance)
+    for (scenario, pillar_type, pillar_count, disk_element_count), value, reference in flagged:
+        print(
+            f"SCALING REGRESSION {scenario} {pillar_type} {pillar_count} pillars {disk_element_count} disks: "
+            f"relative cost {value:.2f} against {reference:.2f} in the baseline"
+        )
+
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Benchmark of the stacking of disk element values for the roll pass totals against the solution iteration.
+
+Solves the round-oval scenario for a few iterations at grid sizes up to 10^4 disk element pillars and times
+the stacking and reduction of all stacked disk element values of a roll pass against the time of one iteration.
+The share of the stacking bounds the gain of any backing store of the disk element values.
+
+Run with ``python benchmarks/bench_stacked.py`` having the package installed.
+"""
+
+import sys
+import time
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+import pyroll.pillar_model
+from pyroll.pillar_model.roll_pass.stacking import stacked
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "tests"))
+from scenarios import round_oval, pillar_spreads
+
+GRID = [(15, 30), (30, 100), (100, 100)]
+"""Pairs of disk element counts and pillar counts."""
+
+ITERATION_COUNT = 3
+
+STACKED_HOOKS = [
+    "pillars_in_contact",
+    "pillar_draughts",
+    "pillar_spreads",
+    "pillar_elongations",
+    "pillar_log_draughts",
+    "pillar_log_spreads",
+    "pillar_log_elongations",
+    "pillar_strains",
+    "pillar_strain_rates",
+    "pillar_velocities",
+]
+
+
+def main():
+    print(f"{'disks':>6} {'pillars':>8} {'iteration [ms]':>15} {'stacking [ms]':>14} {'share':>8}")
+    for disk_element_count, pillar_count in GRID:
+        pyroll.pillar_model.Config.PILLAR_COUNT = pillar_count
+        (rp,), in_profile = round_oval(disk_element_count)
+        rp.max_iteration_count = ITERATION_COUNT
+        rp.iteration_precision = 0
+
+        with pillar_spreads(-0.3):
+            start = time.perf_counter()
+            rp.solve(in_profile)
+            iteration = (time.perf_counter() - start) / len(rp.convergence_history)
+
+        def stack_all():
+            for name in STACKED_HOOKS:
+                np.sum(stacked(rp, name), axis=0)
+
+        number = 20
+        stacking = min(timeit.repeat(stack_all, number=number, repeat=3)) / number
+        print(
+            f"{disk_element_count:>6} {pillar_count:>8} {iteration * 1e3:>15.1f} {stacking * 1e3:>14.3f} "
+            f"{stacking / iteration:>8.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
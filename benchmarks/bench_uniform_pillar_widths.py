@@ -0,0 +1,64 @@
+"""
+Benchmark of the equal-area pillar distribution against the former ``fsolve`` approach
+with one shapely intersection per pillar in each residual evaluation.
+
+Run with ``python benchmarks/bench_uniform_pillar_widths.py`` having the package installed.
+"""
+
+import timeit
+
+import numpy as np
+import shapely
+from scipy.optimize import fsolve
+
+from pyroll.core import Profile
+from pyroll.pillar_model.geometry import ChordHeightTable, uniform_pillar_widths
+
+PILLAR_COUNTS = [30, 100, 200]
+
+
+def fsolve_pillar_widths(cross_section, width, pillar_count):
+    def p_centers(p_widths):
+        centers = np.zeros_like(p_widths)
+        centers[1:] = np.cumsum((p_widths[:-1] + p_widths[1:]) / 2)
+        return centers
+
+    def p_heights(p_widths):
+        return np.array(
+            [
+                shapely.intersection(
+                    cross_section,
+                    shapely.LineString([(p, cross_section.bounds[1]), (p, cross_section.bounds[3])])
+                ).length
+                for p in p_centers(p_widths)
+            ]
+        )
+
+    def fun(p_widths):
+        areas = p_widths * p_heights(p_widths)
+        return np.append(areas[1:] - areas[:-1], np.sum(p_widths) - width / 2 - p_widths[0] / 2)
+
+    return fsolve(fun, x0=np.full(pillar_count, width / 2 / (pillar_count - 0.5)))
+
+
+def main():
+    p = Profile.round(diameter=19.5e-3)
+    cs = p.cross_section
+
+    print(f"{'pillars':>8} {'fsolve [ms]':>12} {'equal-area [ms]':>16} {'speedup':>9} {'max. rel. dev.':>15}")
+    for n in PILLAR_COUNTS:
+        fsolve_time = min(timeit.repeat(lambda: fsolve_pillar_widths(cs, p.width, n), number=1, repeat=3))
+        fast_time = min(
+            timeit.repeat(lambda: uniform_pillar_widths(ChordHeightTable(cs), p.width, n), number=1, repeat=3)
+        )
+        deviation = np.max(np.abs(
+            uniform_pillar_widths(ChordHeightTable(cs), p.width, n) / fsolve_pillar_widths(cs, p.width, n) - 1
+        ))
+        print(
+            f"{n:>8} {fsolve_time * 1e3:>12.1f} {fast_time * 1e3:>16.2f} {fsolve_time / fast_time:>9.0f}"
+            f" {deviation:>15.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
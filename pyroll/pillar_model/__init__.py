@@ -1,19 +1,18 @@
 import importlib.util
 
+from .config import Config
+from . import geometry
+from . import unit
 from . import profile
 from . import roll_pass
-from pyroll.core import config as _config
+from . import resolution
+from . import runner
+from . import ensemble
+from . import profiling
+from . import golden
 
 VERSION = "3.0.3"
 
-
-@_config("PYROLL_PILLAR_MODEL")
-class Config:
-    PILLAR_COUNT = 30
-    PILLAR_TYPE = "EQUIDISTANT"
-    ELONGATION_CORRECTION = True
-    CORNER_CORRECTION = True
-
 REPORT_INSTALLED = bool(importlib.util.find_spec("pyroll.report"))
 
 
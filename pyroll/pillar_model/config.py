@@ -0,0 +1,20 @@
+from pyroll.core import config as _config
+
+
+@_config("PYROLL_PILLAR_MODEL")
+class Config:
+    PILLAR_COUNT = 30
+    PILLAR_TYPE = "EQUIDISTANT"
+    ELONGATION_CORRECTION = True
+    CORNER_CORRECTION = True
+    LAZY_PILLAR_SECTIONS = False
+    FAST_PILLAR_PASS = False
+    ROLL_SURFACE_TABLE = True
+    SPREAD_CORRECTION_ACCELERATOR = "RELAXATION"
+    SPREAD_CORRECTION_HISTORY = 5
+    SPREAD_CORRECTION_RELAXATION_FACTOR = 0.05
+    SPREAD_CORRECTION_ADAPTIVE_RELAXATION = False
+    SPREAD_CORRECTION_TOLERANCE = None
+    SPREAD_CORRECTION_WARM_START = False
+    SPREAD_CORRECTION_WARM_START_FILE = None
+    SPREAD_CORRECTION_WARM_START_RESOLUTION = 0.02
@@ -0,0 +1,187 @@
+import copy
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from pyroll.core import RollPass, Profile
+from .roll_pass.stacking import stacked
+from .roll_pass.sweep import contour_surface_depths, contour_entry_points, pillar_height_sweep
+
+
+@dataclass
+class EnsembleResult:
+    """
+    Results of an ensemble of in profiles passing one roll pass.
+    The arrays carry a leading axis over the ensemble members.
+    """
+
+    reference: RollPass
+    """The roll pass solved with the reference member."""
+
+    reference_index: int
+    """Index of the reference member."""
+
+    pillars: np.ndarray
+    """Pillar positions of the members' in profiles of shape ``(member_count, pillar_count)``."""
+
+    disk_pillar_heights: np.ndarray
+    """
+    Pillar heights at the disk elements' in and out profiles
+    of shape ``(member_count, disk_element_count + 1, pillar_count)``.
+    """
+
+    disk_pillars_in_contact: np.ndarray
+    """Pillar contact flags of the disk elements of shape ``(member_count, disk_element_count, pillar_count)``."""
+
+    total_pillar_elongations: np.ndarray
+    """Total elongations of the pillars of shape ``(member_count, pillar_count)``."""
+
+    total_pillar_strains: np.ndarray
+    """Total strains of the pillars of shape ``(member_count, pillar_count)``."""
+
+    contact_areas: np.ndarray
+    """Contact areas of the roll pass (both rolls) of shape ``(member_count,)``."""
+
+    roll_forces: np.ndarray
+    """Roll forces of shape ``(member_count,)``."""
+
+
+def _reference_index(in_profiles: Sequence[Profile]) -> int:
+    areas = np.array([p.cross_section.area for p in in_profiles])
+    return int(np.argmin(np.abs(areas - np.mean(areas))))
+
+
+def spread_sensitivity(log_draughts: np.ndarray, log_spreads: np.ndarray) -> float:
+    """
+    Get the least squares slope of the log spreads over the log draughts of a roll pass.
+    Both are centered per pillar over the disk elements,
+    so that constant factors per pillar like the spread correction coefficients do not contribute.
+
+    :param log_draughts: array of the log draughts of shape ``(disk_element_count, pillar_count)``
+    :param log_spreads: array of the log spreads of shape ``(disk_element_count, pillar_count)``
+    :return: the slope, 0 if no pillar is drafted
+    """
+    d = log_draughts - np.mean(log_draughts, axis=0)
+    s = log_spreads - np.mean(log_spreads, axis=0)
+    variance = np.sum(d ** 2)
+    return float(np.sum(d * s) / variance) if variance > 0 else 0.
+
+
+def solve_ensemble(
+        roll_pass: RollPass, in_profiles: Sequence[Profile], reference_index: Optional[int] = None
+) -> EnsembleResult:
+    """
+    Solve a roll pass for an ensemble of slightly differing in profiles at once.
+
+    Only a copy of the roll pass with the reference member is solved by the usual iteration.
+    For all members the pillar geometry, the contact, the draughts, the elongations and the strains are
+    evaluated on arrays with a leading ensemble axis, computing the roll surface exactly from the roll contour.
+    The spread model is not evaluated for the members: their log spreads are the reference's ones corrected by the
+    deviation of the log draughts from the reference's ones times the reference's spread sensitivity,
+    see :py:func:`spread_sensitivity`.
+    The members' mean flow stresses within the disk elements are the reference's ones scaled by the ratio of the
+    members' ones at the entry to the reference's one, the roll forces sum them times the disk elements'
+    contact areas like the roll pass' ``roll_force``.
+    The results are thus a linearization around the reference, which is exact for the reference member itself
+    up to the positions of the pillars within the disk elements.
+
+    :param roll_pass: the unsolved roll pass, it is not modified
+    :param in_profiles: the in profiles of the members, of the same pillar configuration
+    :param reference_index: index of the member to solve as reference,
+        if ``None`` the one whose cross-section area is nearest to the ensemble's mean
+    :raises ValueError: if the roll pass was solved before
+    """
+    if roll_pass.out_profile is not None:
+        raise ValueError("The roll pass must not be solved before, as its pillar arrays would be reused.")
+
+    if reference_index is None:
+        reference_index = _reference_index(in_profiles)
+
+    reference = copy.deepcopy(roll_pass)
+    reference.solve(in_profiles[reference_index])
+
+    # members' in profiles after the pre-processors (rotation) of the roll pass
+    scratch = copy.deepcopy(roll_pass)
+    pillars, widths, heights, flow_stresses = [], [], [], []
+    for p in in_profiles:
+        scratch.init_solve(p)
+        pillars.append(scratch.in_profile.pillars)
+        widths.append(scratch.in_profile.pillar_widths)
+        heights.append(scratch.in_profile.pillar_heights)
+        flow_stresses.append(scratch.in_profile.flow_stress)
+
+    pillars, widths, heights = np.array(pillars), np.array(widths), np.array(heights)
+    flow_stresses = np.array(flow_stresses)
+
+    roll = reference.roll
+    gap = reference.gap
+    disk_count = len(reference.disk_elements)
+
+    # contact lengths from the entry point of the core pillar
+    contact_lengths = -contour_entry_points(roll, pillars[:, 0], heights[:, 0], gap)
+    lengths = contact_lengths / disk_count
+    out_x = -contact_lengths[:, np.newaxis] + lengths[:, np.newaxis] * np.arange(1, disk_count + 1)
+
+    # pillar positions within the disk elements relative to the half width as in the reference
+    reference_positions = (
+            np.array([de.out_profile.pillars for de in reference.disk_elements])
+            / reference.in_profile.pillar_boundaries[-1]
+    )
+    half_widths = widths.sum(axis=-1) - widths[:, 0] / 2
+    z = reference_positions * half_widths[:, np.newaxis, np.newaxis]
+
+    depths = contour_surface_depths(roll, out_x[..., np.newaxis], z)
+    disk_heights = pillar_height_sweep(heights, depths, gap)
+    contacts = disk_heights[:, :-1] > 2 * depths + gap
+
+    log_draughts = np.log(disk_heights[:, 1:] / disk_heights[:, :-1])
+    reference_log_draughts = np.log(stacked(reference, "pillar_draughts"))
+    reference_log_spreads = np.log(stacked(reference, "pillar_spreads"))
+    sensitivity = spread_sensitivity(reference_log_draughts, reference_log_spreads)
+    log_spreads = reference_log_spreads + sensitivity * (log_draughts - reference_log_draughts)
+    log_elongations = -log_draughts - log_spreads
+
+    strains = np.sqrt(2 / 3 * (log_elongations ** 2 + log_spreads ** 2 + log_draughts ** 2))
+
+    if reference.corner_correction:
+        local_radii = roll.max_radius - np.interp(pillars, *roll.contour_points.T)
+        entry_angles = np.arcsin(contour_entry_points(roll, pillars, heights, gap) / local_radii)
+        corner_strains = np.tan(entry_angles) ** 2 / (2 * np.sqrt(3))
+
+        previous_contacts = np.concatenate([np.zeros_like(contacts[:, :1]), contacts[:, :-1]], axis=1)
+        entering = contacts & ~previous_contacts
+        strains += np.where(entering, corner_strains[:, np.newaxis], 0)
+
+    # widths at the disk elements' in and out profiles
+    out_widths = widths[:, np.newaxis] * np.exp(np.cumsum(log_spreads, axis=1))
+    in_widths = np.concatenate([widths[:, np.newaxis], out_widths[:, :-1]], axis=1)
+
+    # contact areas of the disk elements of both rolls, the core pillar is not mirrored to the other profile half
+    mirrored = np.full(pillars.shape[-1], 2)
+    mirrored[0] = 1
+    disk_contact_areas = 2 * np.sum(
+        np.where(contacts, lengths[:, np.newaxis, np.newaxis], 0) * (in_widths + out_widths) / 2 * mirrored, axis=-1
+    )
+    contact_areas = np.sum(disk_contact_areas, axis=-1)
+
+    # mean flow stresses of the disk elements as of the reference, scaled by the members' ones at the entry
+    reference_flow_stresses = np.array([
+        (de.in_profile.flow_stress + de.out_profile.flow_stress) / 2 for de in reference.disk_elements
+    ])
+    disk_flow_stresses = (
+            flow_stresses[:, np.newaxis] / reference.in_profile.flow_stress * reference_flow_stresses
+    )
+    roll_forces = np.sum(disk_flow_stresses * disk_contact_areas, axis=-1) / 2  # /2 since two rolls
+
+    return EnsembleResult(
+        reference=reference,
+        reference_index=reference_index,
+        pillars=pillars,
+        disk_pillar_heights=disk_heights,
+        disk_pillars_in_contact=contacts,
+        total_pillar_elongations=np.exp(np.sum(log_elongations, axis=1)),
+        total_pillar_strains=np.sum(strains, axis=1),
+        contact_areas=contact_areas,
+        roll_forces=roll_forces,
+    )
@@ -0,0 +1,503 @@
+import math
+import weakref
+import numpy as np
+import shapely
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from shapely.geometry.polygon import orient
+
+TABLE_CACHE_SIZE = 256
+"""Maximum count of chord height tables held in the cache of :py:func:`chord_height_table`."""
+
+ADAPTIVE_SAMPLES_PER_PILLAR = 16
+"""Count of samples per pillar the refinement density of adaptive pillar widths is evaluated on."""
+
+ADAPTIVE_MIN_RELATIVE_DENSITY = 0.8
+"""Lower bound of the refinement density of adaptive pillar widths relative to its mean."""
+
+
+def cross_section_edges(cross_section: shapely.Polygon) -> np.ndarray:
+    """
+    Get the edges of all rings of a (multi) polygon as array of shape ``(n, 4)`` holding ``(z1, y1, z2, y2)``.
+    Exteriors are oriented counter-clockwise and interiors clockwise.
+    """
+    rings = []
+    for part in shapely.get_parts(cross_section):
+        part = orient(part, 1.0)
+        rings.append(np.asarray(part.exterior.coords)[:, :2])
+        rings.extend(np.asarray(i.coords)[:, :2] for i in part.interiors)
+
+    return np.concatenate([np.hstack([r[:-1], r[1:]]) for r in rings])
+
+
+def _crossings(edges: np.ndarray, z: np.ndarray, from_left: bool) -> np.ndarray:
+    z1, _, z2, _ = edges.T
+    z = z[:, np.newaxis]
+
+    if from_left:
+        return ((z1 < z) & (z <= z2)) | ((z2 < z) & (z <= z1))
+    return ((z1 <= z) & (z < z2)) | ((z2 <= z) & (z < z1))
+
+
+def _signed_crossings(edges: np.ndarray, z: np.ndarray, from_left: bool) -> np.ndarray:
+    z1, y1, z2, y2 = edges.T
+    crosses = _crossings(edges, z, from_left)
+    z = z[:, np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # with counter-clockwise exteriors, edges running in negative z direction bound the section from above
+        y = np.sign(z1 - z2) * (y1 + (z - z1) * (y2 - y1) / (z2 - z1))
+
+    return np.where(crosses, y, 0).sum(axis=1)
+
+
+class ChordHeightTable:
+    """
+    Exact piecewise-linear representation of the chord heights of a polygonal cross-section over z.
+    Knots are the distinct z-coordinates of the section's vertices, at each knot the limits from left and right
+    are stored to represent vertical edges, on which the larger of both is taken.
+    The limits are found for all knots at once by summing the signed crossings of the vertical chords with the
+    section's edges, so non-convex sections and sections with holes, where a chord enters the section several times,
+    are covered.
+    """
+
+    def __init__(self, cross_section: shapely.Polygon):
+        edges = cross_section_edges(cross_section)
+
+        self.knots = np.unique(edges[:, [0, 2]])
+        """Distinct z-coordinates of the vertices."""
+
+        self.left_heights = _signed_crossings(edges, self.knots, from_left=True)
+        """Chord heights at the knots approached from left."""
+
+        self.right_heights = _signed_crossings(edges, self.knots, from_left=False)
+        """Chord heights at the knots approached from right."""
+
+        self.slopes = (self.left_heights[1:] - self.right_heights[:-1]) / np.diff(self.knots)
+        """Derivatives of the chord heights within the intervals between the knots."""
+
+        self.areas = np.zeros_like(self.knots)
+        """Cumulative area of the section from its left end up to the knots."""
+        self.areas[1:] = np.cumsum((self.left_heights[1:] + self.right_heights[:-1]) / 2 * np.diff(self.knots))
+
+        midpoints = (self.knots[1:] + self.knots[:-1]) / 2
+        self.vertically_convex = bool(
+            isinstance(cross_section, shapely.Polygon) and not cross_section.interiors
+            and np.all(_crossings(edges, midpoints, from_left=False).sum(axis=1) <= 2)
+        )
+        """Whether every vertical chord intersects the section in one segment at most."""
+
+        upper = edges[edges[:, 0] > edges[:, 2]]
+        lower = edges[edges[:, 0] < edges[:, 2]]
+
+        self.upper_contour = (
+            _signed_crossings(upper, self.knots, from_left=True),
+            _signed_crossings(upper, self.knots, from_left=False),
+        )
+        """Limits from left and right of the upper contour at the knots (only meaningful if vertically convex)."""
+
+        self.lower_contour = (
+            -_signed_crossings(lower, self.knots, from_left=True),
+            -_signed_crossings(lower, self.knots, from_left=False),
+        )
+        """Limits from left and right of the lower contour at the knots (only meaningful if vertically convex)."""
+
+    def _intervals(self, z: np.ndarray):
+        i = np.clip(np.searchsorted(self.knots, z, side="right") - 1, 0, len(self.knots) - 2)
+        return i, z - self.knots[i]
+
+    def __call__(self, z: np.ndarray) -> np.ndarray:
+        """Get the chord heights at the given z-coordinates."""
+        z = np.asarray(z, dtype=float)
+        i, dz = self._intervals(z)
+        heights = self.right_heights[i] + self.slopes[i] * dz
+
+        on_knot = np.isin(z, self.knots)
+        if np.any(on_knot):
+            k = np.searchsorted(self.knots, z[on_knot])
+            heights[on_knot] = np.maximum(self.left_heights[k], self.right_heights[k])
+
+        return np.where((z < self.knots[0]) | (z > self.knots[-1]), 0, heights)
+
+    def derivatives(self, z: np.ndarray) -> np.ndarray:
+        """Get the derivatives of the chord heights at the given z-coordinates (right-sided on knots)."""
+        z = np.asarray(z, dtype=float)
+        i, _ = self._intervals(z)
+        return np.where((z < self.knots[0]) | (z >= self.knots[-1]), 0, self.slopes[i])
+
+    def area(self, z: np.ndarray) -> np.ndarray:
+        """Get the area of the section left of the given z-coordinates."""
+        z = np.clip(np.asarray(z, dtype=float), self.knots[0], self.knots[-1])
+        i, dz = self._intervals(z)
+        return self.areas[i] + self.right_heights[i] * dz + self.slopes[i] / 2 * dz ** 2
+
+    def inverse_area(self, area: np.ndarray) -> np.ndarray:
+        """Get the z-coordinates left of which the section has the given areas."""
+        area = np.clip(np.asarray(area, dtype=float), 0, self.areas[-1])
+        i = np.clip(np.searchsorted(self.areas, area, side="right") - 1, 0, len(self.knots) - 2)
+        rest = area - self.areas[i]
+        h = self.right_heights[i]
+
+        # root of slope / 2 * dz ** 2 + h * dz - rest = 0 in the cancellation-free form
+        denominator = h + np.sqrt(np.maximum(h ** 2 + 2 * self.slopes[i] * rest, 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dz = np.where(denominator > 0, 2 * rest / denominator, 0)
+
+        return self.knots[i] + dz
+
+
+_tables_by_wkb: "OrderedDict[bytes, ChordHeightTable]" = OrderedDict()
+_tables_by_id: dict = dict()
+
+
+def chord_height_table(cross_section: shapely.Polygon) -> ChordHeightTable:
+    """
+    Get the chord height table of a cross-section from cache or create it.
+
+    Tables are looked up by identity of the cross-section first and by its WKB representation second,
+    so equal copies of a section (e.g. in the profiles of rotators and transports) share one table.
+    The WKB cache is limited to :py:data:`TABLE_CACHE_SIZE` entries, dropping the least recently used.
+    """
+    key = id(cross_section)
+    entry = _tables_by_id.get(key)
+    if entry is not None and entry[0]() is cross_section:
+        return entry[1]
+
+    wkb = shapely.to_wkb(cross_section)
+    table = _tables_by_wkb.get(wkb)
+
+    if table is None:
+        table = ChordHeightTable(cross_section)
+        _tables_by_wkb[wkb] = table
+        if len(_tables_by_wkb) > TABLE_CACHE_SIZE:
+            _tables_by_wkb.popitem(last=False)
+    else:
+        _tables_by_wkb.move_to_end(wkb)
+
+    _tables_by_id[key] = (weakref.ref(cross_section, lambda _, k=key: _tables_by_id.pop(k, None)), table)
+    return table
+
+
+def clear_chord_height_tables():
+    """Clear the cache of :py:func:`chord_height_table`."""
+    _tables_by_wkb.clear()
+    _tables_by_id.clear()
+
+
+def uniform_pillar_widths(
+        table: ChordHeightTable, width: float, pillar_count: int, polish: bool = True,
+        max_iteration_count: int = 20, precision: float = 1e-12
+) -> np.ndarray:
+    """
+    Get pillar widths distributing the area of a symmetric cross-section uniformly over the pillars.
+
+    The pillar boundaries are placed directly by inverting the cumulative area of the section, where the center
+    pillar counts half.
+    Optionally, the widths are polished by Newton's method, so that the pillar areas estimated as
+    ``pillar_widths * pillar_heights`` are equal, which is the definition used by the former ``fsolve`` approach.
+
+    :param table: the chord height table of the cross-section
+    :param width: the width of the cross-section
+    :param pillar_count: the count of pillars on the half profile
+    :param polish: whether to apply Newton's method on the distribution from the exact areas
+    :param max_iteration_count: maximum count of Newton iterations
+    :param precision: relative precision of pillar areas to break the Newton iteration
+    :return: array of pillar widths
+    """
+    half_area = table.area(width / 2) - table.area(0)
+    pillar_area = half_area / (pillar_count - 0.5)
+    boundaries = table.inverse_area(table.area(0) + (np.arange(1, pillar_count + 1) - 0.5) * pillar_area)
+    boundaries[-1] = width / 2
+
+    widths = np.empty(pillar_count)
+    widths[0] = 2 * boundaries[0]
+    widths[1:] = np.diff(boundaries)
+
+    if not polish:
+        return widths
+
+    # derivatives of the pillar centers with respect to the pillar widths
+    center_derivatives = np.tril(np.ones((pillar_count, pillar_count)), -1)
+    center_derivatives[:, 0] = 0.5
+    center_derivatives[np.diag_indices(pillar_count)] = 0.5
+    center_derivatives[0] = 0
+
+    for _ in range(max_iteration_count):
+        centers = np.zeros(pillar_count)
+        centers[1:] = np.cumsum((widths[:-1] + widths[1:]) / 2)
+        heights = table(centers)
+        areas = widths * heights
+
+        residuals = np.append(np.diff(areas), np.sum(widths) - width / 2 - widths[0] / 2)
+
+        if np.all(np.abs(residuals) <= precision * pillar_area):
+            break
+
+        area_derivatives = np.diag(heights) + (widths * table.derivatives(centers))[:, np.newaxis] * center_derivatives
+        jacobian = np.empty((pillar_count, pillar_count))
+        jacobian[:-1] = np.diff(area_derivatives, axis=0)
+        jacobian[-1] = 1
+        jacobian[-1, 0] = 0.5
+
+        widths = widths - np.linalg.solve(jacobian, residuals)
+
+    return widths
+
+
+def adaptive_sampling(width: float, pillar_count: int) -> np.ndarray:
+    """Get the z-coordinates over the half width the refinement density of adaptive pillar widths is sampled on."""
+    return np.linspace(0, width / 2, ADAPTIVE_SAMPLES_PER_PILLAR * pillar_count + 1)
+
+
+def adaptive_pillar_widths(
+        z: np.ndarray, density: np.ndarray, width: float, pillar_count: int,
+        min_relative_density: float = ADAPTIVE_MIN_RELATIVE_DENSITY
+) -> np.ndarray:
+    """
+    Get pillar widths equidistributing a refinement density over the half width of a symmetric cross-section.
+
+    The pillar boundaries are placed by inverting the cumulative integral of the density, where the center
+    pillar counts half, so pillars get narrower where the density is high and wider where it is low,
+    keeping the total pillar count.
+
+    :param z: ascending z-coordinates from 0 to ``width / 2`` the density is sampled on
+    :param density: positive refinement density at ``z``
+    :param width: the width of the cross-section
+    :param pillar_count: the count of pillars on the half profile
+    :param min_relative_density: lower bound of the density relative to its mean, limits the coarsening
+    :return: array of pillar widths
+    """
+    density = np.maximum(density, min_relative_density * np.mean(density))
+    integral = np.zeros_like(z)
+    integral[1:] = np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(z))
+    pillar_integral = integral[-1] / (pillar_count - 0.5)
+    boundaries = np.interp((np.arange(1, pillar_count + 1) - 0.5) * pillar_integral, integral, z)
+    boundaries[-1] = width / 2
+
+    widths = np.empty(pillar_count)
+    widths[0] = 2 * boundaries[0]
+    widths[1:] = np.diff(boundaries)
+    return widths
+
+
+def aligned_pillar_widths(widths: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Move the pillar boundaries of a symmetric cross-section onto given points on the half width.
+
+    The points are taken in ascending order, each moves the nearest boundary onto itself if it was not moved before,
+    so clustered points move successive boundaries. The boundary at the edge of the cross-section is kept.
+
+    :param widths: array of pillar widths
+    :param points: z-coordinates on the half width
+    :return: array of pillar widths
+    """
+    boundaries = np.cumsum(widths) - widths[0] / 2
+    moved = np.zeros(len(boundaries) - 1, dtype=bool)
+
+    for point in np.unique(points):
+        if not 0 < point < boundaries[-1]:
+            continue
+
+        i = np.argmin(np.abs(boundaries[:-1] - point))
+        if not moved[i]:
+            boundaries[i] = point
+            moved[i] = True
+
+    widths = np.empty_like(boundaries)
+    widths[0] = 2 * boundaries[0]
+    widths[1:] = np.diff(boundaries)
+    return widths
+
+
+def height_refinement_density(z: np.ndarray, heights: np.ndarray) -> np.ndarray:
+    """
+    Get the arc length density ``sqrt(1 + (dh / dz / 2) ** 2)`` of the surface contour of a section with given heights
+    sampled at the given z-coordinates,
+    which is large where the latitudinal height derivatives are large (e.g. at flanks) and one where the contour is flat.
+    """
+    return np.hypot(1, np.gradient(heights / 2, z))
+
+
+def _clip_pillar_sections(cross_section: shapely.Polygon, boundaries: np.ndarray) -> np.ndarray:
+    a = np.zeros(len(boundaries) - 1, dtype=object)
+
+    for i in range(0, len(a)):
+        a[i] = shapely.clip_by_rect(cross_section, boundaries[i], -math.inf, boundaries[i + 1], math.inf)
+
+    return a
+
+
+def _one_sided_values(
+        knots: np.ndarray, left: np.ndarray, right: np.ndarray, z: np.ndarray, from_left: bool
+) -> np.ndarray:
+    """Evaluate a piecewise-linear function given by its one-sided limits at the knots within the knots' range."""
+    i = np.clip(np.searchsorted(knots, z, side="right") - 1, 0, len(knots) - 2)
+    values = right[i] + (left[i + 1] - right[i]) / (knots[i + 1] - knots[i]) * (z - knots[i])
+
+    k = np.minimum(np.searchsorted(knots, z), len(knots) - 1)
+    on_knot = knots[k] == z
+    values[on_knot] = (left if from_left else right)[k[on_knot]]
+
+    return values
+
+
+def pillar_sections(cross_section: shapely.Polygon, boundaries: np.ndarray) -> np.ndarray:
+    """
+    Get the sections of the pillars as array of polygons.
+
+    For vertically convex sections (each vertical chord is one segment), the sections are constructed at once
+    from the upper and lower contour of the section between the boundaries by one array call to shapely.
+    Otherwise, the section is clipped to each pillar strip.
+
+    :param cross_section: the (multi) polygon to divide
+    :param boundaries: the z-coordinates of the pillar boundaries
+    :return: object array of polygons, one less than boundaries
+    """
+    boundaries = np.asarray(boundaries, dtype=float)
+    table = chord_height_table(cross_section)
+
+    if not table.vertically_convex:
+        return _clip_pillar_sections(cross_section, boundaries)
+
+    knots = table.knots
+    upper_left, upper_right = table.upper_contour
+    lower_left, lower_right = table.lower_contour
+
+    clipped = np.clip(boundaries, knots[0], knots[-1])
+    starts, ends = clipped[:-1], clipped[1:]
+    first = np.searchsorted(knots, starts, side="right")
+    inner_counts = np.maximum(np.searchsorted(knots, ends, side="left") - first, 0)
+
+    strips = np.arange(len(starts))
+    inner_strips = np.repeat(strips, inner_counts)
+    inner_local = np.arange(len(inner_strips)) - np.repeat(np.cumsum(inner_counts) - inner_counts, inner_counts)
+    inner = first[inner_strips] + inner_local
+    inner_knots = knots[inner]
+    inner_counts_per_point = inner_counts[inner_strips]
+
+    upper_starts = _one_sided_values(knots, upper_left, upper_right, starts, from_left=False)
+    lower_starts = _one_sided_values(knots, lower_left, lower_right, starts, from_left=False)
+    upper_ends = _one_sided_values(knots, upper_left, upper_right, ends, from_left=True)
+    lower_ends = _one_sided_values(knots, lower_left, lower_right, ends, from_left=True)
+    upper_inner_left, lower_inner_left = upper_left[inner], lower_left[inner]
+    upper_inner_right, lower_inner_right = upper_right[inner], lower_right[inner]
+
+    # ring of each strip: lower contour from start to end, upper contour from end to start, ordered by keys
+    ring_strips = np.concatenate(
+        [strips, inner_strips, inner_strips, strips, strips, inner_strips, inner_strips, strips]
+    )
+    keys = np.concatenate([
+        np.zeros_like(strips),
+        1 + 2 * inner_local,
+        2 + 2 * inner_local,
+        1 + 2 * inner_counts,
+        2 + 2 * inner_counts,
+        3 + 2 * inner_counts_per_point + 2 * (inner_counts_per_point - 1 - inner_local),
+        4 + 2 * inner_counts_per_point + 2 * (inner_counts_per_point - 1 - inner_local),
+        3 + 4 * inner_counts,
+    ])
+    z = np.concatenate([starts, inner_knots, inner_knots, ends, ends, inner_knots, inner_knots, starts])
+    y = np.concatenate([
+        lower_starts, lower_inner_left, lower_inner_right, lower_ends,
+        upper_ends, upper_inner_right, upper_inner_left, upper_starts,
+    ])
+
+    order = np.lexsort([keys, ring_strips])
+    rings = shapely.linearrings(np.column_stack([z[order], y[order]]), indices=ring_strips[order])
+    sections = shapely.polygons(shapely.remove_repeated_points(rings))
+    sections[starts >= ends] = shapely.Polygon()  # strips outside the section
+    return sections
+
+
+class LazyPillarSections(Sequence):
+    """
+    Sequence of pillar sections, that clips the section of a pillar only when it is accessed.
+    Clipped sections are kept for repeated access.
+
+    It is not converted to an array implicitly, as that would clip all sections,
+    get them explicitly by slicing instead.
+    """
+
+    def __init__(self, cross_section: shapely.Polygon, boundaries: np.ndarray):
+        self.cross_section = cross_section
+        """The divided cross-section."""
+
+        self.boundaries = np.asarray(boundaries, dtype=float)
+        """The z-coordinates of the pillar boundaries."""
+
+        self._sections = dict()
+
+    def __len__(self):
+        return len(self.boundaries) - 1
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("Lazy pillar sections are not converted to an array, get them by slicing.")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Pillar index out of range.")
+
+        section = self._sections.get(index, None)
+        if section is None:
+            section = shapely.clip_by_rect(
+                self.cross_section, self.boundaries[index], -math.inf, self.boundaries[index + 1], math.inf
+            )
+            self._sections[index] = section
+
+        return section
+
+
+def pillar_cross_section_vertices(pillars: np.ndarray, heights: np.ndarray, outer: float) -> np.ndarray:
+    """
+    Get the vertices of the cross-section of a pillar profile, symmetric to both axes,
+    spanned by the pillar centers and heights, as open ring of shape ``(4 * len(pillars) + 2, 2)``.
+
+    :param pillars: the z-coordinates of the pillar centers from core to side
+    :param heights: the heights of the pillars
+    :param outer: the z-coordinate of the outer pillar boundary
+    """
+    upper_right = np.vstack([np.column_stack([pillars, np.asarray(heights) / 2]), [(outer, 0)]])
+    lower_right = upper_right[-2::-1] * (1, -1)
+    lower_left = upper_right[1:] * -1
+    upper_left = lower_right[:-1] * -1
+    return np.vstack([upper_right, lower_right, lower_left, upper_left])
+
+
+def ring_area(vertices: np.ndarray) -> float:
+    """Get the area enclosed by a ring of vertices by the shoelace formula."""
+    z, y = vertices[:, 0], vertices[:, 1]
+    return abs(float(np.dot(z, np.roll(y, -1)) - np.dot(y, np.roll(z, -1)))) / 2
+
+
+def ring_perimeter(vertices: np.ndarray) -> float:
+    """Get the perimeter of a ring of vertices."""
+    edges = np.roll(vertices, -1, axis=0) - vertices
+    return float(np.sum(np.hypot(edges[:, 0], edges[:, 1])))
+
+
+def pillar_cross_section(pillars: np.ndarray, heights: np.ndarray, outer: float) -> shapely.Polygon:
+    """
+    Get the cross-section of a pillar profile, symmetric to both axes, spanned by the pillar centers and heights.
+
+    :param pillars: the z-coordinates of the pillar centers from core to side
+    :param heights: the heights of the pillars
+    :param outer: the z-coordinate of the outer pillar boundary
+    """
+    return shapely.Polygon(pillar_cross_section_vertices(pillars, heights, outer))
+
+
+def pillar_cross_section_measures(
+        pillars: np.ndarray, heights: np.ndarray, outer: float
+) -> tuple[shapely.Polygon, float, float]:
+    """
+    Get the cross-section of a pillar profile as :py:func:`pillar_cross_section`
+    together with its area and perimeter computed from the same vertices.
+    """
+    vertices = pillar_cross_section_vertices(pillars, heights, outer)
+    return shapely.Polygon(vertices), ring_area(vertices), ring_perimeter(vertices)
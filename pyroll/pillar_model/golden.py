@@ -0,0 +1,202 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from pyroll.core import PassSequence, RollPass
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    """Tolerance of a recorded field, values match if ``|actual - expected| <= atol + rtol * |expected|``."""
+
+    rtol: float = 0.
+    """Relative tolerance."""
+
+    atol: float = 0.
+    """Absolute tolerance."""
+
+    pillars: Optional[tuple[int, ...]] = None
+    """Indices of the pillars the tolerance of a record key applies to, if ``None`` all."""
+
+
+def _disk_elements(name: str) -> Callable[[RollPass], np.ndarray]:
+    return lambda rp: np.array([getattr(de, name) for de in rp.disk_elements])
+
+
+def _disk_out_profiles(name: str) -> Callable[[RollPass], np.ndarray]:
+    return lambda rp: np.array([getattr(de.out_profile, name) for de in rp.disk_elements])
+
+
+GOLDEN_FIELDS: dict[str, tuple[Callable[[RollPass], np.ndarray], Tolerance]] = {
+    "pillar_heights": (_disk_out_profiles("pillar_heights"), Tolerance(rtol=1e-6, atol=1e-12)),
+    "pillar_widths": (_disk_out_profiles("pillar_widths"), Tolerance(rtol=1e-6, atol=1e-12)),
+    "pillars_in_contact": (_disk_elements("pillars_in_contact"), Tolerance()),
+    "pillar_strains": (_disk_elements("pillar_strains"), Tolerance(rtol=1e-6, atol=1e-9)),
+    "pillar_strain_rates": (_disk_elements("pillar_strain_rates"), Tolerance(rtol=1e-6, atol=1e-6)),
+    "pillar_velocities": (_disk_elements("pillar_velocities"), Tolerance(rtol=1e-6, atol=1e-9)),
+    "pillar_entry_angles": (lambda rp: rp.roll.pillar_entry_angles, Tolerance(rtol=1e-6, atol=1e-9)),
+    "pillar_spread_correction_coefficients": (
+        lambda rp: rp.pillar_spread_correction_coefficients, Tolerance(rtol=1e-6, atol=1e-9)
+    ),
+}
+"""
+Mapping of the names of the recorded fields to the functions extracting them from a solved roll pass
+and their default tolerances.
+Fields of disk elements or their out profiles have the shape ``(disk_element_count, pillar_count)``,
+fields of the roll pass the shape ``(pillar_count,)``.
+"""
+
+
+@dataclass
+class Divergence:
+    """The first value of a recorded field outside its tolerance."""
+
+    key: str
+    """Key of the field in the record."""
+
+    disk: Optional[int] = None
+    """Index of the disk element, ``None`` for fields of the roll pass or if not applicable."""
+
+    pillar: Optional[int] = None
+    """Index of the pillar, ``None`` if not applicable."""
+
+    expected: Optional[float] = None
+    """The reference value."""
+
+    actual: Optional[float] = None
+    """The new value."""
+
+    count: int = 0
+    """Count of values outside the tolerance."""
+
+    message: Optional[str] = None
+    """Description of structural differences like missing fields or differing shapes."""
+
+    def __str__(self):
+        if self.message is not None:
+            return f"{self.key}: {self.message}"
+
+        location = f"pillar {self.pillar}" if self.disk is None else f"disk {self.disk}, pillar {self.pillar}"
+        return (
+            f"{self.key}: first divergence at {location}, expected {self.expected!r}, got {self.actual!r} "
+            f"({self.count} values outside the tolerance)"
+        )
+
+
+def _roll_passes(unit: Union[PassSequence, RollPass]) -> list[RollPass]:
+    return [unit] if isinstance(unit, RollPass) else [u for u in unit.roll_passes if isinstance(u, RollPass)]
+
+
+def record(unit: Union[PassSequence, RollPass], fields: Optional[Iterable[str]] = None) -> dict[str, np.ndarray]:
+    """
+    Record the per-pillar fields of the roll passes of a solved unit.
+
+    :param unit: the solved pass sequence or roll pass
+    :param fields: names of the fields to record from :py:data:`GOLDEN_FIELDS`, if ``None`` all
+    :return: mapping of keys of the form ``"<pass index>_<label>/<field>"`` to the arrays
+    """
+    fields = list(GOLDEN_FIELDS) if fields is None else list(fields)
+
+    return {
+        f"{i}_{rp.label}/{name}": np.asarray(GOLDEN_FIELDS[name][0](rp))
+        for i, rp in enumerate(_roll_passes(unit))
+        for name in fields
+    }
+
+
+def save_record(path: Union[str, Path], values: dict[str, np.ndarray]):
+    """Save a record to a compressed ``.npz`` file."""
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **values)
+
+
+def load_record(path: Union[str, Path]) -> dict[str, np.ndarray]:
+    """Load a record from a ``.npz`` file."""
+    with np.load(path) as data:
+        return {k: data[k] for k in data.files}
+
+
+def compare(
+        values: dict[str, np.ndarray], reference: dict[str, np.ndarray],
+        tolerances: Optional[dict[str, Union[Tolerance, tuple[Tolerance, ...]]]] = None,
+) -> list[Divergence]:
+    """
+    Compare a record with a reference record field by field.
+
+    :param values: the new record
+    :param reference: the reference record
+    :param tolerances: mapping of field names to tolerances overriding the defaults of :py:data:`GOLDEN_FIELDS`,
+        or of record keys to tolerances or tuples of tolerances of accepted deviations,
+        values within the tolerance of their field or any of those of their key match
+    :return: the divergences, at most one per field at its first diverging disk element and pillar
+    """
+    tolerances = tolerances or dict()
+    divergences = []
+
+    for key in sorted(reference.keys() | values.keys()):
+        if key not in values:
+            divergences.append(Divergence(key, message="missing in the new record"))
+            continue
+        if key not in reference:
+            divergences.append(Divergence(key, message="missing in the reference record"))
+            continue
+
+        expected, actual = reference[key], values[key]
+        if expected.shape != actual.shape:
+            divergences.append(Divergence(key, message=f"shape {actual.shape} differs from {expected.shape}"))
+            continue
+
+        name = key.split("/")[-1]
+        tolerance = tolerances.get(name, GOLDEN_FIELDS[name][1] if name in GOLDEN_FIELDS else Tolerance())
+
+        if expected.dtype == bool:
+            outside = expected != actual
+        else:
+            outside = ~np.isclose(actual, expected, rtol=tolerance.rtol, atol=tolerance.atol, equal_nan=True)
+            deviations = tolerances.get(key, ())
+            for deviation in [deviations] if isinstance(deviations, Tolerance) else deviations:
+                pillars = slice(None) if deviation.pillars is None else list(deviation.pillars)
+                outside[..., pillars] &= ~np.isclose(
+                    actual[..., pillars], expected[..., pillars],
+                    rtol=deviation.rtol, atol=deviation.atol, equal_nan=True
+                )
+
+        if not np.any(outside):
+            continue
+
+        index = tuple(int(i) for i in np.argwhere(outside)[0])
+        divergences.append(Divergence(
+            key,
+            disk=index[0] if len(index) == 2 else None,
+            pillar=index[-1],
+            expected=expected[index].item(),
+            actual=actual[index].item(),
+            count=int(np.count_nonzero(outside)),
+        ))
+
+    return divergences
+
+
+def check_golden(
+        unit: Union[PassSequence, RollPass], path: Union[str, Path],
+        tolerances: Optional[dict[str, Union[Tolerance, tuple[Tolerance, ...]]]] = None, update: bool = False,
+) -> list[Divergence]:
+    """
+    Compare the record of a solved unit with the reference record in a file.
+
+    :param unit: the solved pass sequence or roll pass
+    :param path: path of the reference record
+    :param tolerances: mapping of field names or record keys to tolerances, see :py:func:`compare`
+    :param update: whether to write the new record as reference instead of comparing
+    :return: the divergences, empty if updated
+    :raises FileNotFoundError: if the reference record does not exist and ``update`` is false
+    """
+    values = record(unit)
+
+    if update:
+        save_record(path, values)
+        return []
+
+    return compare(values, load_record(path), tolerances)
@@ -1,9 +1,12 @@
-import math
-import shapely
 import numpy as np
 
-from scipy.optimize import fsolve
-from pyroll.core import Profile, Hook
+from pyroll.core import Profile, Unit, Hook
+
+from . import geometry
+from .geometry import (
+    chord_height_table, uniform_pillar_widths, adaptive_sampling, adaptive_pillar_widths, height_refinement_density
+)
+from .config import Config
 
 
 @Profile.extension_class
@@ -24,7 +27,10 @@ class PillarProfile(Profile):
     """Array of the pillar boundaries' heights."""
 
     pillar_sections = Hook[np.ndarray]()
-    """Array of the pillars section areas (Polygon geometry objects)."""
+    """
+    Array of the pillars section areas (Polygon geometry objects),
+    a sequence clipping the sections on access if ``Config.LAZY_PILLAR_SECTIONS`` is set.
+    """
 
     pillar_strains = Hook[np.ndarray]()
     """Array of the pillars strain values."""
@@ -65,50 +71,52 @@ class PillarProfile(Profile):
     pillars_normal_stress = Hook[np.ndarray]()
     """Array of normal stress values for each pillar."""
 
+    cross_section_area = Hook[float]()
+    """
+    Area of the cross-section, in the disk elements of roll passes computed from the pillar arrays
+    the cross-section polygon was built from, otherwise the polygon's area.
+    """
 
-@PillarProfile.pillar_widths
-def pillar_widths_equidistant(self: PillarProfile):
-    from . import Config
-    if Config.PILLAR_TYPE.lower() == "equidistant":
-        dw = self.width / 2 / (Config.PILLAR_COUNT - 0.5)
-        return np.full(Config.PILLAR_COUNT, dw)
+    cross_section_perimeter = Hook[float]()
+    """
+    Perimeter of the cross-section, in the disk elements of roll passes computed from the pillar arrays
+    the cross-section polygon was built from, otherwise the polygon's length.
+    """
 
 
-@PillarProfile.pillar_widths
-def pillar_widths_uniform(self: PillarProfile):
-    from . import Config
-    if Config.PILLAR_TYPE.lower() == "uniform":
-        dw = self.width / 2 / (Config.PILLAR_COUNT - 0.5)
-        equidistant_pillar_widths = np.full(Config.PILLAR_COUNT, dw)
+def pillar_setting(profile: Profile, name: str):
+    """
+    Get a pillar setting (``pillar_count``, ``pillar_type``, ...) of the unit a profile belongs to,
+    the value of the global ``Config`` if it belongs to none.
+    """
+    if isinstance(profile, Unit.Profile):
+        return getattr(profile.unit, name)
+    return getattr(Config, name.upper())
 
-        def p_centers(p_widths):
-            centers = np.zeros_like(p_widths)
-            dist = (p_widths[:-1] + p_widths[1:]) / 2
-            centers[1:] = centers[:-1] + np.cumsum(dist)
-            return centers
 
-        def p_heights(p_widths):
-            return np.array(
-                [
-                    shapely.intersection(
-                        self.cross_section,
-                        shapely.LineString([(p, self.cross_section.bounds[1]), (p, self.cross_section.bounds[3])])
-                    ).length
-                    for p in p_centers(p_widths)
-                ]
-            )
+@PillarProfile.pillar_widths
+def pillar_widths_equidistant(self: PillarProfile):
+    if pillar_setting(self, "pillar_type").lower() == "equidistant":
+        pillar_count = pillar_setting(self, "pillar_count")
+        dw = self.width / 2 / (pillar_count - 0.5)
+        return np.full(pillar_count, dw)
 
-        def fun(p_widths):
-            ph = p_heights(p_widths)
-            areas = (p_widths * ph)
-            diffs = areas[1:] - areas[:-1]
-            w = np.sum(p_widths) - self.width / 2 - p_widths[0] / 2
 
-            return np.append(diffs, w)
+@PillarProfile.pillar_widths
+def pillar_widths_uniform(self: PillarProfile):
+    if pillar_setting(self, "pillar_type").lower() == "uniform":
+        return uniform_pillar_widths(
+            chord_height_table(self.cross_section), self.width, pillar_setting(self, "pillar_count")
+        )
 
-        sol = fsolve(fun, x0=equidistant_pillar_widths)
 
-        return sol
+@PillarProfile.pillar_widths
+def pillar_widths_adaptive(self: PillarProfile):
+    if pillar_setting(self, "pillar_type").lower() == "adaptive":
+        pillar_count = pillar_setting(self, "pillar_count")
+        z = adaptive_sampling(self.width, pillar_count)
+        density = height_refinement_density(z, chord_height_table(self.cross_section)(z))
+        return adaptive_pillar_widths(z, density, self.width, pillar_count)
 
 
 @PillarProfile.pillar_boundaries
@@ -121,15 +129,7 @@ def pillar_boundaries(self: PillarProfile):
 
 @PillarProfile.pillar_heights
 def pillar_heights(self: PillarProfile):
-    return np.array(
-        [
-            shapely.intersection(
-                self.cross_section,
-                shapely.LineString([(p, self.cross_section.bounds[1]), (p, self.cross_section.bounds[3])])
-            ).length
-            for p in self.pillars
-        ]
-    )
+    return chord_height_table(self.cross_section)(self.pillars)
 
 
 @PillarProfile.pillars
@@ -141,15 +141,7 @@ def pillars(self: PillarProfile):
 
 @PillarProfile.pillar_boundary_heights
 def pillar_boundary_heights(self: PillarProfile):
-    return np.array(
-        [
-            shapely.intersection(
-                self.cross_section,
-                shapely.LineString([(p, self.cross_section.bounds[1]), (p, self.cross_section.bounds[3])])
-            ).length
-            for p in self.pillar_boundaries
-        ]
-    )
+    return chord_height_table(self.cross_section)(self.pillar_boundaries)
 
 
 @PillarProfile.pillar_latitudinal_angles
@@ -168,18 +160,10 @@ def pillar_latitudinal_height_derivatives(self: PillarProfile):
 
 @PillarProfile.pillar_sections
 def pillar_sections(self: PillarProfile):
-    a = np.zeros(len(self.pillars), dtype=object)
-
-    for i in range(0, len(a)):
-        a[i] = shapely.clip_by_rect(
-            self.cross_section,
-            self.pillar_boundaries[i],
-            -math.inf,
-            self.pillar_boundaries[i + 1],
-            math.inf
-        )
+    if Config.LAZY_PILLAR_SECTIONS:
+        return geometry.LazyPillarSections(self.cross_section, self.pillar_boundaries)
 
-    return a
+    return geometry.pillar_sections(self.cross_section, self.pillar_boundaries)
 
 
 @PillarProfile.pillar_areas
@@ -187,15 +171,23 @@ def pillar_areas(self: PillarProfile):
     return self.pillar_widths * self.pillar_heights
 
 
+@PillarProfile.cross_section_area
+def cross_section_area(self: PillarProfile):
+    return self.cross_section.area
+
+
+@PillarProfile.cross_section_perimeter
+def cross_section_perimeter(self: PillarProfile):
+    return self.cross_section.length
+
+
 @PillarProfile.pillars_flow_stress
 def default_flow_stress_from_single_numeric(self: PillarProfile):
-    from . import Config
     if self.has_value("flow_stress"):
-        return np.full(Config.PILLAR_COUNT, self.flow_stress)
+        return np.full(pillar_setting(self, "pillar_count"), self.flow_stress)
 
 
 @PillarProfile.pillar_strains
 def default_pillar_strains_from_single_numeric(self: PillarProfile):
-    from . import Config
     if self.has_value("strain"):
-        return np.full(Config.PILLAR_COUNT, self.strain)
+        return np.full(pillar_setting(self, "pillar_count"), self.strain)
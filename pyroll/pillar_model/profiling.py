@@ -0,0 +1,278 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from pyroll.core import Roll, RollPass, Unit
+from pyroll.core.hooks import Hook, HookFunction, HookHost
+
+from . import geometry
+from .roll_pass import sweep
+from .roll_pass.surface_table import RollSurfaceTable
+
+HOT_PATHS = [
+    (Roll, "surface_interpolation"),
+    (RollSurfaceTable, "depths"),
+    (geometry, "pillar_cross_section_measures"),
+    (geometry, "chord_height_table"),
+    (sweep, "pillar_entry_points"),
+    (sweep, "contour_entry_points"),
+]
+"""
+Methods and functions instrumented besides the hook functions, as pairs of owner class or module and attribute name.
+Covers the roll surface lookups, the shapely cross-section operations and the entry point search.
+"""
+
+
+@dataclass
+class CallStatistics:
+    """Statistics of the calls of one function within one roll pass."""
+
+    calls: int = 0
+    """Count of calls."""
+
+    total_time: float = 0.
+    """Cumulative wall time in seconds including the time of nested instrumented calls."""
+
+    self_time: float = 0.
+    """Cumulative wall time in seconds excluding the time of nested instrumented calls."""
+
+    array_bytes: int = 0
+    """Cumulative size of the returned arrays in bytes."""
+
+
+def _roll_pass_label(instance: Any) -> str:
+    """Get the label of the roll pass an instance belongs to, ``"-"`` if none."""
+    obj = instance
+    while obj is not None:
+        if isinstance(obj, RollPass):
+            return obj.label or f"RollPass {id(obj):x}"
+        if isinstance(obj, Unit.Profile):
+            obj = obj.unit
+        elif isinstance(obj, Unit):
+            obj = obj.parent
+        elif isinstance(obj, RollPass.Roll):
+            obj = obj.roll_pass
+        else:
+            break
+    return "-"
+
+
+def _path_name(owner: Union[type, ModuleType], name: str) -> str:
+    """Get the name of a hot path as ``<class>.<name>`` or ``<module>.<name>`` without the package."""
+    return f"{getattr(owner, '__qualname__', owner.__name__.rsplit('.', 1)[-1])}.{name}"
+
+
+def _hook_functions(modules: tuple[str, ...]) -> Iterable[tuple[Hook, HookFunction]]:
+    """Yield the non-wrapper hook functions of all hook hosts originating from the given modules."""
+    classes = [HookHost]
+    seen = set()
+
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+
+        for hook in list(vars(cls).values()):
+            if not isinstance(hook, Hook):
+                continue
+
+            for f in hook._first_functions + hook._functions + hook._last_functions:
+                if id(f) not in seen and f.module.startswith(modules) and not f.wrapper:
+                    seen.add(id(f))
+                    yield hook, f
+
+
+class PillarProfiler:
+    """
+    Opt-in instrumentation of the pillar model's hook functions and hot paths.
+    Records call counts, cumulative wall times and the sizes of the returned arrays per function and roll pass.
+
+    While enabled, the instrumented functions are replaced by timing wrappers, which are removed again on disabling,
+    so there is no overhead at all when disabled.
+    Use as context manager::
+
+        with PillarProfiler() as profiler:
+            sequence.solve(in_profile)
+
+        print(profiler.table())
+        profiler.write_chrome_trace("trace.json")
+
+    Nested calls of the same hook on the same instance are skipped by the hook cycle detection and not recorded.
+    The instrumentation is not thread-safe.
+    """
+
+    def __init__(
+            self,
+            modules: Union[str, tuple[str, ...]] = "pyroll.pillar_model",
+            hot_paths: Optional[list[tuple[type, str]]] = None,
+            trace: bool = True,
+    ):
+        """
+        :param modules: prefixes of the modules whose hook functions are instrumented
+        :param hot_paths: methods and functions instrumented besides the hook functions,
+            if ``None`` :py:data:`HOT_PATHS`
+        :param trace: whether to record each call as trace event for :py:meth:`chrome_trace`
+        """
+        self.modules = (modules,) if isinstance(modules, str) else tuple(modules)
+        self.hot_paths = HOT_PATHS if hot_paths is None else hot_paths
+        self.trace = trace
+
+        self.statistics: dict[tuple[str, str], CallStatistics] = dict()
+        """Mapping of roll pass labels and function names to the call statistics."""
+
+        self.events: list[dict] = []
+        """Recorded trace events in the Chrome trace event format."""
+
+        self.wall_time = 0.
+        """Cumulative wall time in seconds while enabled."""
+
+        self._restore: list[Callable[[], None]] = []
+        self._stack: list[float] = []
+        self._labels: list[str] = []
+        self._origin = time.perf_counter()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the instrumentation is enabled."""
+        return bool(self._restore)
+
+    def enable(self):
+        """Replace the instrumented functions by timing wrappers."""
+        if self.enabled:
+            return
+
+        self._enabled_at = time.perf_counter()
+
+        for hook, f in _hook_functions(self.modules):
+            original = f.function
+            f.function = self._instrument(original, f"{hook.owner.__qualname__}.{hook.name} ({f.name})")
+            self._restore.append(functools.partial(setattr, f, "function", original))
+
+        for owner, name in self.hot_paths:
+            original = vars(owner)[name]
+            instrumented = self._instrument(original, _path_name(owner, name))
+
+            # module functions are also replaced where the instrumented modules imported them by name
+            owners = [owner]
+            if isinstance(owner, ModuleType):
+                owners += [
+                    m for n, m in list(sys.modules.items())
+                    if m is not None and m is not owner and n.startswith(self.modules)
+                ]
+
+            for o in owners:
+                for attribute, value in list(vars(o).items()):
+                    if value is original:
+                        setattr(o, attribute, instrumented)
+                        self._restore.append(functools.partial(setattr, o, attribute, original))
+
+    def disable(self):
+        """Restore the instrumented functions."""
+        if self.enabled:
+            self.wall_time += time.perf_counter() - self._enabled_at
+
+        for restore in reversed(self._restore):
+            restore()
+        self._restore.clear()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def _instrument(self, func: Callable, name: str) -> Callable:
+        stack = self._stack
+        labels = self._labels
+
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            # calls not on a unit, profile or roll (e.g. of geometry functions) count to the enclosing roll pass
+            label = _roll_pass_label(args[0] if args else None)
+            if label == "-" and labels:
+                label = labels[-1]
+
+            stack.append(0.)
+            labels.append(label)
+            result = None
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                labels.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self._record(label, name, start, elapsed, elapsed - children, result)
+
+            return result
+
+        return instrumented
+
+    def _record(self, roll_pass: str, name: str, start: float, elapsed: float, self_time: float, result):
+        array_bytes = result.nbytes if isinstance(result, np.ndarray) else 0
+
+        statistics = self.statistics.get((roll_pass, name), None)
+        if statistics is None:
+            statistics = self.statistics[(roll_pass, name)] = CallStatistics()
+
+        statistics.calls += 1
+        statistics.total_time += elapsed
+        statistics.self_time += self_time
+        statistics.array_bytes += array_bytes
+
+        if self.trace:
+            self.events.append(dict(
+                name=name, cat=roll_pass, ph="X", pid=os.getpid(), tid=threading.get_ident(),
+                ts=(start - self._origin) * 1e6, dur=elapsed * 1e6, args=dict(array_bytes=array_bytes),
+            ))
+
+    def table(self, sort: str = "self_time", limit: Optional[int] = None) -> str:
+        """
+        Get the call statistics as text table.
+
+        :param sort: attribute of :py:class:`CallStatistics` to sort by in descending order
+        :param limit: maximum count of rows
+        """
+        rows = sorted(self.statistics.items(), key=lambda item: getattr(item[1], sort), reverse=True)[:limit]
+        width = max([len(name) for (_, name), _ in rows] + [8])
+        rp_width = max([len(rp) for (rp, _), _ in rows] + [9])
+
+        lines = [
+            f"{'roll pass':<{rp_width}} {'function':<{width}} {'calls':>8} {'total [ms]':>11} {'self [ms]':>10} "
+            f"{'arrays [KiB]':>13}"
+        ]
+        for (rp, name), s in rows:
+            lines.append(
+                f"{rp:<{rp_width}} {name:<{width}} {s.calls:>8} {s.total_time * 1e3:>11.1f} "
+                f"{s.self_time * 1e3:>10.1f} {s.array_bytes / 1024:>13.1f}"
+            )
+
+        self_time = sum(s.self_time for s in self.statistics.values())
+        lines.append(
+            f"instrumented self time {self_time * 1e3:.1f} ms of {self.wall_time * 1e3:.1f} ms wall time, "
+            f"the remainder is spent in hook dispatch and uninstrumented code"
+        )
+
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Get the recorded calls in the Chrome trace event format, viewable in ``chrome://tracing`` or Perfetto."""
+        return dict(traceEvents=self.events, displayTimeUnit="ms")
+
+    def write_chrome_trace(self, path: Union[str, Path]):
+        """Write the recorded calls in the Chrome trace event format to a JSON file."""
+        Path(path).write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+    def __str__(self):
+        return self.table()
@@ -10,6 +10,9 @@ from matplotlib.cm import ScalarMappable
 from pyroll.core import Unit, RollPass
 from pyroll.report import hookimpl
 
+from .roll_pass.stacking import stacked
+from .roll_pass.surface_table import disk_surface_depths
+
 
 @hookimpl(specname="unit_plot")
 def disk_element_pillar_plot(unit: Unit):
@@ -26,7 +29,7 @@ def disk_element_pillar_plot(unit: Unit):
 
         rp = de.roll_pass
 
-        surface = rp.roll.surface_interpolation(de.out_profile.x, rp.roll.surface_z).squeeze() + rp.gap / 2
+        surface = disk_surface_depths(rp.roll, de.out_profile.x, rp.roll.surface_z) + rp.gap / 2
 
         ax.plot(rp.roll.surface_z, surface, color="k")
         ax.plot(rp.roll.surface_z, -surface, color="k")
@@ -54,7 +57,7 @@ def roll_pass_pillar_animation(unit: Unit):
 
         def yield_artists():
             for de in rp.disk_elements:
-                surface = rp.roll.surface_interpolation(de.out_profile.x, rp.roll.surface_z).squeeze() + rp.gap / 2
+                surface = disk_surface_depths(rp.roll, de.out_profile.x, rp.roll.surface_z) + rp.gap / 2
                 s1 = ax.plot(rp.roll.surface_z, surface, color="k")
                 s2 = ax.plot(rp.roll.surface_z, -surface, color="k")
                 ip = ax.fill(*de.in_profile.cross_section.boundary.xy, alpha=0.5, color="red")
@@ -148,11 +151,8 @@ def roll_pass_local_strain_strain_rate_over_width(unit: Unit):
         ax1.set_ylabel("Strain ")
         ax2.set_ylabel("Strain rate")
 
-        p_strains = []
-        p_strain_rates = []
-        for de in rp.disk_elements:
-            p_strains.append(de.out_profile.pillar_strains)
-            p_strain_rates.append(de.pillar_strain_rates)
+        p_strains = np.array([de.out_profile.pillar_strains for de in rp.disk_elements])
+        p_strain_rates = stacked(rp, "pillar_strain_rates")
 
         min_strain = np.min(p_strains)
         max_strain = np.max(p_strains)
@@ -218,7 +218,7 @@ def roll_pass_forming_values_distribution(unit: Unit):
                 yield de.in_profile.x + 0.5 * de.length, de.out_profile.width / de.in_profile.width
 
         gamma_ = [de.out_profile.height / de.in_profile.height for de in rp.disk_elements]
-        lambda_ = [de.in_profile.cross_section.area / de.out_profile.cross_section.area for de in rp.disk_elements]
+        lambda_ = [de.in_profile.cross_section_area / de.out_profile.cross_section_area for de in rp.disk_elements]
         x, beta_ = np.array(list(_gen())).T
         ax1.plot(x, gamma_, label='$\\gamma$')
         ax1.plot(x, lambda_, label='$\\lambda$')
@@ -267,7 +267,7 @@ def roll_pass_velocity_profile(unit: Unit):
         rp: RollPass = unit
         x = np.array([np.ones_like(de.out_profile.pillars) * de.out_profile.x for de in rp.disk_elements])
         y = np.array([de.out_profile.pillars for de in rp.disk_elements])
-        z = np.array([de.pillar_velocities for de in rp.disk_elements])
+        z = stacked(rp, "pillar_velocities")
 
         fig = go.Figure(data=[go.Surface(z=z, x=x, y=y)])
         fig.update_layout(title='Workpiece Velocity Profile')
@@ -0,0 +1,231 @@
+import copy
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+from pyroll.core import RollPass, Profile
+from .roll_pass.warm_start import WarmStartStore
+
+QUANTITIES = ["total_pillar_strains", "mean_total_strain", "contact_area", "roll_force", "width"]
+"""Names of the quantities compared between the levels of a pillar count study."""
+
+
+@dataclass
+class PillarCountLevel:
+    """Results of a roll pass solved at one pillar count."""
+
+    pillar_count: int
+    """The count of pillars."""
+
+    duration: float
+    """Wall time of the solution in seconds."""
+
+    iteration_count: int
+    """Count of iterations of the roll pass solution."""
+
+    positions: np.ndarray
+    """Positions of the pillars in the out profile relative to its half width."""
+
+    total_pillar_strains: np.ndarray
+    """Total strains of the pillars."""
+
+    mean_total_strain: float
+    """Mean of the total pillar strains weighted by the pillar areas in the out profile."""
+
+    contact_area: float
+    """Sum of the total contact areas of the pillars."""
+
+    roll_force: float
+    """The roll force."""
+
+    width: float
+    """Width of the out profile."""
+
+    deviations: dict[str, float] = field(default_factory=dict)
+    """
+    Relative deviations of the quantities from the finest level.
+    For the strain distribution, it is the maximum deviation of the strains interpolated to the finest level's pillars
+    relative to the maximum strain.
+    """
+
+
+@dataclass
+class PillarCountStudy:
+    """Results of a pillar count study."""
+
+    levels: list[PillarCountLevel]
+    """The levels of the study in ascending pillar count."""
+
+    tolerance: float
+    """Tolerance of the relative deviations from the finest level."""
+
+    @property
+    def recommended_pillar_count(self) -> Optional[int]:
+        """
+        The smallest pillar count, from which on all levels meet the tolerance in all quantities,
+        ``None`` if none but the finest does.
+        """
+        recommended = None
+
+        for level in reversed(self.levels[:-1]):
+            if max(level.deviations.values()) > self.tolerance:
+                break
+            recommended = level.pillar_count
+
+        return recommended
+
+    def table(self) -> str:
+        """Get the levels' durations, iteration counts and deviations as text table."""
+        header = f"{'pillars':>8} {'time [s]':>9} {'iterations':>11}" + "".join(f" {q:>21}" for q in QUANTITIES)
+        lines = [header]
+
+        for level in self.levels:
+            lines.append(
+                f"{level.pillar_count:>8} {level.duration:>9.2f} {level.iteration_count:>11}"
+                + "".join(f" {level.deviations[q]:>21.2e}" for q in QUANTITIES)
+            )
+
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table() + f"\nrecommended pillar count: {self.recommended_pillar_count}"
+
+
+def _relative_deviation(value: float, reference: float) -> float:
+    return abs(value - reference) / abs(reference) if reference != 0 else abs(value)
+
+
+def solve_level(
+        roll_pass: RollPass, in_profile: Profile, pillar_count: int,
+        store: Optional[WarmStartStore] = None, iteration_precision: Optional[float] = None,
+) -> tuple[RollPass, PillarCountLevel]:
+    """
+    Solve a copy of a roll pass with the given pillar count.
+
+    :param store: warm start store to use for the solution of the copy, replacing the global one
+    :param iteration_precision: iteration precision of the copy, if ``None`` the roll pass' one
+    :return: the solved copy and its results
+    """
+    rp = copy.deepcopy(roll_pass)
+    rp.pillar_count = pillar_count
+    if iteration_precision is not None:
+        rp.iteration_precision = iteration_precision
+
+    duration = _solve(rp, in_profile, store)
+
+    return rp, _level(rp, pillar_count, duration)
+
+
+def _solve(rp: RollPass, in_profile: Profile, store: Optional[WarmStartStore]) -> float:
+    """Solve a roll pass with the store attached and detach it afterwards, returning the wall time."""
+    if store is not None:
+        rp._warm_start_store = store
+
+    try:
+        start = time.perf_counter()
+        rp.solve(in_profile)
+        return time.perf_counter() - start
+    finally:
+        rp.__dict__.pop("_warm_start_store", None)
+
+
+def _level(rp: RollPass, pillar_count: int, duration: float) -> PillarCountLevel:
+    out_profile = rp.out_profile
+    strains = rp.total_pillar_strains
+
+    return PillarCountLevel(
+        pillar_count=pillar_count,
+        duration=duration,
+        iteration_count=len(rp.convergence_history),
+        positions=out_profile.pillars / out_profile.pillar_boundaries[-1],
+        total_pillar_strains=strains,
+        mean_total_strain=float(np.sum(strains * out_profile.pillar_areas) / np.sum(out_profile.pillar_areas)),
+        contact_area=float(np.sum(rp.roll.total_pillar_contact_areas)),
+        roll_force=float(rp.roll_force),
+        width=float(out_profile.width),
+    )
+
+
+def pillar_count_study(
+        roll_pass: RollPass, in_profile: Profile,
+        pillar_counts: Sequence[int] = (10, 20, 40, 80), tolerance: float = 1e-2
+) -> PillarCountStudy:
+    """
+    Solve a roll pass at a sequence of pillar counts and compare the total pillar strains, the contact area,
+    the roll force and the out profile's width to the finest level.
+
+    Each level solves a copy of the roll pass, so the given one is not modified.
+    The in profile is the same for all levels, so its chord height table is cached after the first level and
+    reused by all following ones.
+
+    :param roll_pass: the unsolved roll pass
+    :param in_profile: the incoming profile
+    :param pillar_counts: the pillar counts to solve with, the largest serves as reference
+    :param tolerance: the tolerance of the relative deviations to recommend a pillar count
+    :raises ValueError: if the roll pass was solved before or less than two pillar counts are given
+    """
+    if roll_pass.out_profile is not None:
+        raise ValueError("The roll pass must not be solved before, as its pillar arrays would be reused.")
+
+    pillar_counts = sorted(set(pillar_counts))
+    if len(pillar_counts) < 2:
+        raise ValueError("At least two distinct pillar counts are required.")
+
+    levels = [solve_level(roll_pass, in_profile, n)[1] for n in pillar_counts]
+    reference = levels[-1]
+
+    for level in levels:
+        strains = np.interp(reference.positions, level.positions, level.total_pillar_strains)
+        level.deviations["total_pillar_strains"] = float(
+            np.max(np.abs(strains - reference.total_pillar_strains)) / np.max(np.abs(reference.total_pillar_strains))
+        )
+
+        for q in QUANTITIES[1:]:
+            level.deviations[q] = _relative_deviation(getattr(level, q), getattr(reference, q))
+
+    return PillarCountStudy(levels=levels, tolerance=tolerance)
+
+
+def multilevel_solve(
+        roll_pass: RollPass, in_profile: Profile,
+        coarse_pillar_counts: Sequence[int] = (30,), coarse_iteration_precision: Optional[float] = 1e-2,
+        store: Optional[WarmStartStore] = None,
+) -> list[PillarCountLevel]:
+    """
+    Solve a roll pass at its pillar count starting from the pillar spread correction coefficients
+    converged at coarser pillar counts.
+
+    The coarse levels solve copies of the roll pass in ascending pillar count, each one starting from the
+    coefficients of the previous level.
+    The converged coefficients are interpolated over the pillar positions relative to the profile's half width
+    by an in-memory warm start store attached to the roll passes during their solution,
+    so that the fine level only runs the iterations remaining to resolve the finer pillars.
+    As the cost of an iteration is dominated by the per disk element overhead at moderate pillar counts,
+    the gain stems from the coarse levels converging to a looser precision.
+
+    :param roll_pass: the unsolved roll pass, solved in place at the fine level
+    :param in_profile: the incoming profile
+    :param coarse_pillar_counts: the pillar counts of the coarse levels, counts not below
+        the roll pass' pillar count are ignored
+    :param coarse_iteration_precision: the iteration precision of the coarse levels, as they only have to provide
+        an initial guess, a looser one than the roll pass' is sufficient, if ``None`` the roll pass' one
+    :param store: the in-memory warm start store to pass the coefficients between the levels, if ``None`` a new one
+    :return: the results of the coarse levels and of the fine level, in ascending pillar count
+    :raises ValueError: if the roll pass was solved before
+    """
+    if roll_pass.out_profile is not None:
+        raise ValueError("The roll pass must not be solved before, as its pillar arrays would be reused.")
+
+    pillar_count = roll_pass.pillar_count
+    store = WarmStartStore() if store is None else store
+    levels = [
+        solve_level(roll_pass, in_profile, n, store, coarse_iteration_precision)[1]
+        for n in sorted(set(coarse_pillar_counts)) if n < pillar_count
+    ]
+
+    duration = _solve(roll_pass, in_profile, store)
+    levels.append(_level(roll_pass, pillar_count, duration))
+
+    return levels
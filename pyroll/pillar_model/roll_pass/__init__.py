@@ -1,4 +1,10 @@
+from . import acceleration
+from . import contacts
 from . import pillar_disk_element
 from . import roll_pass
+from . import stacking
+from . import surface_table
+from . import sweep
+from . import warm_start
 
 from . import hookimpls
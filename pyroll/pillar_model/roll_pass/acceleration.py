@@ -0,0 +1,249 @@
+from copy import copy
+from typing import Optional
+
+import numpy as np
+
+from pyroll.core import RollPass
+
+from ..config import Config
+
+
+class FixedPointAccelerator:
+    """
+    Base class of accelerators for the fixed-point iteration of the pillar spread correction coefficients.
+    Gets the current coefficients and the result of one relaxed correction step in every iteration of the roll pass
+    and returns the coefficients for the next iteration.
+    The base class returns the relaxed step unchanged.
+
+    Subclasses implement :py:meth:`step` and keep their state in the attributes listed in :py:attr:`state`,
+    so that a repeated update within the same outer iteration can replace the previous one.
+    """
+
+    state: tuple[str, ...] = ()
+    """Names of the attributes holding the state of the accelerator."""
+
+    def __init__(self, history: int):
+        """
+        :param history: the count of past iterations the accelerator may use
+        """
+        self.history = history
+
+        self.iteration = None
+        """The outer iteration of the last update."""
+
+        self._saved_state = None
+
+    def update(self, x: np.ndarray, g: np.ndarray, iteration: Optional[int] = None) -> np.ndarray:
+        """
+        Get the next iterate.
+
+        :param x: the current iterate
+        :param g: the result of the relaxed step applied to ``x``
+        :param iteration: the outer iteration of the roll pass, an update with the same iteration as the last one
+            replaces the last one instead of adding to the history, if ``None`` each update adds to the history
+        """
+        if iteration is not None and iteration == self.iteration:
+            for name, value in self._saved_state.items():
+                setattr(self, name, copy(value))
+        else:
+            self._saved_state = {name: copy(getattr(self, name)) for name in self.state}
+            self.iteration = iteration
+
+        return self.step(x, g)
+
+    def step(self, x: np.ndarray, g: np.ndarray) -> np.ndarray:
+        """Get the next iterate and advance the state of the accelerator."""
+        return g
+
+
+class AitkenAccelerator(FixedPointAccelerator):
+    """
+    Aitken's dynamic relaxation of the correction step, scaling the step by a factor updated
+    from the change of the last two residuals (Irons-Tuck form of the vector Aitken extrapolation).
+    """
+
+    state = ("factor", "_residual")
+
+    def __init__(self, history: int):
+        super().__init__(history)
+        self.factor = 1.0
+        """Current scaling factor of the step."""
+
+        self._residual = None
+
+    def step(self, x: np.ndarray, g: np.ndarray) -> np.ndarray:
+        residual = g - x
+
+        if self._residual is not None and self._residual.shape == residual.shape:
+            change = residual - self._residual
+            norm = change @ change
+            if norm > 0:
+                self.factor = -self.factor * (self._residual @ change) / norm
+
+        self._residual = residual
+        return x + self.factor * residual
+
+
+class AndersonAccelerator(FixedPointAccelerator):
+    """
+    Anderson mixing of the correction steps, taking the combination of the last ``history`` steps
+    that minimizes the residual in the least squares sense.
+    """
+
+    state = ("_iterates", "_steps")
+
+    def __init__(self, history: int):
+        super().__init__(history)
+        self._iterates = []
+        self._steps = []
+
+    def step(self, x: np.ndarray, g: np.ndarray) -> np.ndarray:
+        if self._iterates and self._iterates[-1].shape != x.shape:
+            self._iterates.clear()
+            self._steps.clear()
+
+        self._iterates.append(x)
+        self._steps.append(g)
+        del self._iterates[:-(self.history + 1)]
+        del self._steps[:-(self.history + 1)]
+
+        if len(self._iterates) < 2:
+            return g
+
+        steps = np.array(self._steps)
+        residuals = steps - np.array(self._iterates)
+        weights = np.linalg.lstsq(np.diff(residuals, axis=0).T, residuals[-1], rcond=None)[0]
+        return g - np.diff(steps, axis=0).T @ weights
+
+
+ACCELERATORS = {
+    "RELAXATION": FixedPointAccelerator,
+    "AITKEN": AitkenAccelerator,
+    "ANDERSON": AndersonAccelerator,
+}
+"""Accelerator classes selectable by ``Config.SPREAD_CORRECTION_ACCELERATOR``, may be extended by plugins."""
+
+
+def spread_correction_accelerator(roll_pass: RollPass) -> FixedPointAccelerator:
+    """
+    Get the accelerator of a roll pass, creating it if not present or if the configuration changed.
+    It is dropped before each solution of the roll pass by :py:func:`spread_correction_pre_processor`.
+    """
+    cls = ACCELERATORS[Config.SPREAD_CORRECTION_ACCELERATOR]
+    accelerator = roll_pass.__dict__.get("_spread_correction_accelerator", None)
+
+    if type(accelerator) is not cls or accelerator.history != Config.SPREAD_CORRECTION_HISTORY:
+        accelerator = cls(Config.SPREAD_CORRECTION_HISTORY)
+        roll_pass._spread_correction_accelerator = accelerator
+
+    return accelerator
+
+
+def spread_correction_pre_processor(roll_pass: RollPass) -> None:
+    """
+    Pre-processor factory dropping the spread correction state of a roll pass left by a previous solution,
+    so that each solution starts with a fresh history.
+    Only the side effect is needed, so no pre-processing unit is returned.
+    """
+    roll_pass.__dict__.pop("_spread_correction_accelerator", None)
+    roll_pass.__dict__.pop("_spread_correction_controller", None)
+
+
+RollPass.pre_processors.append(spread_correction_pre_processor)
+
+
+class SpreadCorrectionController:
+    """
+    Convergence controller of the pillar spread correction iteration.
+    Tracks the max-norm of the per-pillar residuals ``1 / (mean_elongation * draught * spread) - 1``,
+    grows the relaxation factor while the residual decreases and shrinks it when the residual increases.
+    """
+
+    def __init__(
+            self,
+            relaxation_factor: float,
+            tolerance: Optional[float],
+            adaptive: bool,
+            growth: float = 1.5,
+            shrinkage: float = 0.5,
+            min_relaxation_factor: float = 0.01,
+            max_relaxation_factor: float = 1,
+    ):
+        """
+        :param relaxation_factor: the initial relaxation factor
+        :param tolerance: max-norm of the residuals below which the coefficients are not updated anymore,
+            if ``None`` the coefficients are updated in every iteration
+        :param adaptive: whether to adapt the relaxation factor
+        :param growth: factor to grow the relaxation factor with while the residual decreases
+        :param shrinkage: factor to shrink the relaxation factor with when the residual increases
+        :param min_relaxation_factor: lower bound of the relaxation factor
+        :param max_relaxation_factor: upper bound of the relaxation factor
+        """
+        self.relaxation_factor = relaxation_factor
+        self.tolerance = tolerance
+        self.adaptive = adaptive
+        self.growth = growth
+        self.shrinkage = shrinkage
+        self.min_relaxation_factor = min_relaxation_factor
+        self.max_relaxation_factor = max_relaxation_factor
+
+        self.residual_norms = []
+        """History of the max-norms of the residuals, one per outer iteration."""
+
+        self.iteration = None
+        """The outer iteration of the last update."""
+
+        self._previous_relaxation_factor = relaxation_factor
+
+    @property
+    def converged(self) -> bool:
+        """Whether the last residual was below the tolerance, always false without tolerance."""
+        return self.tolerance is not None and bool(self.residual_norms) and self.residual_norms[-1] < self.tolerance
+
+    def update(self, residuals: np.ndarray, iteration: Optional[int] = None) -> float:
+        """
+        Record the residuals of the current iteration and get the relaxation factor for the next step.
+
+        :param residuals: array of the per-pillar residuals
+        :param iteration: the outer iteration of the roll pass, an update with the same iteration as the last one
+            replaces the last one instead of adding to the history, if ``None`` each update adds to the history
+        """
+        if iteration is not None and iteration == self.iteration:
+            self.residual_norms.pop()
+            self.relaxation_factor = self._previous_relaxation_factor
+        else:
+            self._previous_relaxation_factor = self.relaxation_factor
+            self.iteration = iteration
+
+        norm = float(np.max(np.abs(residuals)))
+
+        if self.adaptive and self.residual_norms:
+            if norm < self.residual_norms[-1]:
+                self.relaxation_factor = min(self.relaxation_factor * self.growth, self.max_relaxation_factor)
+            else:
+                self.relaxation_factor = max(self.relaxation_factor * self.shrinkage, self.min_relaxation_factor)
+
+        self.residual_norms.append(norm)
+        return self.relaxation_factor
+
+
+def spread_correction_controller(roll_pass: RollPass) -> SpreadCorrectionController:
+    """
+    Get the convergence controller of a roll pass, creating it if not present or if the configuration changed.
+    It is dropped before each solution of the roll pass by :py:func:`spread_correction_pre_processor`.
+    """
+    controller = roll_pass.__dict__.get("_spread_correction_controller", None)
+
+    if (
+            controller is None
+            or controller.tolerance != Config.SPREAD_CORRECTION_TOLERANCE
+            or controller.adaptive != Config.SPREAD_CORRECTION_ADAPTIVE_RELAXATION
+    ):
+        controller = SpreadCorrectionController(
+            relaxation_factor=Config.SPREAD_CORRECTION_RELAXATION_FACTOR,
+            tolerance=Config.SPREAD_CORRECTION_TOLERANCE,
+            adaptive=Config.SPREAD_CORRECTION_ADAPTIVE_RELAXATION,
+        )
+        roll_pass._spread_correction_controller = controller
+
+    return controller
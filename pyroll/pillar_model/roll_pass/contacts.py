@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from pyroll.core import RollPass
+
+
+class DiskElementRows:
+    """Row indices of the disk elements of a roll pass and the pillar contact masks recorded for them."""
+
+    def __init__(self, roll_pass: RollPass):
+        self.rows = {id(de): i for i, de in enumerate(roll_pass.subunits)}
+        """Mapping of disk element ids to row indices."""
+
+        self.contact_masks = dict()
+        """Mapping of row indices to the last pillar contact masks of the disk elements."""
+
+
+def disk_element_rows(roll_pass: RollPass, disk_element: RollPass.DiskElement) -> DiskElementRows:
+    """Get the disk element rows of a roll pass, creating them if not present or not knowing the given disk element."""
+    rows = roll_pass.__dict__.get("_disk_element_rows", None)
+
+    if rows is None or id(disk_element) not in rows.rows or len(rows.rows) != len(roll_pass.subunits):
+        rows = DiskElementRows(roll_pass)
+        roll_pass._disk_element_rows = rows
+
+    return rows
+
+
+def disk_element_index(disk_element: RollPass.DiskElement) -> int:
+    """Get the index of a disk element within its roll pass."""
+    return disk_element_rows(disk_element.roll_pass, disk_element).rows[id(disk_element)]
+
+
+def record_pillars_in_contact(disk_element: RollPass.DiskElement, contacts: np.ndarray):
+    """Record the pillar contact mask of a disk element on its roll pass."""
+    rows = disk_element_rows(disk_element.roll_pass, disk_element)
+    rows.contact_masks[rows.rows[id(disk_element)]] = contacts
+
+
+def recorded_pillars_in_contact(roll_pass: RollPass) -> Optional[np.ndarray]:
+    """
+    Get the pillar contact masks recorded for the disk elements of a roll pass as 2-D array
+    of shape ``(disk_element_count, pillar_count)``.
+    Rows not yet solved in the current iteration hold the masks of the last iteration.
+
+    :return: the masks, ``None`` if not all disk elements have recorded a mask of the pillar count of the in profile
+    """
+    rows = roll_pass.__dict__.get("_disk_element_rows", None)
+    if rows is None or len(rows.rows) != len(roll_pass.subunits):
+        return None
+
+    masks = [rows.contact_masks.get(i, None) for i in range(len(rows.rows))]
+    pillar_count = len(roll_pass.in_profile.pillars)
+    if any(m is None or len(m) != pillar_count for m in masks):
+        return None
+
+    return np.array(masks, dtype=bool)
+
+
+def previous_pillars_in_contact(disk_element: RollPass.DiskElement) -> np.ndarray:
+    """
+    Get the pillar contact mask of the disk element preceding the given one.
+    All pillars are out of contact before the first disk element.
+    """
+    rows = disk_element_rows(disk_element.roll_pass, disk_element)
+    i = rows.rows[id(disk_element)]
+
+    if i == 0:
+        return np.zeros_like(disk_element.pillars_in_contact)
+
+    contacts = rows.contact_masks.get(i - 1, None)
+    if contacts is None:
+        contacts = disk_element.roll_pass.subunits[i - 1].pillars_in_contact
+    return contacts
+
+
+@dataclass
+class PillarContactTotals:
+    """Totals of the pillar contacts over all disk elements of a roll pass."""
+
+    lengths: np.ndarray
+    """Array of total contact length of each pillar."""
+
+    areas: np.ndarray
+    """Array of total contact area of each pillar."""
+
+    first_contact_x: Optional[np.ndarray] = None
+    """Array of the x-coordinates where the pillars get in contact, NaN for pillars never in contact."""
+
+    last_contact_x: Optional[np.ndarray] = None
+    """Array of the x-coordinates where the pillars leave contact, NaN for pillars never in contact."""
+
+
+def pillar_contact_totals(
+        contacts: np.ndarray,
+        lengths: np.ndarray,
+        in_widths: np.ndarray,
+        out_widths: np.ndarray,
+        in_x: Optional[np.ndarray] = None,
+        out_x: Optional[np.ndarray] = None,
+) -> PillarContactTotals:
+    """
+    Accumulate the contact lengths and areas of the pillars over all disk elements of a roll pass
+    in one reduction over the (disk x pillar) grid.
+
+    :param contacts: array of pillar contact flags of shape ``(disk_element_count, pillar_count)``
+    :param lengths: array of the disk element lengths
+    :param in_widths: array of the pillar widths at the disk elements' in profiles
+    :param out_widths: array of the pillar widths at the disk elements' out profiles
+    :param in_x: array of the x-coordinates of the disk elements' in profiles,
+        if given together with ``out_x``, the first and last contact positions are determined
+    :param out_x: array of the x-coordinates of the disk elements' out profiles
+    """
+    contacts = np.asarray(contacts, dtype=bool)
+    contact_lengths = np.where(contacts, np.asarray(lengths)[:, np.newaxis], 0)
+    totals = PillarContactTotals(
+        lengths=np.sum(contact_lengths, axis=0),
+        areas=np.sum(contact_lengths * (in_widths + out_widths) / 2, axis=0),
+    )
+
+    if in_x is not None and out_x is not None:
+        in_contact = np.any(contacts, axis=0)
+        first = np.argmax(contacts, axis=0)
+        last = len(contacts) - 1 - np.argmax(contacts[::-1], axis=0)
+        totals.first_contact_x = np.where(in_contact, np.asarray(in_x)[first], np.nan)
+        totals.last_contact_x = np.where(in_contact, np.asarray(out_x)[last], np.nan)
+
+    return totals
@@ -2,3 +2,4 @@ from . import pillar_disk_element
 from . import profile
 from . import roll
 from . import roll_pass
+from . import sweep
@@ -1,27 +1,41 @@
-import shapely
 import numpy as np
 
 from pyroll.core import RollPass
 from ..pillar_disk_element import PillarDiskElement
+from ...geometry import pillar_cross_section_measures
+from ..contacts import record_pillars_in_contact, previous_pillars_in_contact, disk_element_index
+from ..surface_table import disk_surface_depths
 
 
 @PillarDiskElement.pillars_in_contact
 def pillars_in_contact(self: PillarDiskElement):
     rp = self.roll_pass
-    contour = rp.roll.surface_interpolation(self.out_profile.x, self.out_profile.pillars).squeeze()
+    contour = disk_surface_depths(rp.roll, self.out_profile.x, self.out_profile.pillars)
     contacts = self.in_profile.pillar_heights / 2 > contour + rp.gap / 2
     return contacts
 
 
+@PillarDiskElement.pillars_in_contact(wrapper=True)
+def recorded_pillars_in_contact(self: PillarDiskElement, cycle: bool):
+    if cycle:
+        return None
+
+    contacts = yield
+    if contacts is not None:
+        record_pillars_in_contact(self, contacts)
+    return contacts
+
+
 @PillarDiskElement.OutProfile.pillar_heights
 def pillar_heights(self: PillarDiskElement.OutProfile):
     de = self.disk_element
     rp = de.roll_pass
     heights = de.in_profile.pillar_heights.copy()
-    heights[de.pillars_in_contact] = rp.roll.surface_interpolation(
+    heights[de.pillars_in_contact] = disk_surface_depths(
+        rp.roll,
         de.out_profile.x,
         de.out_profile.pillars[de.pillars_in_contact]
-    ).squeeze() * 2 + rp.gap
+    ) * 2 + rp.gap
     return heights
 
 
@@ -37,8 +51,7 @@ def pillar_spreads(self: PillarDiskElement):
 
 @PillarDiskElement.pillar_spreads(wrapper=True)
 def corrected_pillar_spreads(self: RollPass.DiskElement, cycle: bool):
-    from ... import Config
-    if Config.ELONGATION_CORRECTION:
+    if self.elongation_correction:
         if cycle:
             return None
 
@@ -73,18 +86,11 @@ def pillar_log_elongations(self: PillarDiskElement):
 
 @PillarDiskElement.pillar_strains
 def pillar_strains(self: PillarDiskElement):
-    if self == self.roll_pass.disk_elements[0]:
-        previous_contact = np.full_like(self.pillars_in_contact, False)
-    else:
-        previous_disk_element = self.prev_of(unit_type=type(self))
-        previous_contact = previous_disk_element.pillars_in_contact
-
     strains = np.sqrt(
         2 / 3 * (self.pillar_log_elongations ** 2 + self.pillar_log_spreads ** 2 + self.pillar_log_draughts ** 2))
 
-    for i in range(len(self.in_profile.pillars)):
-        if self.pillars_in_contact[i] and not previous_contact[i]:
-            strains[i] = strains[i] + self.roll_pass.pillar_corner_correction_strains[i]
+    entering = self.pillars_in_contact & ~previous_pillars_in_contact(self)
+    strains[entering] += self.roll_pass.pillar_corner_correction_strains[entering]
 
     return strains
 
@@ -96,11 +102,9 @@ def pillar_strains(self: PillarDiskElement.OutProfile):
 
 @PillarDiskElement.pillar_strain_rates
 def pillar_strain_rates(self: PillarDiskElement):
+    contacts = self.pillars_in_contact
     p_strain_rates = np.zeros_like(self.in_profile.pillars)
-    for i, pillar in enumerate(self.in_profile.pillars):
-        if self.pillars_in_contact[i]:
-            p_strain_rates[i] = self.pillar_velocities[i] * self.pillar_strains[i] / self.length
-
+    p_strain_rates[contacts] = self.pillar_velocities[contacts] * self.pillar_strains[contacts] / self.length
     return p_strain_rates
 
 
@@ -129,27 +133,54 @@ def out_pillars(self: PillarDiskElement.OutProfile):
 
 @PillarDiskElement.OutProfile.cross_section
 def out_cross_section(self: PillarDiskElement.OutProfile):
-    coords1 = np.column_stack([self.pillars, self.pillar_heights / 2])
-    coords2 = coords1[::-1].copy()
-    coords2[:, 1] *= -1
-    coords3 = coords1[1:].copy()
-    coords3 *= -1
-    coords4 = coords2[:-1].copy()
-    coords4 *= -1
-    outer = self.pillar_boundaries[-1]
-
-    cs = shapely.Polygon(np.vstack(
-        [
-            coords1,
-            [(outer, 0)],
-            coords2,
-            coords3,
-            [(-outer, 0)],
-            coords4,
-        ]
-    )
-    )
-    return cs
+    # measured from the same arrays, so that they belong to this cross-section even if the pillar heights change
+    measures = pillar_cross_section_measures(self.pillars, self.pillar_heights, self.pillar_boundaries[-1])
+    self._cross_section_measures = measures
+    return measures[0]
+
+
+def _cross_section_measure(profile: RollPass.DiskElement.Profile, index: int):
+    measures = profile.__dict__.get("_cross_section_measures", None)
+    if measures is not None and measures[0] is profile.cross_section:
+        return measures[index]
+
+
+def _in_cross_section_measure(profile: RollPass.DiskElement.InProfile, index: int):
+    # the in profile shares the cross-section of the previous disk element's out profile
+    de = profile.disk_element
+    i = disk_element_index(de)
+    if i > 0:
+        return _cross_section_measure(de.roll_pass.disk_elements[i - 1].out_profile, index)
+
+
+@PillarDiskElement.OutProfile.cross_section_area
+def out_cross_section_area(self: PillarDiskElement.OutProfile):
+    return _cross_section_measure(self, 1)
+
+
+@PillarDiskElement.OutProfile.cross_section_perimeter
+def out_cross_section_perimeter(self: PillarDiskElement.OutProfile):
+    return _cross_section_measure(self, 2)
+
+
+@PillarDiskElement.InProfile.cross_section_area
+def in_cross_section_area(self: PillarDiskElement.InProfile):
+    return _in_cross_section_measure(self, 1)
+
+
+@PillarDiskElement.InProfile.cross_section_perimeter
+def in_cross_section_perimeter(self: PillarDiskElement.InProfile):
+    return _in_cross_section_measure(self, 2)
+
+
+@PillarDiskElement.OutProfile.width(tryfirst=True)
+def out_width(self: PillarDiskElement.OutProfile):
+    return 2 * self.pillar_boundaries[-1]
+
+
+@PillarDiskElement.OutProfile.height(tryfirst=True)
+def out_height(self: PillarDiskElement.OutProfile):
+    return np.max(self.pillar_heights)
 
 
 @PillarDiskElement.pillar_longitudinal_angles
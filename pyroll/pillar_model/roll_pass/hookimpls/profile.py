@@ -1,7 +1,14 @@
+import copy
+
 import numpy as np
-from pyroll.core import RollPass
+from pyroll.core import RollPass, Rotator
 from more_itertools import first_true
 
+from .. import sweep
+from ...geometry import (
+    chord_height_table, adaptive_sampling, adaptive_pillar_widths, aligned_pillar_widths, height_refinement_density
+)
+
 
 @RollPass.OutProfile.cross_section
 def rp_out_cross_section(self: RollPass.OutProfile):
@@ -12,7 +19,7 @@ def rp_out_cross_section(self: RollPass.OutProfile):
 @RollPass.OutProfile.width
 def rp_out_width(self: RollPass.OutProfile):
     if self.roll_pass.disk_elements:
-        return self.cross_section.width
+        return self.roll_pass.disk_elements[-1].out_profile.width
 
 
 @RollPass.OutProfile.pillar_boundaries
@@ -34,19 +41,53 @@ def rp_in_velocity(self: RollPass.InProfile):
             pred=lambda de: de.out_profile.x > self.roll_pass.roll.neutral_point
         )
     except AttributeError:  # first iteration: disks are not solved
-        return self.roll_pass.velocity * self.roll_pass.out_profile.cross_section.area / self.cross_section.area
+        return self.roll_pass.velocity * self.roll_pass.out_profile.cross_section_area / self.cross_section_area
 
     neutral_velocity = (
             2 * np.pi * self.roll_pass.roll.rotational_frequency * self.roll_pass.roll.working_radius * np.cos(
         self.roll_pass.roll.neutral_angle)
     )
     weight = (self.roll_pass.roll.neutral_point - neutral_disk.in_profile.x) / neutral_disk.length
-    neutral_cross_section = weight * neutral_disk.out_profile.cross_section.area + (
-            1 - weight) * neutral_disk.in_profile.cross_section.area
+    neutral_cross_section = weight * neutral_disk.out_profile.cross_section_area + (
+            1 - weight) * neutral_disk.in_profile.cross_section_area
 
-    return neutral_velocity * neutral_cross_section / self.cross_section.area
+    return neutral_velocity * neutral_cross_section / self.cross_section_area
 
 
 @RollPass.OutProfile.velocity
 def rp_out_velocity(self: RollPass.OutProfile):
     return self.roll_pass.disk_elements[-1].out_profile.velocity
+
+
+@Rotator.OutProfile.pillar_widths(tryfirst=True)
+def rotator_out_pillar_widths_adaptive(self: Rotator.OutProfile):
+    # refined where the in contour or the contour predicted behind the roll gap is steep,
+    # with pillar boundaries on the lateral contact boundaries predicted by sweeping the contour without spreading
+    if self.rotator.pillar_type.lower() == "adaptive":
+        try:
+            rp = self.rotator.next_roll_pass
+        except (ValueError, IndexError):  # no roll pass following
+            return None
+
+        if not isinstance(rp, RollPass):
+            return None
+
+        # entry point of the roll pass for this profile, without touching the roll pass itself
+        scratch = copy.deepcopy(rp)
+        scratch.in_profile = scratch.InProfile(scratch, self)
+        with np.errstate(invalid="ignore"):
+            contact_length = -type(scratch).entry_point.get_result(scratch)
+
+        if not np.isfinite(contact_length):  # profile not yet rotated in the first iteration of the rotator
+            return None
+
+        x = -contact_length + contact_length / rp.disk_element_count * np.arange(1, rp.disk_element_count + 1)
+
+        pillar_count = self.rotator.pillar_count
+        z = adaptive_sampling(self.width, pillar_count)
+        depths = sweep.contour_surface_depths(rp.roll, x[:, np.newaxis], z)
+        heights = sweep.pillar_height_sweep(chord_height_table(self.cross_section)(z), depths, rp.gap)
+
+        density = np.maximum(height_refinement_density(z, heights[0]), height_refinement_density(z, heights[-1]))
+        widths = adaptive_pillar_widths(z, density, self.width, pillar_count)
+        return aligned_pillar_widths(widths, sweep.contact_transitions(z, heights[:-1], depths, rp.gap))
@@ -1,32 +1,35 @@
 import numpy as np
-from scipy.optimize import root_scalar
 
 from pyroll.core import RollPass
+from .. import contacts, sweep
+from ..contacts import recorded_pillars_in_contact
+from ..stacking import stacked
+from ..surface_table import disk_surface_depths
 
 
-@RollPass.Roll.total_pillar_contact_lengths
-def total_pillar_contact_lengths(self: RollPass.Roll):
-    contact_lengths = np.zeros_like(self.roll_pass.in_profile.pillars)
-
-    for de in self.roll_pass.disk_elements:
-        for i, pillars in enumerate(de.in_profile.pillars):
-            if de.pillars_in_contact[i]:
-                contact_lengths[i] += de.length
+@RollPass.Roll.pillar_contact_totals
+def pillar_contact_totals(self: RollPass.Roll):
+    rp = self.roll_pass
+    disk_elements = rp.disk_elements
 
-    return contact_lengths
+    return contacts.pillar_contact_totals(
+        contacts=stacked(rp, "pillars_in_contact"),
+        lengths=np.array([de.length for de in disk_elements]),
+        in_widths=np.array([de.in_profile.pillar_widths for de in disk_elements]),
+        out_widths=np.array([de.out_profile.pillar_widths for de in disk_elements]),
+        in_x=np.array([de.in_profile.x for de in disk_elements]),
+        out_x=np.array([de.out_profile.x for de in disk_elements]),
+    )
 
 
-@RollPass.Roll.total_pillar_contact_areas
-def roll_contact_area(self: RollPass.Roll):
-    contact_areas = np.zeros_like(self.roll_pass.in_profile.pillars)
+@RollPass.Roll.total_pillar_contact_lengths
+def total_pillar_contact_lengths(self: RollPass.Roll):
+    return self.pillar_contact_totals.lengths
 
-    for de in self.roll_pass.disk_elements:
-        for i, pillars in enumerate(de.in_profile.pillars):
-            if de.pillars_in_contact[i]:
-                area = (de.in_profile.pillar_widths[i] + de.out_profile.pillar_widths[i]) / 2 * de.length
-                contact_areas[i] += area
 
-    return contact_areas
+@RollPass.Roll.total_pillar_contact_areas
+def total_pillar_contact_areas(self: RollPass.Roll):
+    return self.pillar_contact_totals.areas
 
 
 @RollPass.Roll.contact_area
@@ -34,35 +37,48 @@ def roll_contact_area(self: RollPass.Roll):
     return self.roll_pass.contact_area / 2
 
 
-@RollPass.Roll.pillar_entry_angles
-def pillar_entry_angles(self: RollPass.Roll):
+@RollPass.Roll.pillar_local_radii
+def pillar_local_radii(self: RollPass.Roll):
+    return self.max_radius - disk_surface_depths(self, 0, self.roll_pass.in_profile.pillars)
+
+
+@RollPass.Roll.pillar_entries
+def pillar_entries(self: RollPass.Roll):
     rp = self.roll_pass
+    x = np.append(self.surface_x[self.surface_x < 0], 0)
+    depths = self.surface_interpolation(x, rp.in_profile.pillars)
+    points, contacts = sweep.pillar_entry_points(x, depths, rp.in_profile.pillar_heights, rp.gap)
+
+    # the sweep at the in profile's pillars is the first guess until all disk elements have recorded their contacts
+    masks = recorded_pillars_in_contact(rp)
+    if masks is None:
+        return sweep.PillarEntries(points, contacts)
 
-    entry_points_sol = []
-    for center, height in zip(rp.in_profile.pillars, rp.in_profile.pillar_heights):
-        try:
-            sol = root_scalar(lambda x: height - rp.gap - 2 * self.surface_interpolation(x, center),
-                              x0=rp.entry_point * 0.9,
-                              x1=rp.entry_point * 1.1)
+    disk_contacts = np.any(masks, axis=0)
+    first_rows = np.argmax(masks, axis=0)
 
-            entry_points_sol.append(sol.root)
+    # pillars getting in contact only after spreading enter within their first disk element in contact
+    for i in np.unique(first_rows[disk_contacts & ~contacts]):
+        de = rp.disk_elements[i]
+        late = disk_contacts & ~contacts & (first_rows == i)
+        points[late] = sweep.disk_entry_points(
+            self, de.in_profile.x, de.out_profile.x,
+            de.out_profile.pillars[late], de.in_profile.pillar_heights[late], rp.gap
+        )
 
-        except ValueError:
-            entry_points_sol.append(0)
+    return sweep.PillarEntries(np.where(disk_contacts, points, 0), disk_contacts)
 
-    entry_points = []
-    for points in entry_points_sol:
-        if isinstance(points, np.ndarray):
-            entry_points.append(points.flatten()[0])
-        else:
-            entry_points.append(points)
 
-    local_roll_radii = np.concatenate(
-        [self.max_radius - self.surface_interpolation(0, center)
-         for center in rp.in_profile.pillars],
-        axis=0).flatten()
+@RollPass.Roll.pillar_entry_points
+def pillar_entry_points(self: RollPass.Roll):
+    return self.pillar_entries.points
 
-    entry_angles = np.asarray([np.arcsin(entry_point / local_radius) for entry_point, local_radius in
-                    zip(entry_points, local_roll_radii)])
 
-    return entry_angles
+@RollPass.Roll.pillar_entry_contacts
+def pillar_entry_contacts(self: RollPass.Roll):
+    return self.pillar_entries.contacts
+
+
+@RollPass.Roll.pillar_entry_angles
+def pillar_entry_angles(self: RollPass.Roll):
+    return np.arcsin(self.pillar_entry_points / self.pillar_local_radii)
@@ -1,66 +1,57 @@
 import numpy as np
 
 from pyroll.core import RollPass
+from ..acceleration import spread_correction_accelerator, spread_correction_controller
+from ..stacking import stacked
+from ..warm_start import roll_pass_warm_start_store
 
 
 @RollPass.total_pillar_draughts
 def total_pillar_draughts(self: RollPass):
     if self.disk_elements:
-        p_draughts = [de.pillar_draughts for de in self.disk_elements]
-        return np.prod(p_draughts, axis=0)
+        return np.prod(stacked(self, "pillar_draughts"), axis=0)
 
 
 @RollPass.total_pillar_spreads
 def total_pillar_spreads(self: RollPass):
     if self.disk_elements:
-        p_spreads = [de.pillar_spreads for de in self.disk_elements]
-        return np.prod(p_spreads, axis=0)
+        return np.prod(stacked(self, "pillar_spreads"), axis=0)
 
 
 @RollPass.total_pillar_elongations
 def total_pillar_elongations(self: RollPass):
     if self.disk_elements:
-        p_elongations = [de.pillar_elongations for de in self.disk_elements]
-        return np.prod(p_elongations, axis=0)
+        return np.prod(stacked(self, "pillar_elongations"), axis=0)
 
 
 @RollPass.total_pillar_log_draughts
 def total_pillar_log_draughts(self: RollPass):
-    p_log_draughts = [de.pillar_log_draughts for de in self.disk_elements]
-    return np.sum(p_log_draughts, axis=0)
+    return np.sum(stacked(self, "pillar_log_draughts"), axis=0)
 
 
 @RollPass.total_pillar_log_spreads
 def total_pillar_log_spreads(self: RollPass):
-    p_log_spreads = [de.pillar_log_spreads for de in self.disk_elements]
-    return np.sum(p_log_spreads, axis=0)
+    return np.sum(stacked(self, "pillar_log_spreads"), axis=0)
 
 
 @RollPass.total_pillar_log_elongations
 def total_pillar_log_elongations(self: RollPass):
-    p_log_elongations = [de.pillar_log_elongations for de in self.disk_elements]
-    return np.sum(p_log_elongations, axis=0)
+    return np.sum(stacked(self, "pillar_log_elongations"), axis=0)
 
 
 @RollPass.total_pillar_strains
 def total_pillar_strains(self: RollPass):
-    p_strains = [de.pillar_strains for de in self.disk_elements]
-    return np.sum(p_strains, axis=0)
+    return np.sum(stacked(self, "pillar_strains"), axis=0)
 
 
 @RollPass.total_pillar_strain_rates
 def total_pillar_strain_rates(self: RollPass):
-    local_roll_radii = np.concatenate(
-        [self.roll.max_radius - self.roll.surface_interpolation(0, center) for center in
-         self.in_profile.pillars],
-        axis=0).flatten()
-
-    return self.velocity * self.total_pillar_strains / local_roll_radii
+    return self.velocity * self.total_pillar_strains / self.roll.pillar_local_radii
 
 
 @RollPass.DiskElement.contact_area
 def disk_contact_area(self: RollPass.DiskElement):
-    pillar_contact_widths = self.in_profile.pillar_widths[self.pillars_in_contact] + self.out_profile.pillar_widths[self.pillars_in_contact]
+    pillar_contact_widths = (self.in_profile.pillar_widths + self.out_profile.pillar_widths) * self.pillars_in_contact
     contact_width = np.sum(pillar_contact_widths) - pillar_contact_widths[0] / 2  # /2 missing since pillars only on half profile
     return contact_width * self.length * 2  # *2 since two rolls
 
@@ -99,7 +90,7 @@ def disk_in_velocity(self: RollPass.DiskElement.InProfile):
 @RollPass.DiskElement.OutProfile.velocity
 def disk_out_velocity(self: RollPass.DiskElement.OutProfile):
     de = self.disk_element
-    return de.in_profile.velocity * de.in_profile.cross_section.area / self.cross_section.area
+    return de.in_profile.velocity * de.in_profile.cross_section_area / self.cross_section_area
 
 
 @RollPass.mean_elongation
@@ -109,6 +100,12 @@ def mean_elongation(self: RollPass):
 
 @RollPass.pillar_spread_correction_coefficients
 def pillar_spread_correction_coefficients(self: RollPass):
+    store = roll_pass_warm_start_store(self)
+    if self.__dict__.pop("_warm_start_pending", False) and store is not None:
+        coefficients = store.lookup(self)
+        if coefficients is not None:
+            return coefficients
+
     if self.disk_elements[-1].out_profile is None:
         return 1
 
@@ -121,13 +118,22 @@ def pillar_spread_correction_coefficients(self: RollPass):
                 self.pillar_spread_correction_coefficients * correction_coefficients - self.pillar_spread_correction_coefficients) * relaxation_factor / self.disk_element_count
 
     corr_exp = updated_correction_coefficients_to_current_iteration_loop()
-    coeff = calculate_coefficients(correction_coefficients=corr_exp)
+    current = np.broadcast_to(self.pillar_spread_correction_coefficients, np.shape(corr_exp))
+
+    iteration = len(self.convergence_history)
+    controller = spread_correction_controller(self)
+    relaxation_factor = controller.update(corr_exp - 1, iteration)
+    if controller.converged:
+        coeff = np.array(current)
+    else:
+        coeff = calculate_coefficients(correction_coefficients=corr_exp, relaxation_factor=relaxation_factor)
+        coeff = spread_correction_accelerator(self).update(current, coeff, iteration)
+
     return coeff
 
 @RollPass.pillar_corner_correction_strains
 def pillar_corner_correction_strains(self: RollPass):
-    from ... import Config
-    if Config.CORNER_CORRECTION:
+    if self.corner_correction:
         return np.tan(self.roll.pillar_entry_angles) ** 2 / (2 * np.sqrt(3))
     else:
         return np.zeros_like(self.in_profile.pillars)
\ No newline at end of file
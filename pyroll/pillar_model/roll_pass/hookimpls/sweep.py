@@ -0,0 +1,54 @@
+import numpy as np
+
+from pyroll.core import RollPass
+from ...config import Config
+from ..pillar_disk_element import PillarDiskElement
+from ..contacts import disk_element_index
+from ..sweep import surface_depths, pillar_height_sweep
+
+
+@RollPass.disk_pillar_surface_depths
+def disk_pillar_surface_depths(self: RollPass):
+    if Config.FAST_PILLAR_PASS:
+        x = self.in_profile.x + np.cumsum([de.length for de in self.disk_elements])
+
+        # out profiles are kept between iterations, so the pillar positions of the last iteration are used
+        pillars = np.array([
+            de.out_profile.pillars if de.out_profile else self.in_profile.pillars
+            for de in self.disk_elements
+        ])
+
+        return surface_depths(self.roll, x[:, np.newaxis], pillars)
+
+
+@RollPass.disk_pillar_heights
+def disk_pillar_heights(self: RollPass):
+    if Config.FAST_PILLAR_PASS:
+        return pillar_height_sweep(self.in_profile.pillar_heights, self.disk_pillar_surface_depths, self.gap)
+
+
+@RollPass.disk_pillars_in_contact
+def disk_pillars_in_contact(self: RollPass):
+    if Config.FAST_PILLAR_PASS:
+        return self.disk_pillar_heights[:-1] > 2 * self.disk_pillar_surface_depths + self.gap
+
+
+@PillarDiskElement.pillars_in_contact(tryfirst=True)
+def swept_pillars_in_contact(self: PillarDiskElement):
+    if Config.FAST_PILLAR_PASS:
+        return self.roll_pass.disk_pillars_in_contact[disk_element_index(self)]
+
+
+@PillarDiskElement.OutProfile.pillar_heights(tryfirst=True)
+def swept_pillar_heights(self: PillarDiskElement.OutProfile):
+    if Config.FAST_PILLAR_PASS:
+        de = self.disk_element
+        return de.roll_pass.disk_pillar_heights[disk_element_index(de) + 1]
+
+
+@PillarDiskElement.pillar_draughts(tryfirst=True)
+def swept_pillar_draughts(self: PillarDiskElement):
+    if Config.FAST_PILLAR_PASS:
+        heights = self.roll_pass.disk_pillar_heights
+        i = disk_element_index(self)
+        return heights[i + 1] / heights[i]
@@ -2,6 +2,8 @@ import pyroll
 import numpy as np
 
 from pyroll.core import RollPass, Hook
+from .contacts import PillarContactTotals
+from .sweep import PillarEntries
 
 RollPass.total_pillar_elongations = Hook[np.ndarray]()
 """Array of total elongation for each pillar for a roll pass."""
@@ -27,6 +29,9 @@ RollPass.total_pillar_strains = Hook[np.ndarray]()
 RollPass.total_pillar_strain_rates = Hook[np.ndarray]()
 """Array of total strain rates for each pillar for a roll pass."""
 
+RollPass.Roll.pillar_contact_totals = Hook[PillarContactTotals]()
+"""Totals of the pillar contacts over all disk elements (lengths, areas and first and last contact positions)."""
+
 RollPass.Roll.total_pillar_contact_lengths = Hook[np.ndarray]()
 """Array of total contact length of each pillar in contact."""
 
@@ -36,6 +41,18 @@ RollPass.Roll.total_pillar_contact_areas = Hook[np.ndarray]()
 RollPass.Roll.pillar_entry_angles = Hook[np.ndarray]()
 """Array of entry angles of each pillar in contact."""
 
+RollPass.Roll.pillar_local_radii = Hook[np.ndarray]()
+"""Array of the local roll radii at the pillars of the roll pass' in profile."""
+
+RollPass.Roll.pillar_entries = Hook[PillarEntries]()
+"""Entries of the pillars into the roll gap (entry points and contact mask), consistent with the pillar contacts of the disk elements."""
+
+RollPass.Roll.pillar_entry_points = Hook[np.ndarray]()
+"""Array of x-coordinates where the pillars get in contact with the roll, 0 for pillars never in contact."""
+
+RollPass.Roll.pillar_entry_contacts = Hook[np.ndarray]()
+"""Array of booleans indicating which pillars get in contact with the roll in any disk element."""
+
 RollPass.mean_elongation = Hook[float]()
 """Mean elongation of the profile in the roll pass."""
 
@@ -45,6 +62,15 @@ RollPass.pillar_spread_correction_coefficients = Hook[np.ndarray]()
 RollPass.pillar_corner_correction_strains = Hook[np.ndarray]()
 """Strain of the pillars due to shearing while entering the roll gap."""
 
+RollPass.disk_pillar_surface_depths = Hook[np.ndarray]()
+"""Array of roll surface depths at the pillars of all disk elements' out profiles (fast pillar pass mode)."""
+
+RollPass.disk_pillar_heights = Hook[np.ndarray]()
+"""Array of pillar heights at the entry and at all disk elements' out profiles (fast pillar pass mode)."""
+
+RollPass.disk_pillars_in_contact = Hook[np.ndarray]()
+"""Array of contact flags of the pillars in all disk elements (fast pillar pass mode)."""
+
 pyroll.core.root_hooks.add(pyroll.core.RollPass.total_pillar_elongations)
 pyroll.core.root_hooks.add(pyroll.core.RollPass.total_pillar_spreads)
 pyroll.core.root_hooks.add(pyroll.core.RollPass.total_pillar_draughts)
@@ -0,0 +1,11 @@
+import numpy as np
+
+from pyroll.core import RollPass
+
+
+def stacked(roll_pass: RollPass, name: str) -> np.ndarray:
+    """
+    Get the values of a disk element hook for all disk elements of a roll pass as 2-D array
+    of shape ``(disk_element_count, pillar_count)``.
+    """
+    return np.array([getattr(de, name) for de in roll_pass.disk_elements])
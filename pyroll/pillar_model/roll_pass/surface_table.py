@@ -0,0 +1,109 @@
+import numpy as np
+
+from pyroll.core import RollPass
+
+from ..config import Config
+
+TABLE_ROW_COUNT = 1024
+"""
+Maximum count of rows held in a :py:class:`RollSurfaceTable`, it is cleared when exceeded,
+as the disk elements' positions change with the contact length in each iteration.
+"""
+
+
+class RollSurfaceTable:
+    """
+    Lookup table of the roll surface depths over the roll's z-grid at the x-coordinates looked up so far
+    (the disk elements' positions).
+
+    Each row is the surface interpolated linearly in x, so the depths at arbitrary z are found by a 1-D linear
+    interpolation of a row, which equals the bilinear interpolation of ``Roll.surface_interpolation``.
+    As the rows cover the whole z-grid, they stay valid when the pillars move,
+    and as the gap is added by the callers, they only depend on the roll surface.
+    """
+
+    def __init__(self, roll: RollPass.Roll):
+        self.max_radius = roll.max_radius
+        """Maximum radius of the roll the table was built from."""
+
+        self.contour_points = roll.contour_points
+        """Contour points of the roll the table was built from."""
+
+        self.surface_x = roll.surface_x
+        """x-grid of the roll surface the table was built from."""
+
+        self.surface_z = roll.surface_z
+        """z-grid of the roll surface the table was built from."""
+
+        self.surface_y = roll.surface_y
+        """Depths of the roll surface the table was built from of shape ``(len(surface_z), len(surface_x))``."""
+
+        self.rows: dict[float, np.ndarray] = dict()
+        """Mapping of x-coordinates to the depths over the z-grid."""
+
+    def is_valid(self, roll: RollPass.Roll) -> bool:
+        """
+        Whether the table was built from the current surface of the roll.
+        The surface depths are not compared themselves, as they are determined by the contour and the grid.
+        """
+        return self.max_radius == roll.max_radius and all(
+            own is new or (own.shape == new.shape and np.array_equal(own, new))
+            for own, new in [(self.contour_points, roll.contour_points), (self.surface_x, roll.surface_x)]
+        )
+
+    def row(self, x: float) -> np.ndarray:
+        """
+        Get the roll surface depths over the z-grid at ``x``.
+
+        :raises ValueError: if ``x`` is outside the x-grid
+        """
+        x = float(x)
+        row = self.rows.get(x, None)
+
+        if row is None:
+            if not self.surface_x[0] <= x <= self.surface_x[-1]:
+                raise ValueError(f"x = {x} is outside the roll surface grid.")
+
+            j = min(int(np.searchsorted(self.surface_x, x, side="right")) - 1, len(self.surface_x) - 2)
+            t = (x - self.surface_x[j]) / (self.surface_x[j + 1] - self.surface_x[j])
+            row = (1 - t) * self.surface_y[:, j] + t * self.surface_y[:, j + 1]
+
+            if len(self.rows) >= TABLE_ROW_COUNT:
+                self.rows.clear()
+            self.rows[x] = row
+
+        return row
+
+    def depths(self, x: float, z: np.ndarray) -> np.ndarray:
+        """
+        Get the roll surface depths at ``x`` and the z-coordinates ``z``.
+
+        :raises ValueError: if ``x`` or ``z`` are outside the grid
+        """
+        z = np.asarray(z)
+        if z.size and (np.min(z) < self.surface_z[0] or np.max(z) > self.surface_z[-1]):
+            raise ValueError("z-coordinates are outside the roll surface grid.")
+
+        return np.interp(z, self.surface_z, self.row(x))
+
+
+def roll_surface_table(roll: RollPass.Roll) -> RollSurfaceTable:
+    """Get the surface table of a roll, creating it if not present or built from a different surface."""
+    table = roll.__dict__.get("_roll_surface_table", None)
+
+    if table is None or not table.is_valid(roll):
+        table = RollSurfaceTable(roll)
+        roll._roll_surface_table = table
+
+    return table
+
+
+def disk_surface_depths(roll: RollPass.Roll, x: float, z: np.ndarray) -> np.ndarray:
+    """
+    Get the roll surface depths at ``x`` and the z-coordinates ``z`` as 1-D array,
+    from the roll's surface table if enabled, otherwise from ``Roll.surface_interpolation``.
+    """
+    if Config.ROLL_SURFACE_TABLE:
+        return roll_surface_table(roll).depths(x, z)
+
+    return roll.surface_interpolation(x, z).reshape(np.shape(z))
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from pyroll.core import RollPass
+from scipy.interpolate import interpn
+
+
+def surface_depths(roll: RollPass.Roll, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Interpolate the roll surface pointwise at the coordinates ``(x, z)``.
+    Other than ``Roll.surface_interpolation`` no mesh of ``x`` and ``z`` is built,
+    so the result has the broadcast shape of ``x`` and ``z``.
+
+    :param roll: the roll to interpolate the surface of
+    :param x: x-coordinates (length direction)
+    :param z: z-coordinates (width direction)
+    """
+    x, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(z, dtype=float))
+    xz = np.column_stack([x.ravel(), z.ravel()])
+    y = interpn((roll.surface_x, roll.surface_z), roll.surface_y.T, xz)
+    return y.reshape(x.shape)
+
+
+def pillar_height_sweep(in_heights: np.ndarray, depths: np.ndarray, gap: float) -> np.ndarray:
+    """
+    Sweep the pillar heights through all disk elements of a roll pass at once.
+    A pillar is in contact within a disk element if it is higher than the roll gap there and takes the gap's height,
+    so the heights are the running minimum of the incoming heights and the gap heights.
+
+    Leading axes (e.g. of an ensemble of profiles) are swept independently.
+
+    :param in_heights: array of pillar heights at the entry of the roll pass of shape ``(..., pillar_count)``
+    :param depths: array of the roll surface depths at the pillars of the disk elements' out profiles
+        of shape ``(..., disk_element_count, pillar_count)``
+    :param gap: the roll gap
+    :return: array of pillar heights of shape ``(..., disk_element_count + 1, pillar_count)``,
+        whose first row are the incoming heights
+    """
+    in_heights = np.asarray(in_heights)
+    return np.minimum.accumulate(np.concatenate([in_heights[..., np.newaxis, :], 2 * depths + gap], axis=-2), axis=-2)
+
+
+def contact_transitions(z: np.ndarray, heights: np.ndarray, depths: np.ndarray, gap: float) -> np.ndarray:
+    """
+    Find the z-coordinates where the contact with the roll begins or ends across the width within the disk elements.
+    The transitions are interpolated linearly in the clearance between the roll surface and the heights,
+    ending contact at the last of ``z`` (the profile's edge) is no transition.
+
+    :param z: ascending z-coordinates
+    :param heights: array of the heights at ``z`` entering the disk elements of shape ``(disk_element_count, len(z))``,
+        as of :py:func:`pillar_height_sweep` without its last row
+    :param depths: array of the roll surface depths at ``z`` at the disk elements' out profiles
+        of shape ``(disk_element_count, len(z))``
+    :param gap: the roll gap
+    :return: array of the transitions of all disk elements
+    """
+    clearances = heights - gap - 2 * depths
+    disks, j = np.nonzero(np.diff(clearances > 0, axis=1)[:, :-1])
+    c1 = clearances[disks, j]
+    c2 = clearances[disks, j + 1]
+    return z[j] + c1 / (c1 - c2) * (z[j + 1] - z[j])
+
+
+@dataclass
+class PillarEntries:
+    """Entries of the pillars into the roll gap."""
+
+    points: np.ndarray
+    """Array of x-coordinates where the pillars get in contact with the roll, 0 for pillars never in contact."""
+
+    contacts: np.ndarray
+    """Array of booleans indicating which pillars get in contact with the roll in any disk element."""
+
+
+def pillar_entry_points(x: np.ndarray, depths: np.ndarray, heights: np.ndarray, gap: float):
+    """
+    Find the points where the pillars get in contact with the roll on the entry side.
+    Since the roll surface is interpolated linearly between its grid points in rolling direction,
+    the entry points are found exactly by bracketing the contact within the grid intervals
+    and solving linearly within the bracket, for all pillars at once.
+
+    :param x: ascending array of the x-coordinates of the roll surface grid up to 0
+    :param depths: array of the roll surface depths at the pillars and the x-coordinates
+        of shape ``(pillar_count, len(x))``
+    :param heights: array of the pillar heights
+    :param gap: the roll gap
+    :return: tuple of the array of entry points, which are 0 for pillars never in contact,
+        and the array of booleans indicating which pillars get in contact with the roll
+    """
+    clearances = heights[:, np.newaxis] - gap - 2 * depths
+    contacts = clearances[:, -1] > 0
+
+    # last grid point before the contact, pillars in contact at the whole grid enter at its start
+    below = clearances <= 0
+    j = np.where(below.any(axis=1), x.size - 1 - np.argmax(below[:, ::-1], axis=1), 0)
+    j = np.minimum(j, x.size - 2)
+
+    rows = np.arange(len(clearances))
+    c1 = clearances[rows, j]
+    c2 = clearances[rows, j + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.where(c1 < 0, -c1 / (c2 - c1), 0), 0, 1)
+    entry_points = x[j] + t * (x[j + 1] - x[j])
+
+    return np.where(contacts, entry_points, 0), contacts
+
+
+def disk_entry_points(
+        roll: RollPass.Roll, in_x: float, out_x: float, z: np.ndarray, heights: np.ndarray, gap: float
+) -> np.ndarray:
+    """
+    Find the points where pillars get in contact with the roll within a disk element,
+    by :py:func:`pillar_entry_points` over the roll surface grid points between the disk element's in and out profile.
+
+    :param roll: the roll
+    :param in_x: x-coordinate of the disk element's in profile
+    :param out_x: x-coordinate of the disk element's out profile
+    :param z: positions of the pillars at the disk element's out profile
+    :param heights: heights of the pillars at the disk element's in profile
+    :param gap: the roll gap
+    :return: the entry points, ``out_x`` for pillars not getting in contact up to it
+    """
+    x = np.unique(np.concatenate([[in_x], roll.surface_x[(roll.surface_x > in_x) & (roll.surface_x < out_x)], [out_x]]))
+    depths = surface_depths(roll, x[np.newaxis, :], np.asarray(z)[:, np.newaxis])
+    points, contacts = pillar_entry_points(x, depths, np.asarray(heights), gap)
+    return np.where(contacts, points, out_x)
+
+
+def contour_surface_depths(roll: RollPass.Roll, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Get the roll surface depths at the coordinates ``(x, z)`` computed exactly from the local roll radii at ``z``,
+    so that other than :py:func:`surface_depths` no surface grid is needed and ``x`` is not bounded by it.
+    The result has the broadcast shape of ``x`` and ``z``.
+
+    :param roll: the roll
+    :param x: x-coordinates (length direction) within the local roll radii
+    :param z: z-coordinates within the roll's contour
+    """
+    local_radii = roll.max_radius - np.interp(z, *roll.contour_points.T)
+    return roll.max_radius - np.sqrt(local_radii ** 2 - np.asarray(x) ** 2)
+
+
+def contour_entry_points(roll: RollPass.Roll, z: np.ndarray, heights: np.ndarray, gap: float) -> np.ndarray:
+    """
+    Get the x-coordinates where the roll surface first touches a contour of given heights,
+    computed exactly from the local roll radii at ``z``.
+
+    :param roll: the roll
+    :param z: z-coordinates within the roll's contour
+    :param heights: heights of the contour at ``z``
+    :param gap: the roll gap
+    :return: the entry points (negative), 0 where the roll does not touch the contour
+    """
+    local_radii = roll.max_radius - np.interp(z, *roll.contour_points.T)
+    distances = roll.max_radius - (heights - gap) / 2
+    return -np.sqrt(np.maximum(local_radii ** 2 - distances ** 2, 0))
@@ -0,0 +1,309 @@
+import atexit
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from pyroll.core import RollPass
+
+from ..config import Config
+
+
+def _bin(value: float, resolution: float) -> str:
+    """
+    Label of the logarithmic bin of relative width ``resolution`` the value falls in,
+    values not greater than zero (e.g. a zero gap or the depth of a flat groove) share the bin ``"0"``.
+    """
+    if value <= 0:
+        return "0"
+    return f"b{int(np.round(np.log(value) / np.log1p(resolution)))}"
+
+
+class WarmStartStatistics:
+    """Statistics of the warm start store usage."""
+
+    def __init__(self):
+        self.lookups = 0
+        """Count of lookups."""
+
+        self.hits = 0
+        """Count of lookups answered with stored coefficients of the same pillar count."""
+
+        self.interpolations = 0
+        """Count of lookups answered by interpolating stored coefficients of another pillar count."""
+
+        self.warm_iterations = []
+        """Iteration counts of the roll pass solutions started from stored coefficients."""
+
+        self.cold_iterations = []
+        """Iteration counts of the roll pass solutions started without stored coefficients."""
+
+    @property
+    def misses(self) -> int:
+        """Count of lookups without stored coefficients."""
+        return self.lookups - self.hits - self.interpolations
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered with stored or interpolated coefficients."""
+        return (self.hits + self.interpolations) / self.lookups if self.lookups else 0.
+
+    @property
+    def iterations_saved(self) -> float:
+        """Estimate of the iterations saved by warm starts, based on the mean iteration count of cold starts."""
+        if not self.cold_iterations or not self.warm_iterations:
+            return 0.
+        return float(np.mean(self.cold_iterations) - np.mean(self.warm_iterations)) * len(self.warm_iterations)
+
+    def __repr__(self):
+        return (
+            f"WarmStartStatistics(lookups={self.lookups}, hits={self.hits}, interpolations={self.interpolations}, "
+            f"misses={self.misses}, hit_rate={self.hit_rate:.3f}, iterations_saved={self.iterations_saved:.1f})"
+        )
+
+
+class WarmStartStore:
+    """
+    Store of converged pillar spread correction coefficients used as initial guess of later roll pass solutions.
+    Entries are keyed by a fingerprint of the groove type, the groove's usable width and depth, the in profile's width,
+    height and area and the gap, each binned with a relative resolution, and by the pillar count.
+    Coefficients are stored together with the pillar positions relative to the profile's half width,
+    so that they can be interpolated to other pillar counts or pillar types.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, resolution: float = 0.02):
+        """
+        :param path: JSON file to load the entries from and to write them to, if ``None`` the store is in-memory only
+        :param resolution: relative width of the fingerprint bins
+        """
+        self.path = Path(path) if path is not None else None
+        self.resolution = resolution
+
+        self.entries = dict()
+        """Mapping of fingerprints to mappings of pillar counts to the stored positions and coefficients."""
+
+        self.statistics = WarmStartStatistics()
+        """Statistics of this store's usage."""
+
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def fingerprint(self, roll_pass: RollPass) -> str:
+        """Get the fingerprint of a roll pass."""
+        in_profile = roll_pass.in_profile
+        groove = roll_pass.roll.groove
+        return "/".join([type(groove).__qualname__] + [
+            _bin(value, self.resolution) for value in [
+                groove.usable_width,
+                groove.depth,
+                in_profile.width,
+                in_profile.height,
+                in_profile.cross_section.area,
+                roll_pass.gap,
+            ]
+        ])
+
+    @staticmethod
+    def _positions(roll_pass: RollPass) -> np.ndarray:
+        in_profile = roll_pass.in_profile
+        return in_profile.pillars / in_profile.pillar_boundaries[-1]
+
+    def lookup(self, roll_pass: RollPass) -> Optional[np.ndarray]:
+        """
+        Get the initial guess of the correction coefficients for a roll pass.
+        Stored coefficients of the same pillar count are preferred, otherwise those of the nearest pillar count
+        are interpolated.
+
+        :return: the coefficients, ``None`` if no entry matches the roll pass
+        """
+        self.statistics.lookups += 1
+        entries = self.entries.get(self.fingerprint(roll_pass), None)
+        positions = self._positions(roll_pass)
+        coefficients = None
+
+        if entries:
+            count = len(positions)
+            nearest = min(entries, key=lambda c: abs(c - count))
+
+            if nearest == count:
+                self.statistics.hits += 1
+            else:
+                self.statistics.interpolations += 1
+
+            entry = entries[nearest]
+            coefficients = np.interp(positions, entry["positions"], entry["coefficients"])
+
+        iterations = self.statistics.cold_iterations if coefficients is None else self.statistics.warm_iterations
+        iterations.append(0)
+        roll_pass._warm_start_run = (iterations, len(iterations) - 1, len(roll_pass.convergence_history))
+
+        return coefficients
+
+    def record(self, roll_pass: RollPass, coefficients: np.ndarray):
+        """Store correction coefficients for a roll pass."""
+        positions = self._positions(roll_pass)
+        entries = self.entries.setdefault(self.fingerprint(roll_pass), dict())
+        entries[len(positions)] = dict(
+            positions=np.asarray(positions, dtype=float),
+            coefficients=np.broadcast_to(coefficients, positions.shape).astype(float),
+        )
+
+    def finish(self, roll_pass: RollPass):
+        """
+        Count the iterations of a finished roll pass solution
+        and store its correction coefficients if the solution converged.
+        """
+        run = roll_pass.__dict__.get("_warm_start_run", None)
+        if run is not None:
+            iterations, index, start = run
+            iterations[index] = len(roll_pass.convergence_history) - start
+            del roll_pass._warm_start_run
+
+        if solution_converged(roll_pass):
+            self.record(roll_pass, roll_pass.pillar_spread_correction_coefficients)
+
+    def update(self, entries: dict):
+        """Add entries in the form of :py:attr:`entries`, replacing those of equal fingerprint and pillar count."""
+        for fingerprint, counts in entries.items():
+            self.entries.setdefault(fingerprint, dict()).update(counts)
+
+    def _read(self) -> dict:
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        return {
+            fingerprint: {
+                int(count): {k: np.asarray(v, dtype=float) for k, v in entry.items()}
+                for count, entry in entries.items()
+            }
+            for fingerprint, entries in data.items()
+        }
+
+    def load(self):
+        """Load the entries from the store's file."""
+        self.entries = self._read()
+
+    def write(self):
+        """
+        Write the entries to the store's file, merged with the entries currently in the file,
+        preferring the own entries for equal fingerprints and pillar counts.
+        The file is replaced atomically, so readers never see a partial file.
+        Entries written by another process between reading and replacing the file are lost,
+        so concurrent writers should use separate files.
+        """
+        if self.path.exists():
+            for fingerprint, entries in self._read().items():
+                own = self.entries.setdefault(fingerprint, dict())
+                for count, entry in entries.items():
+                    own.setdefault(count, entry)
+
+        data = {
+            fingerprint: {
+                str(count): {k: v.tolist() for k, v in entry.items()}
+                for count, entry in entries.items()
+            }
+            for fingerprint, entries in self.entries.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+
+def solution_converged(roll_pass: RollPass) -> bool:
+    """Whether the last solution of a roll pass stopped by reaching its iteration precision."""
+    history = roll_pass.convergence_history
+    return bool(history) and history[-1]["residuum"] <= roll_pass.iteration_precision
+
+
+_store: Optional[WarmStartStore] = None
+
+
+def _write_store():
+    if _store is not None and _store.path is not None:
+        _store.write()
+
+
+atexit.register(_write_store)
+
+
+def warm_start_store() -> WarmStartStore:
+    """
+    Get the global warm start store, creating it if not present or if ``Config.SPREAD_CORRECTION_WARM_START_FILE``
+    changed. A store backed by a file is written to it at interpreter exit.
+    """
+    global _store
+
+    path = Config.SPREAD_CORRECTION_WARM_START_FILE
+    path = Path(path) if path is not None else None
+    resolution = Config.SPREAD_CORRECTION_WARM_START_RESOLUTION
+
+    if _store is None or _store.path != path or _store.resolution != resolution:
+        _write_store()
+        _store = WarmStartStore(path, resolution)
+
+    return _store
+
+
+def reset_warm_start_store(entries: Optional[dict] = None) -> WarmStartStore:
+    """
+    Replace the global warm start store by a new one created from the current configuration,
+    without writing the old one to its file (e.g. one inherited by a forked worker process).
+
+    :param entries: initial entries of the new store in addition to those loaded from its file
+    """
+    global _store
+
+    path = Config.SPREAD_CORRECTION_WARM_START_FILE
+    _store = WarmStartStore(path, Config.SPREAD_CORRECTION_WARM_START_RESOLUTION)
+    if entries:
+        _store.update(entries)
+
+    return _store
+
+
+def roll_pass_warm_start_store(roll_pass: RollPass) -> Optional[WarmStartStore]:
+    """
+    Get the warm start store used by a roll pass: the one attached to it (e.g. by a multilevel solution)
+    or the global one if ``Config.SPREAD_CORRECTION_WARM_START`` is enabled.
+    """
+    store = roll_pass.__dict__.get("_warm_start_store", None)
+    if store is not None:
+        return store
+
+    if Config.SPREAD_CORRECTION_WARM_START:
+        return warm_start_store()
+
+    return None
+
+
+def warm_start_pre_processor(roll_pass: RollPass) -> None:
+    """
+    Pre-processor factory marking a roll pass to look up its correction coefficients in its warm start store
+    in the first iteration of the solution, also when the roll pass is solved again.
+    Only the side effect is needed, so no pre-processing unit is returned.
+    """
+    roll_pass._warm_start_pending = True
+
+
+RollPass.pre_processors.append(warm_start_pre_processor)
+
+
+def warm_start_post_processor(roll_pass: RollPass) -> None:
+    """
+    Post-processor factory recording the result of a roll pass solution in its warm start store.
+    Only the side effect is needed, so no post-processing unit is returned.
+    """
+    store = roll_pass_warm_start_store(roll_pass)
+    if store is not None:
+        store.finish(roll_pass)
+
+
+RollPass.post_processors.append(warm_start_post_processor)
@@ -0,0 +1,249 @@
+import logging
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from pyroll.core import PassSequence, Profile, RollPass
+from pyroll.core.config import ConfigValue
+
+from .config import Config
+from .roll_pass.warm_start import WarmStartStore, reset_warm_start_store, solution_converged, warm_start_store
+
+log = logging.getLogger(__name__)
+
+Variant = tuple[Union[PassSequence, RollPass], Profile]
+"""An unsolved unit and its incoming profile."""
+
+
+@dataclass
+class PassResult:
+    """Compact results of a solved roll pass, the arrays are per pillar of the out profile."""
+
+    label: str
+    """Label of the roll pass."""
+
+    pillars: np.ndarray
+    """Pillar positions of the out profile."""
+
+    pillar_heights: np.ndarray
+    """Pillar heights of the out profile."""
+
+    pillar_areas: np.ndarray
+    """Pillar areas of the out profile."""
+
+    total_pillar_strains: np.ndarray
+    """Total strains of the pillars."""
+
+    total_pillar_draughts: np.ndarray
+    """Total draughts of the pillars."""
+
+    total_pillar_spreads: np.ndarray
+    """Total spreads of the pillars."""
+
+    total_pillar_elongations: np.ndarray
+    """Total elongations of the pillars."""
+
+    roll_force: float
+    """The roll force."""
+
+    width: float
+    """Width of the out profile."""
+
+    height: float
+    """Height of the out profile."""
+
+    cross_section_area: float
+    """Cross-section area of the out profile."""
+
+    iteration_count: int
+    """Count of iterations of the roll pass solution."""
+
+    @classmethod
+    def from_roll_pass(cls, rp: RollPass) -> "PassResult":
+        """Extract the results of a solved roll pass."""
+        out_profile = rp.out_profile
+        return cls(
+            label=rp.label,
+            pillars=np.asarray(out_profile.pillars, dtype=float),
+            pillar_heights=np.asarray(out_profile.pillar_heights, dtype=float),
+            pillar_areas=np.asarray(out_profile.pillar_areas, dtype=float),
+            total_pillar_strains=np.asarray(rp.total_pillar_strains, dtype=float),
+            total_pillar_draughts=np.asarray(rp.total_pillar_draughts, dtype=float),
+            total_pillar_spreads=np.asarray(rp.total_pillar_spreads, dtype=float),
+            total_pillar_elongations=np.asarray(rp.total_pillar_elongations, dtype=float),
+            roll_force=float(rp.roll_force),
+            width=float(out_profile.width),
+            height=float(out_profile.height),
+            cross_section_area=float(out_profile.cross_section.area),
+            iteration_count=len(rp.convergence_history),
+        )
+
+
+@dataclass
+class VariantResult:
+    """Results of a solved variant."""
+
+    index: int
+    """Index of the variant in the sweep."""
+
+    parameters: Any
+    """Parameters the variant was built from."""
+
+    duration: float
+    """Wall time of the solution in seconds."""
+
+    passes: list[PassResult] = field(default_factory=list)
+    """Results of the roll passes in order, empty if the solution failed."""
+
+    error: Optional[str] = None
+    """Formatted traceback of the exception raised by the solution, ``None`` if it succeeded."""
+
+    warm_start_entries: dict = field(default_factory=dict)
+    """
+    Warm start entries of the converged roll passes in the form of ``WarmStartStore.entries``,
+    empty if ``Config.SPREAD_CORRECTION_WARM_START`` is disabled.
+    """
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the solution succeeded."""
+        return self.error is None
+
+
+def config_values() -> dict[str, Any]:
+    """Get the current values of all settings of ``pyroll.pillar_model.Config``."""
+    return {n: getattr(Config, n) for n, v in type(Config).__dict__.items() if isinstance(v, ConfigValue)}
+
+
+def _init_worker(config: dict[str, Any], warm_start_entries: dict, initializer: Optional[Callable[[], None]]):
+    Config.update(config)
+
+    if Config.SPREAD_CORRECTION_WARM_START:
+        reset_warm_start_store(warm_start_entries)
+
+    if initializer is not None:
+        initializer()
+
+
+def solve_variant(factory: Callable[[Any], Variant], index: int, parameters: Any) -> VariantResult:
+    """
+    Build a variant from its parameters, solve it and extract the results of its roll passes.
+    Exceptions are not raised, but recorded in the result.
+    """
+    start = time.perf_counter()
+
+    try:
+        unit, in_profile = factory(parameters)
+        unit.solve(in_profile)
+    except Exception:
+        return VariantResult(
+            index=index, parameters=parameters, duration=time.perf_counter() - start, error=traceback.format_exc()
+        )
+
+    roll_passes = [unit] if isinstance(unit, RollPass) else [u for u in unit.roll_passes if isinstance(u, RollPass)]
+
+    return VariantResult(
+        index=index,
+        parameters=parameters,
+        duration=time.perf_counter() - start,
+        passes=[PassResult.from_roll_pass(rp) for rp in roll_passes],
+        warm_start_entries=_warm_start_entries(roll_passes),
+    )
+
+
+def _warm_start_entries(roll_passes: list[RollPass]) -> dict:
+    if not Config.SPREAD_CORRECTION_WARM_START:
+        return dict()
+
+    store = warm_start_store()
+    entries = dict()
+    for rp in roll_passes:
+        if not solution_converged(rp):
+            continue
+        fingerprint = store.fingerprint(rp)
+        count = len(rp.in_profile.pillars)
+        entry = store.entries.get(fingerprint, dict()).get(count, None)
+        if entry is not None:
+            entries.setdefault(fingerprint, dict())[count] = entry
+
+    return entries
+
+
+def _solve_indexed(factory: Callable[[Any], Variant], item: tuple[int, Any]) -> VariantResult:
+    return solve_variant(factory, *item)
+
+
+def run_variants(
+        factory: Callable[[Any], Variant],
+        parameters: Iterable[Any],
+        max_workers: Optional[int] = None,
+        config: Optional[dict[str, Any]] = None,
+        initializer: Optional[Callable[[], None]] = None,
+        chunksize: int = 1,
+        mp_context=None,
+) -> list[VariantResult]:
+    """
+    Solve variants of pass sequences or roll passes in a process pool.
+
+    The variants are built in the workers by calling ``factory`` with each item of ``parameters``,
+    as the units are not picklable.
+    Only the compact per pass results are sent back from the workers, not the solved units.
+    The workers get the current values of ``pyroll.pillar_model.Config`` updated by ``config``,
+    so the results do not depend on the start method of the processes.
+    Hook implementations registered at runtime (not by an installed plugin) are not available in spawned workers,
+    register them in ``initializer``.
+
+    If ``Config.SPREAD_CORRECTION_WARM_START`` is enabled, the workers start with in-memory stores
+    holding the entries of the parent's store and never write ``Config.SPREAD_CORRECTION_WARM_START_FILE``.
+    The entries recorded by the workers are sent back with the results and merged into the parent's store,
+    which is written to the file if one is configured.
+
+    :param factory: picklable function building the unsolved unit and its incoming profile from a parameter set
+    :param parameters: the parameter sets of the variants
+    :param max_workers: count of worker processes, if ``None`` the count of processors
+    :param config: values of ``pyroll.pillar_model.Config`` to set in the workers
+    :param initializer: picklable function called in each worker after setting the configuration
+    :param chunksize: count of variants sent to a worker at once
+    :param mp_context: multiprocessing context to start the workers with, if ``None`` the default one
+    :return: the results of the variants in order
+    """
+    worker_config = config_values()
+    worker_config.update(config or dict())
+
+    store = None
+    if worker_config["SPREAD_CORRECTION_WARM_START"]:
+        store = _parent_warm_start_store(worker_config)
+        worker_config["SPREAD_CORRECTION_WARM_START_FILE"] = None
+
+    with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=(worker_config, store.entries if store else dict(), initializer)
+    ) as executor:
+        results = list(executor.map(partial(_solve_indexed, factory), enumerate(parameters), chunksize=chunksize))
+
+    for r in results:
+        if not r.succeeded:
+            log.error(f"Solution of variant {r.index} failed:\n{r.error}")
+
+    if store is not None:
+        for r in results:
+            store.update(r.warm_start_entries)
+        if store.path is not None:
+            store.write()
+
+    return results
+
+
+def _parent_warm_start_store(worker_config: dict[str, Any]) -> WarmStartStore:
+    path = worker_config["SPREAD_CORRECTION_WARM_START_FILE"]
+    resolution = worker_config["SPREAD_CORRECTION_WARM_START_RESOLUTION"]
+
+    if (path, resolution) == (Config.SPREAD_CORRECTION_WARM_START_FILE, Config.SPREAD_CORRECTION_WARM_START_RESOLUTION):
+        return warm_start_store()
+
+    return WarmStartStore(path, resolution)
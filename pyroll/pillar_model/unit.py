@@ -0,0 +1,49 @@
+from pyroll.core import Unit, Hook
+
+from .config import Config
+
+Unit.pillar_count = Hook[int]()
+"""Count of pillars, defaults to the parent unit's value or ``Config.PILLAR_COUNT``."""
+
+Unit.pillar_type = Hook[str]()
+"""Type of the pillar discretization, defaults to the parent unit's value or ``Config.PILLAR_TYPE``."""
+
+Unit.elongation_correction = Hook[bool]()
+"""
+Whether to correct the pillar spreads to the mean elongation,
+defaults to the parent unit's value or ``Config.ELONGATION_CORRECTION``.
+"""
+
+Unit.corner_correction = Hook[bool]()
+"""
+Whether to add corner correction strains on entering contact,
+defaults to the parent unit's value or ``Config.CORNER_CORRECTION``.
+"""
+
+
+@Unit.pillar_count
+def default_pillar_count(self: Unit):
+    if self.parent is not None:
+        return self.parent.pillar_count
+    return Config.PILLAR_COUNT
+
+
+@Unit.pillar_type
+def default_pillar_type(self: Unit):
+    if self.parent is not None:
+        return self.parent.pillar_type
+    return Config.PILLAR_TYPE
+
+
+@Unit.elongation_correction
+def default_elongation_correction(self: Unit):
+    if self.parent is not None:
+        return self.parent.elongation_correction
+    return Config.ELONGATION_CORRECTION
+
+
+@Unit.corner_correction
+def default_corner_correction(self: Unit):
+    if self.parent is not None:
+        return self.parent.corner_correction
+    return Config.CORNER_CORRECTION
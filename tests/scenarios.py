@@ -0,0 +1,276 @@
+"""
+Rolling scenarios shared by the tests and the benchmarks.
+
+The scenarios are those of the ``test_solve_*.py`` tests. Each factory builds the unsolved units and the incoming
+profile, :py:data:`SCENARIOS` maps their names to the factory and the exponent of the pillar spread model
+``pillar_draughts ** exponent`` they are solved with.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+
+from pyroll.core import (
+    Profile, PassSequence, RollPass, Roll, Transport, root_hooks,
+    CircularOvalGroove, ConstrictedBoxGroove, FlatGroove, RoundGroove,
+)
+from pyroll.pillar_model.golden import Tolerance
+
+DISK_ELEMENT_COUNT = 15
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+"""
+Directory of the reference records of the scenarios.
+They were recorded with the per-pillar implementation of commit 8cf60a9 and the discretization of
+:py:func:`solve_golden`, the accepted deviations of the current implementation are listed in
+:py:data:`GOLDEN_DEVIATIONS`.
+"""
+
+GOLDEN_DISK_ELEMENT_COUNT = 5
+GOLDEN_PILLAR_COUNT = 30
+GOLDEN_MAX_ITERATION_COUNT = 1000
+"""Iteration limit of the roll passes, so that all scenarios converge within the iteration precision."""
+
+
+def round_profile():
+    return Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+
+def oval_pass(disk_element_count=DISK_ELEMENT_COUNT, r1=0.2e-3, r2=16e-3, gap=4e-3):
+    return RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=5e-3,
+                r1=r1,
+                r2=r2,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=gap,
+        disk_element_count=disk_element_count,
+    )
+
+
+def round_oval(disk_element_count=DISK_ELEMENT_COUNT, gap=4e-3):
+    return [oval_pass(disk_element_count, gap=gap)], round_profile()
+
+
+def square_oval(disk_element_count=DISK_ELEMENT_COUNT):
+    in_profile = Profile.square(
+        side=24e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+    rp = RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=8e-3,
+                r1=6e-3,
+                r2=40e-3
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=2e-3,
+        disk_element_count=disk_element_count,
+    )
+
+    return [rp], in_profile
+
+
+def round_flat(disk_element_count=DISK_ELEMENT_COUNT):
+    rp = RollPass(
+        label="Flat",
+        roll=Roll(
+            groove=FlatGroove(
+                usable_width=40e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=10e-3,
+        disk_element_count=disk_element_count,
+    )
+
+    return [rp], round_profile()
+
+
+def round_constricted_box(disk_element_count=DISK_ELEMENT_COUNT):
+    rp = RollPass(
+        label="Constricted Box",
+        roll=Roll(
+            groove=ConstrictedBoxGroove(
+                r1=1.81e-3,
+                r2=5.49e-3,
+                r4=12.64e-3,
+                depth=4.65e-3,
+                indent=1e-3,
+                usable_width=25.41e-3,
+                ground_width=17.5e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=disk_element_count,
+    )
+
+    return [rp], round_profile()
+
+
+def round_oval_round(disk_element_count=DISK_ELEMENT_COUNT):
+    units = [
+        oval_pass(disk_element_count, r1=1e-3, r2=20e-3),
+        Transport(duration=1),
+        RollPass(
+            label="Round",
+            roll=Roll(
+                groove=RoundGroove(
+                    depth=8e-3,
+                    r1=1e-3,
+                    r2=9e-3,
+                ),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                neutral_point=-20e-3
+            ),
+            gap=2e-3,
+            disk_element_count=disk_element_count,
+        ),
+    ]
+
+    return units, round_profile()
+
+
+SCENARIOS = {
+    "round_oval": (round_oval, -0.3),
+    "square_oval": (square_oval, -0.8),
+    "round_flat": (round_flat, -0.5),
+    "round_constricted_box": (round_constricted_box, 0.5),
+    "round_oval_round": (round_oval_round, -0.3),
+}
+"""Mapping of scenario names to the factory of the units and the in profile and the exponent of the spread model."""
+
+
+@contextmanager
+def pillar_spreads(exponent):
+    """Use ``pillar_draughts ** exponent`` as pillar spread model of the disk elements within the context."""
+
+    def spreads(self: RollPass.DiskElement):
+        return self.pillar_draughts ** exponent
+
+    with RollPass.DiskElement.pillar_spreads(spreads):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+        try:
+            yield
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+
+def solve_sequence(
+        scenario, disk_element_count=DISK_ELEMENT_COUNT, max_iteration_count=None, **kwargs
+) -> PassSequence:
+    """
+    Solve the units of a scenario as pass sequence.
+
+    :param scenario: name of the scenario in :py:data:`SCENARIOS`
+    :param disk_element_count: disk element count of the roll passes
+    :param max_iteration_count: iteration limit of the roll passes, if ``None`` the default
+    :param kwargs: further keyword arguments of the pass sequence, e.g. ``pillar_type`` or ``pillar_count``
+    """
+    factory, exponent = SCENARIOS[scenario]
+    units, in_profile = factory(disk_element_count)
+    if max_iteration_count is not None:
+        for u in units:
+            if isinstance(u, RollPass):
+                u.max_iteration_count = max_iteration_count
+    sequence = PassSequence(units, **kwargs)
+
+    with pillar_spreads(exponent):
+        sequence.solve(in_profile)
+
+    return sequence
+
+
+def solve_roll_pass(scenario, disk_element_count=DISK_ELEMENT_COUNT) -> RollPass:
+    """
+    Solve the roll pass of a single pass scenario on its own.
+
+    :param scenario: name of the scenario in :py:data:`SCENARIOS`
+    :param disk_element_count: disk element count of the roll pass
+    """
+    factory, exponent = SCENARIOS[scenario]
+    (rp,), in_profile = factory(disk_element_count)
+
+    with pillar_spreads(exponent):
+        rp.solve(in_profile)
+
+    return rp
+
+
+def golden_path(scenario, pillar_type) -> Path:
+    """Get the path of the reference record of a scenario solved with the given pillar type."""
+    return GOLDEN_DIR / f"{scenario}_{pillar_type.lower()}.npz"
+
+
+def solve_golden(scenario, pillar_type) -> PassSequence:
+    """Solve a scenario with the discretization of its reference record."""
+    return solve_sequence(
+        scenario, GOLDEN_DISK_ELEMENT_COUNT, GOLDEN_MAX_ITERATION_COUNT,
+        pillar_type=pillar_type, pillar_count=GOLDEN_PILLAR_COUNT
+    )
+
+
+GOLDEN_DEVIATIONS = {
+    # pillar 27 first contacts the roll in disk element 3 after spreading, the reference took the exit side
+    # intersection with the roll contour as entry, the current implementation the entry within disk element 3,
+    # which adds the corner strain there
+    ("round_oval", "EQUIDISTANT"): {
+        "0_Oval/pillar_entry_angles": Tolerance(atol=0.12, pillars=(27,)),
+        "0_Oval/pillar_strains": Tolerance(rtol=1e-3, pillars=(27,)),
+        "0_Oval/pillar_strain_rates": Tolerance(rtol=1e-3, pillars=(27,)),
+    },
+    # pillar 25 of the oval pass first contacts the roll in disk element 3, the reference entry angle is an
+    # unconverged root search iterate with the pillar still inside the roll contour
+    ("round_oval_round", "EQUIDISTANT"): {
+        "0_Oval/pillar_entry_angles": Tolerance(atol=6e-3, pillars=(25,)),
+        "0_Oval/pillar_strains": Tolerance(rtol=4e-3, pillars=(25,)),
+        "0_Oval/pillar_strain_rates": Tolerance(rtol=4e-3, pillars=(25,)),
+    },
+    # the same for pillar 27 of the round pass, its corner strain changes the spread correction coefficients
+    # and with them all pillars of the pass by far less than itself
+    ("round_oval_round", "UNIFORM"): {
+        "1_Round/pillar_entry_angles": Tolerance(atol=0.04, pillars=(27,)),
+        "1_Round/pillar_heights": Tolerance(rtol=2e-5, atol=1e-12),
+        "1_Round/pillar_widths": Tolerance(rtol=2e-4, atol=1e-12),
+        "1_Round/pillar_strains": (Tolerance(rtol=1.5e-2, pillars=(27,)), Tolerance(rtol=2e-3, atol=1e-9)),
+        "1_Round/pillar_strain_rates": (Tolerance(rtol=1.5e-2, pillars=(27,)), Tolerance(rtol=2e-3, atol=1e-6)),
+        "1_Round/pillar_velocities": Tolerance(rtol=6e-5, atol=1e-9),
+        "1_Round/pillar_spread_correction_coefficients": Tolerance(rtol=4e-5, atol=1e-9),
+    },
+}
+"""
+Mapping of scenarios and pillar types to the tolerances of the record keys deviating from the reference records,
+about the observed deviations with a small margin.
+All deviate since the entries of pillars first contacting the roll after spreading are searched in the disk elements
+of their first contact.
+"""
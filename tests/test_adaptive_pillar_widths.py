@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+import pyroll.pillar_model
+
+from pyroll.core import Profile
+from pyroll.pillar_model.geometry import (
+    adaptive_sampling, adaptive_pillar_widths, aligned_pillar_widths, chord_height_table, height_refinement_density
+)
+from pyroll.pillar_model.roll_pass.sweep import (
+    contact_transitions, contour_entry_points, contour_surface_depths, pillar_height_sweep
+)
+
+from scenarios import round_oval, solve_roll_pass, solve_sequence
+
+
+def test_adaptive_pillar_widths_constant_density():
+    z = adaptive_sampling(10, 20)
+    widths = adaptive_pillar_widths(z, np.ones_like(z), 10, 20)
+
+    assert np.allclose(widths, 10 / 2 / (20 - 0.5))
+
+
+@pytest.mark.parametrize("pillar_count", [4, 30])
+def test_adaptive_pillar_widths_equidistribution(pillar_count):
+    z = adaptive_sampling(10, pillar_count)
+    density = 1 + 5 * np.exp(-(z - 3) ** 2)
+    widths = adaptive_pillar_widths(z, density, 10, pillar_count, min_relative_density=0)
+
+    boundaries = np.cumsum(widths) - widths[0] / 2
+    fine_z = np.linspace(0, 10 / 2, 100001)
+    fine_density = 1 + 5 * np.exp(-(fine_z - 3) ** 2)
+    cumulative = np.append(0, np.cumsum((fine_density[1:] + fine_density[:-1]) / 2 * np.diff(fine_z)))
+    pillar_integrals = np.diff(np.interp(boundaries, fine_z, cumulative), prepend=0)
+    pillar_integrals[0] *= 2
+
+    assert np.isclose(boundaries[-1], 10 / 2)
+    assert np.allclose(pillar_integrals, pillar_integrals[0], rtol=1e-2)
+    assert np.argmin(widths) == np.argmin(np.abs(boundaries - widths / 2 - 3))
+
+
+def test_aligned_pillar_widths():
+    widths = np.full(5, 1.)
+    aligned = aligned_pillar_widths(widths, [0.7, 1.4, 1.6, 2.1, 4.3, 5])
+
+    # boundaries 0.5, 1.5, 2.5, 3.5, 4.5: 1.6 finds its nearest boundary moved to 1.4 already, 2.1 moves the next,
+    # the edge is kept and the one before takes the point near it
+    assert np.allclose(np.cumsum(aligned) - aligned[0] / 2, [0.7, 1.4, 2.1, 4.3, 4.5])
+
+
+def test_adaptive_pillar_widths_hook(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 20)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "ADAPTIVE")
+
+    p = Profile.round(diameter=10)
+    widths = p.pillar_widths
+
+    assert len(widths) == 20
+    assert np.isclose(np.sum(widths) - widths[0] / 2, p.width / 2)
+
+    # refined towards the flank, where the height derivatives are large
+    assert np.all(np.diff(widths) < 1e-12)
+    assert widths[-1] < widths[0] / 2
+
+
+def test_contour_entry_points():
+    (rp,), in_profile = round_oval()
+    rp.init_solve(in_profile)
+
+    z = adaptive_sampling(rp.in_profile.width, 10)
+    entry_points = contour_entry_points(rp.roll, z, chord_height_table(rp.in_profile.cross_section)(z), rp.gap)
+
+    assert np.isclose(-entry_points[0], rp.roll.contact_length)
+    assert np.all(entry_points <= 0)
+    assert entry_points[-1] == 0
+
+
+def test_solve_adaptive(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 20)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "ADAPTIVE")
+
+    rp = solve_roll_pass("round_oval")
+    widths = rp.in_profile.pillar_widths
+
+    assert len(widths) == 20
+    assert np.isclose(np.sum(widths) - widths[0] / 2, rp.in_profile.width / 2)
+    assert np.isclose(rp.out_profile.cross_section.area, 2.399e-4, rtol=1e-2)
+
+
+def test_adaptive_pillar_widths_of_next_roll_pass():
+    sequence = solve_sequence("round_oval_round", 5, pillar_type="ADAPTIVE", pillar_count=10)
+    rp = sequence.roll_passes[-1]
+    in_profile = rp.in_profile
+
+    contact_length = rp.roll.contact_length
+    x = -contact_length + contact_length / rp.disk_element_count * np.arange(1, rp.disk_element_count + 1)
+    z = adaptive_sampling(in_profile.width, 10)
+    depths = contour_surface_depths(rp.roll, x[:, np.newaxis], z)
+    heights = pillar_height_sweep(chord_height_table(in_profile.cross_section)(z), depths, rp.gap)
+    density = np.maximum(height_refinement_density(z, heights[0]), height_refinement_density(z, heights[-1]))
+    transitions = contact_transitions(z, heights[:-1], depths, rp.gap)
+
+    # the roll pass sees the widths of its rotator, refined also for the contour predicted behind the roll gap
+    # and aligned with the predicted contact boundaries
+    widths = in_profile.pillar_widths
+    refined = adaptive_pillar_widths(z, density, in_profile.width, 10)
+    assert np.allclose(widths, aligned_pillar_widths(refined, transitions))
+    assert len(transitions) > 0
+    assert np.any(np.isclose(np.cumsum(widths) - widths[0] / 2, transitions[:, np.newaxis]))
+
+    generic = adaptive_pillar_widths(z, height_refinement_density(z, heights[0]), in_profile.width, 10)
+    assert not np.allclose(widths, generic)
+
+
+CONVERGED_CONTACT_AREAS = {"round_oval": 4.880e-4, "square_oval": 1.0185e-3}
+"""Contact areas of one roll, converged with 800 equidistant pillars."""
+
+
+@pytest.mark.parametrize("pillar_count", [10, 20])
+@pytest.mark.parametrize("scenario", ["round_oval", "square_oval"])
+def test_adaptive_contact_area_like_twice_the_equidistant_pillars(monkeypatch, scenario, pillar_count):
+    def contact_area_error(pillar_type, count):
+        with monkeypatch.context() as m:
+            m.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", count)
+            m.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", pillar_type)
+            rp = solve_roll_pass(scenario)
+        return abs(rp.roll.contact_area / CONVERGED_CONTACT_AREAS[scenario] - 1)
+
+    assert contact_area_error("ADAPTIVE", pillar_count) <= contact_area_error("EQUIDISTANT", 2 * pillar_count)
@@ -0,0 +1,43 @@
+import copy
+import shapely
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.core import Profile, Rotator
+from pyroll.pillar_model import geometry
+from pyroll.pillar_model.geometry import chord_height_table, ChordHeightTable
+
+
+def test_chord_height_table_cached_by_identity():
+    cs = Profile.round(diameter=10).cross_section
+    assert chord_height_table(cs) is chord_height_table(cs)
+
+
+def test_chord_height_table_cached_by_wkb():
+    cs = Profile.round(diameter=10).cross_section
+    assert chord_height_table(cs) is chord_height_table(shapely.from_wkb(shapely.to_wkb(cs)))
+    assert chord_height_table(cs) is chord_height_table(copy.deepcopy(cs))
+    assert chord_height_table(cs) is not chord_height_table(Profile.round(diameter=11).cross_section)
+
+
+def test_chord_height_table_cache_size(monkeypatch):
+    monkeypatch.setattr(geometry, "TABLE_CACHE_SIZE", 2)
+    geometry.clear_chord_height_tables()
+
+    for i in range(5):
+        chord_height_table(shapely.box(-i - 1, -1, i + 1, 1))
+
+    assert len(geometry._tables_by_wkb) == 2
+
+
+def test_chord_height_table_shared_by_rotator(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 10)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+    geometry.clear_chord_height_tables()
+
+    p = Profile.round(diameter=10)
+    rotator = Rotator(rotation=0)
+    rotator.solve(p)
+
+    assert np.allclose(rotator.out_profile.pillar_heights, ChordHeightTable(p.cross_section)(p.pillars))
+    assert len(geometry._tables_by_wkb) == 1
@@ -0,0 +1,44 @@
+import pytest
+import shapely
+import numpy as np
+
+from pyroll.core import Profile
+from pyroll.pillar_model.geometry import ChordHeightTable
+
+
+def shapely_chord_heights(cross_section, z):
+    return np.array(
+        [
+            shapely.intersection(
+                cross_section,
+                shapely.LineString([(p, cross_section.bounds[1]), (p, cross_section.bounds[3])])
+            ).length
+            for p in z
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "cs", [
+        Profile.round(radius=10).cross_section,
+        Profile.square(side=10, corner_radius=1).cross_section,
+        Profile.box(height=10, width=5, corner_radius=1).cross_section,
+        Profile.diamond(height=5, width=10, corner_radius=1).cross_section,
+        shapely.Polygon([(-4, -3), (4, -3), (4, 3), (2, 3), (2, -1), (-2, -1), (-2, 3), (-4, 3)]),
+        shapely.Polygon([(-5, -5), (5, -5), (5, 5), (-5, 5)], [[(-1, -2), (1, -2), (1, 2), (-1, 2)]]),
+        shapely.MultiPolygon([shapely.box(-3, -1, -1, 1), shapely.box(0, -2, 3, 4)]),
+    ]
+)
+def test_chord_heights_against_shapely(cs):
+    z = np.linspace(cs.bounds[0], cs.bounds[2], 101)
+    assert np.allclose(ChordHeightTable(cs)(z), shapely_chord_heights(cs, z), rtol=1e-9, atol=1e-12)
+
+
+def test_chord_heights_non_convex():
+    cs = shapely.Polygon([(-4, -3), (4, -3), (4, 3), (2, 3), (2, -1), (-2, -1), (-2, 3), (-4, 3)])
+    assert np.allclose(ChordHeightTable(cs)([0, 3, -3]), [2, 6, 6])
+
+
+def test_chord_heights_on_vertical_edges():
+    cs = shapely.box(-7, -0.5, 7, 0.5)
+    assert np.allclose(ChordHeightTable(cs)([-7, 0, 7, 8]), [1, 1, 1, 0])
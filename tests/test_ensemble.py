@@ -0,0 +1,129 @@
+import copy
+
+import numpy as np
+import pytest
+
+from pyroll.core import Profile, RollPass, Roll, CircularOvalGroove, root_hooks
+from pyroll.pillar_model.ensemble import solve_ensemble, spread_sensitivity
+from pyroll.pillar_model.roll_pass.sweep import pillar_height_sweep
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.3
+
+
+def in_profile(diameter, flow_stress):
+    return Profile.round(
+        diameter=diameter,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=flow_stress,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+
+def roll_pass():
+    return RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=5e-3,
+                r1=0.2e-3,
+                r2=16e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=15,
+    )
+
+
+def test_pillar_height_sweep_batched():
+    rng = np.random.default_rng(0)
+    in_heights = rng.uniform(1, 2, (4, 10))
+    depths = rng.uniform(0, 1, (4, 6, 10))
+
+    batched = pillar_height_sweep(in_heights, depths, 0.1)
+
+    assert batched.shape == (4, 7, 10)
+    for i in range(4):
+        assert np.array_equal(batched[i], pillar_height_sweep(in_heights[i], depths[i], 0.1))
+
+
+def test_spread_sensitivity():
+    rng = np.random.default_rng(0)
+    log_draughts = rng.uniform(-0.1, 0, (15, 10))
+    log_spreads = -0.3 * log_draughts + rng.uniform(-0.01, 0.01, 10)
+
+    assert np.isclose(spread_sensitivity(log_draughts, log_spreads), -0.3)
+    assert spread_sensitivity(np.zeros((15, 10)), log_spreads) == 0
+
+
+def test_solve_ensemble():
+    profiles = [in_profile(19.3e-3, 95e6), in_profile(19.5e-3, 100e6), in_profile(19.7e-3, 105e6)]
+    rp = roll_pass()
+
+    with RollPass.DiskElement.pillar_spreads(pillar_spreads):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+        try:
+            result = solve_ensemble(rp, profiles)
+            member = copy.deepcopy(rp)
+            member.solve(profiles[2])
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+    assert result.reference_index == 1
+    assert rp.out_profile is None
+
+    pillar_count = len(result.reference.in_profile.pillars)
+    assert result.total_pillar_strains.shape == (3, pillar_count)
+    assert result.disk_pillar_heights.shape == (3, 16, pillar_count)
+    assert result.roll_forces.shape == (3,)
+
+    # the reference member reproduces the full solution
+    reference = result.reference
+    assert np.allclose(result.total_pillar_strains[1], reference.total_pillar_strains, atol=1e-3)
+    assert np.isclose(result.roll_forces[1], reference.roll_force, rtol=1e-3)
+
+    # other members are close to their full solutions
+    assert np.allclose(result.total_pillar_strains[2], member.total_pillar_strains, atol=0.03)
+    assert np.isclose(result.roll_forces[2], member.roll_force, rtol=1e-2)
+    assert np.isclose(result.contact_areas[2], member.contact_area, rtol=1e-2)
+
+    assert result.roll_forces[0] < result.roll_forces[1] < result.roll_forces[2]
+
+    with pytest.raises(ValueError):
+        solve_ensemble(reference, profiles)
+
+
+def strain_dependent_flow_stress(self: RollPass.DiskElement.OutProfile):
+    return self.disk_element.roll_pass.in_profile.flow_stress * (1 + 2 * np.mean(self.pillar_strains))
+
+
+def test_solve_ensemble_strain_dependent_flow_stress():
+    profiles = [in_profile(19.3e-3, 95e6), in_profile(19.5e-3, 100e6), in_profile(19.7e-3, 105e6)]
+    rp = roll_pass()
+
+    with RollPass.DiskElement.pillar_spreads(pillar_spreads), \
+            RollPass.DiskElement.OutProfile.flow_stress(strain_dependent_flow_stress):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+        root_hooks.add(RollPass.DiskElement.OutProfile.flow_stress)
+        try:
+            result = solve_ensemble(rp, profiles)
+            member = copy.deepcopy(rp)
+            member.solve(profiles[2])
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.OutProfile.flow_stress)
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+    reference = result.reference
+    flow_stresses = [de.out_profile.flow_stress for de in reference.disk_elements]
+    assert flow_stresses[-1] > 1.2 * flow_stresses[0]
+
+    assert np.isclose(result.roll_forces[1], reference.roll_force, rtol=1e-3)
+    # the members' strain differences are not followed by their flow stresses within the disk elements
+    assert np.isclose(result.roll_forces[2], member.roll_force, rtol=2e-2)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import pyroll.pillar_model
+
+from pyroll.pillar_model.golden import Tolerance, check_golden
+from pyroll.pillar_model.roll_pass.sweep import pillar_height_sweep
+
+from scenarios import SCENARIOS, GOLDEN_DEVIATIONS, golden_path, solve_golden
+
+
+def test_pillar_height_sweep():
+    rng = np.random.default_rng(42)
+    in_heights = rng.uniform(5, 10, 20)
+    depths = rng.uniform(1, 5, (15, 20))
+    gap = 1.5
+
+    heights = pillar_height_sweep(in_heights, depths, gap)
+
+    expected = [in_heights]
+    for contour in depths:
+        h = expected[-1].copy()
+        contacts = h / 2 > contour + gap / 2
+        h[contacts] = contour[contacts] * 2 + gap
+        expected.append(h)
+
+    assert np.allclose(heights, expected)
+
+
+FAST_PILLAR_PASS_TOLERANCES = {
+    "pillar_heights": Tolerance(rtol=1e-4, atol=1e-6),
+    "pillar_widths": Tolerance(rtol=1e-4, atol=5e-7),
+    "pillar_strains": Tolerance(rtol=1e-4, atol=2e-4),
+    "pillar_strain_rates": Tolerance(rtol=1e-4, atol=5e-2),
+    "pillar_velocities": Tolerance(rtol=1e-4, atol=1e-5),
+    "pillar_entry_angles": Tolerance(rtol=1e-4, atol=2e-5),
+    "pillar_spread_correction_coefficients": Tolerance(rtol=1e-4, atol=1e-5),
+}
+"""
+Tolerances of the fast pillar pass against the reference records, which both converge to within the iteration
+precision, the absolute ones are about 5e-4 of the fields' magnitudes, the contacts must match exactly.
+"""
+
+
+@pytest.mark.parametrize("pillar_type", ["EQUIDISTANT", "UNIFORM"])
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_fast_pillar_pass(monkeypatch, scenario, pillar_type):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "FAST_PILLAR_PASS", True)
+    sequence = solve_golden(scenario, pillar_type)
+
+    tolerances = {**FAST_PILLAR_PASS_TOLERANCES, **GOLDEN_DEVIATIONS.get((scenario, pillar_type), {})}
+    divergences = check_golden(sequence, golden_path(scenario, pillar_type), tolerances)
+    assert not divergences, "\n".join(str(d) for d in divergences)
@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyroll.pillar_model.golden import Tolerance, compare, check_golden, save_record, load_record
+
+from scenarios import SCENARIOS, GOLDEN_DIR, GOLDEN_DEVIATIONS, golden_path, solve_golden
+
+UPDATE = bool(os.environ.get("PILLAR_MODEL_UPDATE_GOLDEN", ""))
+"""
+Set the environment variable ``PILLAR_MODEL_UPDATE_GOLDEN`` to rewrite the reference records from the current
+implementation, e.g. after a deliberate change of the model, then drop the deviations it covers.
+"""
+
+
+@pytest.mark.parametrize("pillar_type", ["EQUIDISTANT", "UNIFORM"])
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_golden(scenario, pillar_type):
+    sequence = solve_golden(scenario, pillar_type)
+
+    if UPDATE:
+        GOLDEN_DIR.mkdir(exist_ok=True)
+
+    divergences = check_golden(
+        sequence, golden_path(scenario, pillar_type), GOLDEN_DEVIATIONS.get((scenario, pillar_type)), update=UPDATE
+    )
+    assert not divergences, "\n".join(str(d) for d in divergences)
+
+
+def test_compare_first_divergence():
+    reference = {
+        "0_Oval/pillar_strains": np.zeros((4, 3)),
+        "0_Oval/pillars_in_contact": np.array([True, False, True]),
+        "0_Oval/pillar_entry_angles": np.ones(3),
+    }
+    values = {k: v.copy() for k, v in reference.items()}
+    values["0_Oval/pillar_strains"][2, 1] = 1
+    values["0_Oval/pillar_strains"][3, 0] = 1
+    values["0_Oval/pillars_in_contact"][2] = False
+    values["0_Oval/pillar_entry_angles"][0] *= 1 + 1e-9
+
+    divergences = {d.key: d for d in compare(values, reference)}
+
+    assert set(divergences) == {"0_Oval/pillar_strains", "0_Oval/pillars_in_contact"}
+    d = divergences["0_Oval/pillar_strains"]
+    assert (d.disk, d.pillar, d.expected, d.actual, d.count) == (2, 1, 0, 1, 2)
+    assert "disk 2, pillar 1" in str(d)
+    d = divergences["0_Oval/pillars_in_contact"]
+    assert (d.disk, d.pillar) == (None, 2)
+
+    divergences = compare(values, reference, {"pillar_strains": Tolerance(atol=1)})
+    assert [d.key for d in divergences] == ["0_Oval/pillars_in_contact"]
+
+
+def test_compare_key_tolerances():
+    reference = {"0_Oval/pillar_strains": np.zeros((4, 3)), "1_Round/pillar_strains": np.zeros((4, 3))}
+    values = {k: v.copy() for k, v in reference.items()}
+    values["0_Oval/pillar_strains"][:, 1] = 1e-2
+    values["1_Round/pillar_strains"][:, 1] = 1e-2
+    values["1_Round/pillar_strains"][3, 2] = 1e-3
+
+    divergences = compare(values, reference, {"0_Oval/pillar_strains": Tolerance(atol=1e-2)})
+    assert [d.key for d in divergences] == ["1_Round/pillar_strains"]
+
+    divergences = compare(values, reference, {"1_Round/pillar_strains": Tolerance(atol=1e-2, pillars=(1,))})
+    d = {d.key: d for d in divergences}["1_Round/pillar_strains"]
+    assert (d.disk, d.pillar, d.count) == (3, 2, 1)
+
+    tolerances = {"1_Round/pillar_strains": (Tolerance(atol=1e-2, pillars=(1,)), Tolerance(atol=1e-3))}
+    assert [d.key for d in compare(values, reference, tolerances)] == ["0_Oval/pillar_strains"]
+
+
+def test_compare_structure():
+    reference = {"0_Oval/pillar_heights": np.zeros((4, 3)), "0_Oval/pillar_widths": np.zeros((4, 3))}
+    values = {"0_Oval/pillar_heights": np.zeros((5, 3)), "0_Oval/pillar_velocities": np.zeros((4, 3))}
+
+    messages = {d.key: d.message for d in compare(values, reference)}
+
+    assert messages == {
+        "0_Oval/pillar_heights": "shape (5, 3) differs from (4, 3)",
+        "0_Oval/pillar_widths": "missing in the new record",
+        "0_Oval/pillar_velocities": "missing in the reference record",
+    }
+
+
+def test_save_load_record(tmp_path):
+    values = {"0_Oval/pillar_heights": np.arange(6.).reshape(2, 3), "0_Oval/pillars_in_contact": np.ones(3, bool)}
+    save_record(tmp_path / "record.npz", values)
+    loaded = load_record(tmp_path / "record.npz")
+
+    assert loaded.keys() == values.keys()
+    assert all(np.array_equal(loaded[k], values[k]) and loaded[k].dtype == values[k].dtype for k in values)
+    assert not compare(loaded, values)
@@ -0,0 +1,104 @@
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.core import Profile, RollPass, Roll, CircularOvalGroove, root_hooks
+from pyroll.pillar_model.roll_pass.contacts import disk_element_index, previous_pillars_in_contact, pillar_contact_totals
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.5
+
+
+def test_pillar_contacts(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    with RollPass.DiskElement.pillar_spreads(pillar_spreads):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+
+        in_profile = Profile.round(
+            diameter=19.5e-3,
+            temperature=1200 + 273.15,
+            strain=0,
+            material=["C45", "steel"],
+            flow_stress=100e6,
+            density=7.5e3,
+            specific_heat_capcity=690,
+        )
+
+        rp = RollPass(
+            label="Oval",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    depth=5e-3,
+                    r1=0.2e-3,
+                    r2=16e-3,
+                ),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                neutral_point=-20e-3
+            ),
+            gap=3e-3,
+            disk_element_count=15,
+        )
+
+        try:
+            rp.solve(in_profile)
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+    previous_contact = np.full(30, False)
+    for i, de in enumerate(rp.disk_elements):
+        assert disk_element_index(de) == i
+        assert np.array_equal(previous_pillars_in_contact(de), previous_contact)
+
+        strains = np.sqrt(
+            2 / 3 * (de.pillar_log_elongations ** 2 + de.pillar_log_spreads ** 2 + de.pillar_log_draughts ** 2))
+        for j in range(30):
+            if de.pillars_in_contact[j] and not previous_contact[j]:
+                strains[j] += rp.pillar_corner_correction_strains[j]
+        assert np.allclose(de.pillar_strains, strains)
+
+        strain_rates = np.where(de.pillars_in_contact, de.pillar_velocities * de.pillar_strains / de.length, 0)
+        assert np.allclose(de.pillar_strain_rates, strain_rates)
+
+        previous_contact = de.pillars_in_contact
+
+    contact_lengths = np.zeros(30)
+    contact_areas = np.zeros(30)
+    for de in rp.disk_elements:
+        for i in range(30):
+            if de.pillars_in_contact[i]:
+                contact_lengths[i] += de.length
+                contact_areas[i] += (de.in_profile.pillar_widths[i] + de.out_profile.pillar_widths[i]) / 2 * de.length
+
+    assert np.allclose(rp.roll.total_pillar_contact_lengths, contact_lengths)
+    assert np.allclose(rp.roll.total_pillar_contact_areas, contact_areas)
+
+    totals = rp.roll.pillar_contact_totals
+    in_contact = contact_lengths > 0
+    assert np.all(totals.first_contact_x[in_contact] >= rp.disk_elements[0].in_profile.x)
+    assert np.allclose(totals.last_contact_x[in_contact] - totals.first_contact_x[in_contact], contact_lengths[in_contact])
+    assert np.all(np.isnan(totals.first_contact_x[~in_contact]))
+
+
+def test_pillar_contact_totals():
+    contacts = np.array([
+        [False, False, True],
+        [True, False, True],
+        [True, False, False],
+    ])
+    lengths = np.array([1, 2, 3])
+    in_widths = np.full((3, 3), 2.)
+    out_widths = np.full((3, 3), 4.)
+    in_x = np.array([0, 1, 3])
+    out_x = np.array([1, 3, 6])
+
+    totals = pillar_contact_totals(contacts, lengths, in_widths, out_widths)
+    assert np.allclose(totals.lengths, [5, 0, 3])
+    assert np.allclose(totals.areas, [15, 0, 9])
+    assert totals.first_contact_x is None
+
+    totals = pillar_contact_totals(contacts, lengths, in_widths, out_widths, in_x, out_x)
+    assert np.allclose(totals.first_contact_x, [1, np.nan, 0], equal_nan=True)
+    assert np.allclose(totals.last_contact_x, [6, np.nan, 3], equal_nan=True)
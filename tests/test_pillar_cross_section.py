@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import shapely
+import pyroll.pillar_model
+
+from pyroll.pillar_model.geometry import pillar_cross_section, pillar_cross_section_measures
+
+from scenarios import solve_roll_pass
+
+
+def polygon_cross_section(pillars, heights, outer):
+    coords1 = np.column_stack([pillars, heights / 2])
+    coords2 = coords1[::-1].copy()
+    coords2[:, 1] *= -1
+    coords3 = coords1[1:].copy()
+    coords3 *= -1
+    coords4 = coords2[:-1].copy()
+    coords4 *= -1
+
+    return shapely.Polygon(np.vstack([coords1, [(outer, 0)], coords2, coords3, [(-outer, 0)], coords4]))
+
+
+@pytest.mark.parametrize("pillar_count", [2, 30, 200])
+def test_pillar_cross_section(pillar_count):
+    rng = np.random.default_rng(pillar_count)
+    pillars = np.concatenate([[0], np.sort(rng.uniform(0, 10, pillar_count - 1))])
+    heights = rng.uniform(1, 5, pillar_count)
+    outer = 10.5
+
+    cs = pillar_cross_section(pillars, heights, outer)
+    expected = polygon_cross_section(pillars, heights, outer)
+
+    assert isinstance(cs, shapely.Polygon)
+    assert cs.equals(expected)
+
+    polygon, area, perimeter = pillar_cross_section_measures(pillars, heights, outer)
+    assert polygon.equals(expected)
+    assert np.isclose(area, expected.area, rtol=1e-12)
+    assert np.isclose(perimeter, expected.length, rtol=1e-12)
+
+
+def test_pillar_cross_section_in_roll_pass(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+
+    rp = solve_roll_pass("round_oval")
+
+    box = shapely.box(-1, 0, 1, 1)
+    for de in rp.disk_elements:
+        cs = de.out_profile.cross_section
+        assert isinstance(cs, shapely.Polygon)
+        assert cs.is_valid
+        assert np.isclose(shapely.area(shapely.intersection(cs, box)), cs.area / 2)
+        assert np.isclose(de.out_profile.width, 2 * cs.bounds[2])
+        assert np.isclose(de.out_profile.height, cs.bounds[3] - cs.bounds[1])
+        assert np.isclose(de.out_profile.cross_section_area, cs.area, rtol=1e-12)
+        assert np.isclose(de.out_profile.cross_section_perimeter, cs.length, rtol=1e-12)
+        assert np.isclose(de.in_profile.cross_section_area, de.in_profile.cross_section.area, rtol=1e-12)
+
+    assert isinstance(rp.out_profile.cross_section, shapely.Polygon)
+    assert rp.out_profile.cross_section is rp.disk_elements[-1].out_profile.cross_section
@@ -0,0 +1,96 @@
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.core import Profile, RollPass, Roll, CircularOvalGroove
+from pyroll.pillar_model.roll_pass.sweep import pillar_entry_points
+
+from scenarios import solve_sequence
+
+
+def test_pillar_entry_points_linear():
+    x = np.linspace(-4, 0, 5)
+    depths = np.array([-x / 2, -x / 2, -x / 2, 0 * x])
+    heights = np.array([4, 1.5, 0.5, 2])
+
+    entry_points, contacts = pillar_entry_points(x, depths, heights, gap=1)
+
+    assert np.array_equal(contacts, [True, True, False, True])
+    assert np.allclose(entry_points, [-3, -0.5, 0, -4])
+
+
+def test_pillar_entry_points(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 50)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    in_profile = Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+    )
+
+    rp = RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=5e-3,
+                r1=0.2e-3,
+                r2=16e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=15,
+    )
+    rp.init_solve(in_profile)
+    roll = rp.roll
+
+    contacts = roll.pillar_entry_contacts
+    entry_points = roll.pillar_entry_points
+    assert contacts is roll.pillar_entries.contacts and entry_points is roll.pillar_entries.points
+    assert 0 < np.count_nonzero(contacts) < 50
+    assert np.all(entry_points[~contacts] == 0)
+    assert np.all(entry_points[contacts] < 0)
+
+    # pillar height matches the roll gap at the entry points
+    for z, h, x in zip(rp.in_profile.pillars[contacts], rp.in_profile.pillar_heights[contacts], entry_points[contacts]):
+        assert np.isclose(2 * roll.surface_interpolation(x, z).squeeze() + rp.gap, h)
+
+    local_roll_radii = np.concatenate(
+        [roll.max_radius - roll.surface_interpolation(0, center) for center in rp.in_profile.pillars],
+        axis=0).flatten()
+    assert np.allclose(roll.pillar_local_radii, local_roll_radii)
+    assert np.allclose(np.sin(roll.pillar_entry_angles) * local_roll_radii, entry_points)
+
+
+def test_pillar_entry_points_after_spreading():
+    sequence = solve_sequence("round_oval", 5, pillar_type="EQUIDISTANT", pillar_count=30)
+    rp = sequence.roll_passes[0]
+    roll = rp.roll
+
+    masks = np.array([de.pillars_in_contact for de in rp.disk_elements])
+    assert np.array_equal(roll.pillar_entry_contacts, masks.any(axis=0))
+
+    # pillars not reaching the roll at the in profile's positions get in contact partway through the pass
+    x = np.append(roll.surface_x[roll.surface_x < 0], 0)
+    depths = roll.surface_interpolation(x, rp.in_profile.pillars)
+    _, swept_contacts = pillar_entry_points(x, depths, rp.in_profile.pillar_heights, rp.gap)
+    late = np.flatnonzero(roll.pillar_entry_contacts & ~swept_contacts)
+    assert len(late) > 0
+
+    for p in late:
+        i = np.argmax(masks[:, p])
+        de = rp.disk_elements[i]
+        assert i > 0
+        assert de.in_profile.x <= roll.pillar_entry_points[p] <= de.out_profile.x
+        assert roll.pillar_entry_angles[p] < 0
+        assert rp.pillar_corner_correction_strains[p] > 0
+
+        # the corner correction is added where the pillar enters
+        strain = np.sqrt(2 / 3 * (
+                de.pillar_log_elongations[p] ** 2 + de.pillar_log_spreads[p] ** 2 + de.pillar_log_draughts[p] ** 2
+        ))
+        assert np.isclose(de.pillar_strains[p] - strain, rp.pillar_corner_correction_strains[p], rtol=1e-3)
@@ -1,4 +1,6 @@
+import math
 import pytest
+import shapely
 import numpy as np
 import pyroll.pillar_model
 import matplotlib.pyplot as plt
@@ -6,6 +8,7 @@ import matplotlib.pyplot as plt
 from typing import Union
 from pyroll.core import Profile
 from pyroll.pillar_model.profile import PillarProfile
+from pyroll.pillar_model.geometry import pillar_sections, LazyPillarSections
 
 
 @pytest.mark.parametrize(
@@ -98,3 +101,50 @@ def test_pillar_sections_equidistant_validity(p: Union[PillarProfile, Profile],
 
     assert all(res) is True
 
+
+@pytest.mark.parametrize(
+    "p", [
+        Profile.round(radius=10),
+        Profile.square(side=10, corner_radius=1),
+        Profile.box(height=10, width=5, corner_radius=1),
+        Profile.diamond(height=5, width=10, corner_radius=1)
+    ]
+)
+def test_pillar_sections_against_clipping(p: Union[PillarProfile, Profile], monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    clipped = [
+        shapely.clip_by_rect(p.cross_section, p.pillar_boundaries[i], -math.inf, p.pillar_boundaries[i + 1], math.inf)
+        for i in range(len(p.pillars))
+    ]
+
+    assert np.allclose(shapely.area(p.pillar_sections), shapely.area(clipped))
+    assert np.allclose(shapely.area(shapely.symmetric_difference(p.pillar_sections, clipped)), 0, atol=1e-9)
+
+
+def test_pillar_sections_non_convex():
+    cs = shapely.Polygon([(-4, -3), (4, -3), (4, 3), (2, 3), (2, -1), (-2, -1), (-2, 3), (-4, 3)])
+    sections = pillar_sections(cs, [-1, 1, 3, 4])
+
+    assert np.allclose(shapely.area(sections), [4, 8, 6])
+
+
+def test_lazy_pillar_sections(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 10)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    p: Union[PillarProfile, Profile] = Profile.round(radius=10)
+    sections = p.pillar_sections
+
+    monkeypatch.setattr(pyroll.pillar_model.Config, "LAZY_PILLAR_SECTIONS", True)
+    p: Union[PillarProfile, Profile] = Profile.round(radius=10)
+    lazy = p.pillar_sections
+
+    assert isinstance(lazy, LazyPillarSections)
+    assert len(lazy) == 10
+    assert not lazy._sections
+    assert np.isclose(lazy[-1].area, sections[-1].area)
+    assert lazy[-1] is lazy[9]
+    assert len(lazy._sections) == 1
+    assert np.allclose(shapely.area(lazy[:]), shapely.area(sections))
@@ -0,0 +1,81 @@
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.core import Profile, PassSequence, RollPass, Roll, CircularOvalGroove, root_hooks
+from pyroll.pillar_model.profile import pillar_setting
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.3
+
+
+def roll_pass(**kwargs):
+    return RollPass(
+        label="Oval",
+        roll=Roll(
+            groove=CircularOvalGroove(
+                depth=5e-3,
+                r1=0.2e-3,
+                r2=16e-3,
+            ),
+            nominal_radius=160e-3,
+            rotational_frequency=1,
+            neutral_point=-20e-3
+        ),
+        gap=4e-3,
+        disk_element_count=5,
+        **kwargs
+    )
+
+
+def test_pillar_settings_fallback(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 12)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "CORNER_CORRECTION", False)
+
+    rp1 = roll_pass(pillar_count=20)
+    rp2 = roll_pass()
+    sequence = PassSequence([rp1, rp2], pillar_type="UNIFORM", elongation_correction=False)
+
+    assert rp1.pillar_count == 20
+    assert rp2.pillar_count == 12
+    assert rp1.pillar_type == rp2.pillar_type == "UNIFORM"
+    assert not rp1.elongation_correction
+    assert not rp2.corner_correction
+    assert sequence.pillar_count == 12
+
+    p = Profile.round(diameter=10)
+    assert pillar_setting(p, "pillar_count") == 12
+    assert len(p.pillar_widths) == 12
+
+
+def test_solve_with_pillar_settings(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+
+    in_profile = Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+    rp = roll_pass(pillar_count=12, pillar_type="UNIFORM", corner_correction=False)
+
+    with RollPass.DiskElement.pillar_spreads(pillar_spreads):
+        root_hooks.add(RollPass.DiskElement.pillar_spreads)
+        try:
+            rp.solve(in_profile)
+        finally:
+            root_hooks.remove_last(RollPass.DiskElement.pillar_spreads)
+
+    assert len(rp.in_profile.pillars) == 12
+    assert len(rp.out_profile.pillars) == 12
+    assert all(len(de.out_profile.pillar_heights) == 12 for de in rp.disk_elements)
+    assert len(rp.in_profile.pillar_strains) == 12
+
+    # uniform pillars have equal areas in the in profile, except the center one
+    areas = rp.in_profile.pillar_areas
+    assert np.allclose(areas[1:], areas[1], rtol=1e-2)
+
+    assert np.all(rp.pillar_corner_correction_strains == 0)
@@ -0,0 +1,67 @@
+import json
+
+from pyroll.core import Roll
+from pyroll.pillar_model import geometry
+from pyroll.pillar_model.profiling import PillarProfiler, _hook_functions
+from pyroll.pillar_model.roll_pass import sweep
+from pyroll.pillar_model.roll_pass.hookimpls import pillar_disk_element
+from pyroll.pillar_model.roll_pass.surface_table import RollSurfaceTable
+
+from scenarios import solve_roll_pass
+
+
+def test_pillar_profiler(tmp_path):
+    originals = {id(f): f.function for _, f in _hook_functions(("pyroll.pillar_model",))}
+    surface_interpolation = Roll.surface_interpolation
+    pillar_cross_section_measures = geometry.pillar_cross_section_measures
+
+    with PillarProfiler() as profiler:
+        assert profiler.enabled
+        assert Roll.surface_interpolation is not surface_interpolation
+        # also replaced where imported by name
+        assert pillar_disk_element.pillar_cross_section_measures is not pillar_cross_section_measures
+        solve_roll_pass("round_oval", disk_element_count=5)
+
+    # the original functions are restored
+    assert not profiler.enabled
+    assert all(f.function is originals[id(f)] for _, f in _hook_functions(("pyroll.pillar_model",)))
+    assert Roll.surface_interpolation is surface_interpolation
+    assert geometry.pillar_cross_section_measures is pillar_cross_section_measures
+    assert pillar_disk_element.pillar_cross_section_measures is pillar_cross_section_measures
+    assert not hasattr(RollSurfaceTable.depths, "__wrapped__")
+    assert not hasattr(sweep.pillar_entry_points, "__wrapped__")
+
+    names = {name for _, name in profiler.statistics}
+    assert "Roll.surface_interpolation" in names
+    assert {
+        "RollSurfaceTable.depths",
+        "geometry.pillar_cross_section_measures",
+        "geometry.chord_height_table",
+        "sweep.pillar_entry_points",
+    } <= names
+    assert any(name.endswith("(out_cross_section)") for name in names)
+    assert any(".pillars_in_contact (" in name for name in names)
+    assert {rp for rp, _ in profiler.statistics} == {"Oval"}
+
+    for s in profiler.statistics.values():
+        assert s.calls > 0
+        assert 0 <= s.self_time <= s.total_time + 1e-9
+
+    heights = next(s for (_, name), s in profiler.statistics.items() if name.endswith("(pillar_heights)"))
+    assert heights.array_bytes > 0
+    assert sum(s.self_time for s in profiler.statistics.values()) <= profiler.wall_time
+
+    table = profiler.table(limit=5)
+    assert len(table.splitlines()) == 7
+    assert "wall time" in table
+
+    trace_file = tmp_path / "trace.json"
+    profiler.write_chrome_trace(trace_file)
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert len(events) == sum(s.calls for s in profiler.statistics.values())
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+    # nothing is recorded when disabled
+    calls = sum(s.calls for s in profiler.statistics.values())
+    solve_roll_pass("round_oval", disk_element_count=5)
+    assert sum(s.calls for s in profiler.statistics.values()) == calls
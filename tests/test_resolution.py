@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+import pyroll.pillar_model
+
+from pyroll.pillar_model.resolution import (
+    pillar_count_study, multilevel_solve, solve_level, PillarCountStudy, PillarCountLevel, QUANTITIES
+)
+from pyroll.pillar_model.roll_pass.warm_start import WarmStartStore
+
+from scenarios import round_oval, pillar_spreads
+
+
+def level(pillar_count, deviation):
+    return PillarCountLevel(
+        pillar_count=pillar_count, duration=1, iteration_count=1, positions=np.zeros(1),
+        total_pillar_strains=np.zeros(1), mean_total_strain=0, contact_area=0, roll_force=0, width=0,
+        deviations={q: deviation for q in QUANTITIES},
+    )
+
+
+def test_recommended_pillar_count():
+    study = PillarCountStudy([level(5, 0.1), level(10, 0.005), level(20, 0.02), level(40, 0.001), level(80, 0)], 0.01)
+    assert study.recommended_pillar_count == 40
+
+    study = PillarCountStudy([level(5, 0.1), level(10, 0.005), level(20, 0.002), level(40, 0)], 0.01)
+    assert study.recommended_pillar_count == 10
+
+    study = PillarCountStudy([level(5, 0.1), level(10, 0)], 0.01)
+    assert study.recommended_pillar_count is None
+
+
+def test_pillar_count_study(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    (rp,), in_profile = round_oval()
+
+    with pillar_spreads(-0.3):
+        study = pillar_count_study(rp, in_profile, [20, 5, 10], tolerance=0.05)
+
+    assert [level.pillar_count for level in study.levels] == [5, 10, 20]
+    assert [len(level.total_pillar_strains) for level in study.levels] == [5, 10, 20]
+    assert all(level.duration > 0 and level.iteration_count > 0 for level in study.levels)
+    assert all(d == 0 for d in study.levels[-1].deviations.values())
+    assert study.levels[0].deviations["width"] > study.levels[1].deviations["width"]
+    assert study.recommended_pillar_count == 10
+    assert "recommended pillar count: 10" in str(study)
+
+    # the given roll pass and the configuration are not modified
+    assert rp.out_profile is None
+    assert pyroll.pillar_model.Config.PILLAR_COUNT == 30
+
+    with pytest.raises(ValueError):
+        pillar_count_study(rp, in_profile, [10])
+
+
+def test_multilevel_solve(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 120)
+    (rp,), in_profile = round_oval()
+
+    with pillar_spreads(-0.3):
+        _, direct = solve_level(rp, in_profile, 120)
+        store = WarmStartStore()
+        levels = multilevel_solve(rp, in_profile, [30, 240], store=store)
+
+    assert [level.pillar_count for level in levels] == [30, 120]
+    assert len(rp.in_profile.pillars) == 120
+
+    # the fine level starts from the interpolated coarse coefficients
+    assert store.statistics.interpolations == 1
+    assert "_warm_start_store" not in rp.__dict__
+    assert levels[-1].iteration_count < direct.iteration_count
+
+    assert np.isclose(levels[-1].width, direct.width, rtol=1e-3)
+    assert np.isclose(levels[-1].roll_force, direct.roll_force, rtol=1e-2)
+    assert np.allclose(levels[-1].total_pillar_strains, direct.total_pillar_strains, atol=1e-2)
+
+    with pytest.raises(ValueError):
+        multilevel_solve(rp, in_profile)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import pyroll.pillar_model
+from pyroll.core import Roll, CircularOvalGroove
+from pyroll.pillar_model.roll_pass import surface_table
+from pyroll.pillar_model.roll_pass.surface_table import RollSurfaceTable, roll_surface_table, disk_surface_depths
+
+
+def roll(r2=16e-3):
+    return Roll(
+        groove=CircularOvalGroove(
+            depth=5e-3,
+            r1=0.2e-3,
+            r2=r2,
+        ),
+        nominal_radius=160e-3,
+    )
+
+
+def test_roll_surface_table_depths():
+    r = roll()
+    table = roll_surface_table(r)
+    z = np.linspace(r.surface_z[0], r.surface_z[-1], 57)
+
+    for x in [r.surface_x[0], -12.3e-3, -1e-3, 0, r.surface_x[100], r.surface_x[-1]]:
+        expected = r.surface_interpolation(x, z).squeeze()
+        assert np.allclose(table.depths(x, z), expected, rtol=1e-12, atol=1e-15)
+
+    assert np.allclose(table.row(-1e-3), r.surface_interpolation(-1e-3, r.surface_z).squeeze(), rtol=1e-12)
+    assert table.row(-1e-3) is table.row(-1e-3)
+
+
+def test_roll_surface_table_bounds():
+    r = roll()
+    table = roll_surface_table(r)
+
+    with pytest.raises(ValueError):
+        table.row(r.surface_x[-1] * 1.01)
+    with pytest.raises(ValueError):
+        table.depths(0, [r.surface_z[-1] * 1.01])
+
+
+def test_roll_surface_table_invalidation():
+    r = roll()
+    table = roll_surface_table(r)
+
+    assert roll_surface_table(r) is table
+    assert table.is_valid(roll())
+    assert not table.is_valid(roll(r2=18e-3))
+
+    r.contact_length = 5e-3
+    r.reevaluate_cache()
+    assert roll_surface_table(r) is not table
+
+
+def test_roll_surface_table_row_count(monkeypatch):
+    monkeypatch.setattr(surface_table, "TABLE_ROW_COUNT", 3)
+    table = RollSurfaceTable(roll())
+
+    for x in np.linspace(-1e-3, 0, 7):
+        table.row(x)
+
+    assert len(table.rows) <= 3
+
+
+def test_disk_surface_depths_disabled(monkeypatch):
+    r = roll()
+    z = np.linspace(-5e-3, 5e-3, 9)
+    enabled = disk_surface_depths(r, -2e-3, z)
+
+    monkeypatch.setattr(pyroll.pillar_model.Config, "ROLL_SURFACE_TABLE", False)
+    disabled = disk_surface_depths(r, -2e-3, z)
+
+    assert "_roll_surface_table" in r.__dict__
+    assert disabled.shape == enabled.shape == z.shape
+    assert np.allclose(enabled, disabled, rtol=1e-12)
@@ -0,0 +1,112 @@
+import multiprocessing
+
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.core import Profile, PassSequence, RollPass, Roll, CircularOvalGroove, Transport, root_hooks
+from pyroll.pillar_model.runner import run_variants, config_values, PassResult
+from pyroll.pillar_model.roll_pass.warm_start import WarmStartStore, warm_start_store
+
+
+def pillar_spreads(self: RollPass.DiskElement):
+    return self.pillar_draughts ** -0.3
+
+
+def register_pillar_spreads():
+    RollPass.DiskElement.pillar_spreads.add_function(pillar_spreads)
+    root_hooks.add(RollPass.DiskElement.pillar_spreads)
+
+
+def variant(gap):
+    if gap <= 0:
+        raise ValueError("gap must be positive")
+
+    in_profile = Profile.round(
+        diameter=19.5e-3,
+        temperature=1200 + 273.15,
+        strain=0,
+        material=["C45", "steel"],
+        flow_stress=100e6,
+        density=7.5e3,
+        specific_heat_capcity=690,
+    )
+
+    sequence = PassSequence([
+        RollPass(
+            label="Oval",
+            roll=Roll(
+                groove=CircularOvalGroove(
+                    depth=5e-3,
+                    r1=0.2e-3,
+                    r2=16e-3,
+                ),
+                nominal_radius=160e-3,
+                rotational_frequency=1,
+                neutral_point=-20e-3
+            ),
+            gap=gap,
+            disk_element_count=5,
+        ),
+        Transport(label="Transport", duration=1),
+    ])
+
+    return sequence, in_profile
+
+
+def test_config_values(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 12)
+    values = config_values()
+
+    assert values["PILLAR_COUNT"] == 12
+    assert values["PILLAR_TYPE"] == pyroll.pillar_model.Config.PILLAR_TYPE
+
+
+def test_run_variants():
+    results = run_variants(
+        variant, [4e-3, 5e-3, -1], max_workers=2, config=dict(PILLAR_COUNT=12), initializer=register_pillar_spreads,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.parameters for r in results] == [4e-3, 5e-3, -1]
+    assert [r.succeeded for r in results] == [True, True, False]
+    assert "gap must be positive" in results[2].error
+    assert results[2].passes == []
+
+    for r in results[:2]:
+        assert len(r.passes) == 1
+        p = r.passes[0]
+        assert isinstance(p, PassResult)
+        assert p.label == "Oval"
+        assert len(p.pillars) == 12
+        assert len(p.total_pillar_strains) == 12
+        assert p.roll_force > 0
+        assert np.all(p.pillar_areas > 0)
+        assert p.pillars[-1] < p.width / 2
+
+    # the larger gap results in less strain
+    assert np.mean(results[1].passes[0].total_pillar_strains) < np.mean(results[0].passes[0].total_pillar_strains)
+
+    # the configuration of the parent process is not modified
+    assert pyroll.pillar_model.Config.PILLAR_COUNT == 30
+
+
+def test_run_variants_warm_start(monkeypatch, tmp_path):
+    path = tmp_path / "warm_start.json"
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_WARM_START", True)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_WARM_START_FILE", path)
+
+    results = run_variants(
+        variant, [4e-3, 5e-3], max_workers=2, config=dict(PILLAR_COUNT=12), initializer=register_pillar_spreads,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert all(r.succeeded for r in results)
+    fingerprints = [next(iter(r.warm_start_entries)) for r in results]
+    assert len(set(fingerprints)) == 2
+    assert all(list(r.warm_start_entries[f]) == [12] for r, f in zip(results, fingerprints))
+
+    # the entries are merged into the parent's store and written to its file by the parent only
+    assert set(fingerprints) <= warm_start_store().entries.keys()
+    assert set(fingerprints) <= WarmStartStore(path).entries.keys()
+    assert [p.name for p in tmp_path.iterdir()] == ["warm_start.json"]
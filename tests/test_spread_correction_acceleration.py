@@ -0,0 +1,167 @@
+import functools
+
+import numpy as np
+import pytest
+import pyroll.pillar_model
+
+from pyroll.pillar_model.roll_pass.acceleration import ACCELERATORS, SpreadCorrectionController
+
+from scenarios import SCENARIOS, pillar_spreads, solve_roll_pass
+
+
+def solve(scenario):
+    rp = solve_roll_pass(scenario)
+
+    residuals = 1 / (rp.mean_elongation * rp.total_pillar_draughts * rp.total_pillar_spreads) - 1
+    return len(rp.convergence_history), np.max(np.abs(residuals)), rp.out_profile.cross_section.area
+
+
+@functools.cache
+def reference(scenario):
+    return solve(scenario)
+
+
+@pytest.mark.parametrize("accelerator", ["AITKEN", "ANDERSON"])
+def test_accelerated_linear_fixed_point(accelerator):
+    matrix = np.array([[0.9, 0.05, 0], [0.05, 0.8, 0.05], [0, 0.05, 0.9]])
+    offset = np.array([1, 2, 3])
+    solution = np.linalg.solve(np.eye(3) - matrix, offset)
+
+    def iteration_count(acc):
+        x = np.zeros(3)
+        for i in range(1, 1000):
+            x = acc.update(x, matrix @ x + offset)
+            if np.max(np.abs(x - solution)) < 1e-8:
+                return i
+
+    relaxed = iteration_count(ACCELERATORS["RELAXATION"](5))
+    accelerated = iteration_count(ACCELERATORS[accelerator](5))
+
+    assert accelerated is not None
+    assert accelerated < relaxed / 5
+
+
+@pytest.mark.parametrize("accelerator", ["AITKEN", "ANDERSON"])
+@pytest.mark.parametrize("scenario", ["round_oval", "square_oval"])
+def test_spread_correction_acceleration(monkeypatch, scenario, accelerator):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    ref_iterations, ref_residual, ref_area = reference(scenario)
+
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_ACCELERATOR", accelerator)
+    iterations, residual, area = solve(scenario)
+
+    assert iterations < ref_iterations / 2
+    assert residual <= ref_residual
+    assert np.isclose(area, ref_area, rtol=5e-3)
+
+
+@pytest.mark.parametrize("accelerator", ["AITKEN", "ANDERSON"])
+def test_accelerator_update_once_per_iteration(accelerator):
+    rng = np.random.default_rng(1)
+    iterates = rng.uniform(size=(4, 3))
+    steps = rng.uniform(size=(4, 3))
+
+    acc = ACCELERATORS[accelerator](5)
+    expected = [acc.update(x, g, i) for i, (x, g) in enumerate(zip(iterates, steps))]
+
+    acc = ACCELERATORS[accelerator](5)
+    results = []
+    for i, (x, g) in enumerate(zip(iterates, steps)):
+        acc.update(x + 1, g - 1, i)
+        results.append(acc.update(x, g, i))
+
+    assert np.allclose(results, expected)
+
+
+@pytest.mark.parametrize("accelerator", ["AITKEN", "ANDERSON"])
+def test_accelerator_reset_per_solution(monkeypatch, accelerator):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_ACCELERATOR", accelerator)
+
+    factory, exponent = SCENARIOS["round_oval"]
+    (rp,), in_profile = factory()
+
+    with pillar_spreads(exponent):
+        rp.solve(in_profile)
+        first = rp._spread_correction_accelerator
+        start = len(rp.convergence_history)
+        rp.solve(in_profile)
+
+    second = rp.__dict__.get("_spread_correction_accelerator", None)
+    assert second is not first
+    assert second is None or second.iteration >= start
+
+
+def test_spread_correction_controller():
+    controller = SpreadCorrectionController(relaxation_factor=0.1, tolerance=1e-3, adaptive=True)
+
+    assert controller.update(np.array([0.1, -0.2])) == 0.1
+    assert np.isclose(controller.update(np.array([0.1, -0.1])), 0.15)
+    assert np.isclose(controller.update(np.array([0.05, 0.3])), 0.075)
+    assert not controller.converged
+
+    controller.update(np.array([1e-4, -5e-4]))
+    assert controller.converged
+    assert controller.residual_norms == [0.2, 0.1, 0.3, 5e-4]
+
+    controller = SpreadCorrectionController(relaxation_factor=0.1, tolerance=1e-3, adaptive=False)
+    controller.update(np.array([0.2]))
+    assert controller.update(np.array([0.1])) == 0.1
+
+
+def test_spread_correction_controller_without_tolerance():
+    assert pyroll.pillar_model.Config.SPREAD_CORRECTION_TOLERANCE is None
+
+    controller = SpreadCorrectionController(relaxation_factor=0.1, tolerance=None, adaptive=False)
+    controller.update(np.array([0.]))
+    assert not controller.converged
+
+
+def test_spread_correction_controller_once_per_iteration():
+    controller = SpreadCorrectionController(relaxation_factor=0.1, tolerance=1e-3, adaptive=True)
+
+    controller.update(np.array([0.2]), 0)
+    assert np.isclose(controller.update(np.array([0.1]), 1), 0.15)
+    # repeated updates within an iteration replace the last one instead of shrinking the factor
+    assert np.isclose(controller.update(np.array([0.3]), 1), 0.05)
+    assert np.isclose(controller.update(np.array([0.15]), 1), 0.15)
+    assert controller.residual_norms == [0.2, 0.15]
+    assert np.isclose(controller.update(np.array([0.1]), 2), 0.225)
+
+
+def test_spread_correction_controller_reset_per_solution(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_ADAPTIVE_RELAXATION", True)
+
+    factory, exponent = SCENARIOS["round_oval"]
+    (rp,), in_profile = factory()
+
+    with pillar_spreads(exponent):
+        rp.solve(in_profile)
+        first = rp._spread_correction_controller
+        start = len(rp.convergence_history)
+        rp.solve(in_profile)
+
+    second = rp._spread_correction_controller
+    assert second is not first
+    assert len(first.residual_norms) == start
+    assert len(second.residual_norms) == len(rp.convergence_history) - start
+
+
+@pytest.mark.parametrize("scenario", ["round_oval", "square_oval"])
+def test_adaptive_spread_correction_relaxation(monkeypatch, scenario):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    ref_iterations, ref_residual, ref_area = reference(scenario)
+
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_ADAPTIVE_RELAXATION", True)
+    iterations, residual, area = solve(scenario)
+
+    assert iterations < ref_iterations / 2
+    assert residual <= ref_residual
+    assert np.isclose(area, ref_area, rtol=5e-3)
@@ -0,0 +1,20 @@
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.pillar_model.roll_pass.stacking import stacked
+
+from scenarios import solve_roll_pass
+
+
+def test_stacked(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+
+    rp = solve_roll_pass("round_oval")
+
+    draughts = stacked(rp, "pillar_draughts")
+    assert draughts.shape == (15, 30)
+    assert all(np.array_equal(row, de.pillar_draughts) for row, de in zip(draughts, rp.disk_elements))
+    assert not np.shares_memory(draughts[3], rp.disk_elements[3].pillar_draughts)
+
+    assert np.allclose(rp.total_pillar_draughts, np.prod(draughts, axis=0))
+    assert np.allclose(rp.total_pillar_strains, np.sum(stacked(rp, "pillar_strains"), axis=0))
@@ -0,0 +1,84 @@
+import pytest
+import shapely
+import numpy as np
+import pyroll.pillar_model
+
+from typing import Union
+from scipy.optimize import fsolve
+from pyroll.core import Profile
+from pyroll.pillar_model.profile import PillarProfile
+from pyroll.pillar_model.geometry import ChordHeightTable, uniform_pillar_widths
+
+
+def shapely_chord_heights(cross_section, z):
+    return np.array(
+        [
+            shapely.intersection(
+                cross_section,
+                shapely.LineString([(p, cross_section.bounds[1]), (p, cross_section.bounds[3])])
+            ).length
+            for p in z
+        ]
+    )
+
+
+def fsolve_pillar_widths(cross_section, width, pillar_count):
+    def p_centers(p_widths):
+        centers = np.zeros_like(p_widths)
+        centers[1:] = np.cumsum((p_widths[:-1] + p_widths[1:]) / 2)
+        return centers
+
+    def fun(p_widths):
+        areas = p_widths * shapely_chord_heights(cross_section, p_centers(p_widths))
+        return np.append(areas[1:] - areas[:-1], np.sum(p_widths) - width / 2 - p_widths[0] / 2)
+
+    return fsolve(fun, x0=np.full(pillar_count, width / 2 / (pillar_count - 0.5)))
+
+
+PROFILES = [
+    Profile.round(radius=10),
+    Profile.square(side=10, corner_radius=1),
+    Profile.box(height=10, width=5, corner_radius=1),
+    Profile.diamond(height=5, width=10, corner_radius=1)
+]
+
+
+@pytest.mark.parametrize("p", PROFILES)
+@pytest.mark.parametrize("pillar_count", [4, 30])
+def test_uniform_pillar_widths_against_fsolve(p: Union[PillarProfile, Profile], pillar_count):
+    widths = uniform_pillar_widths(ChordHeightTable(p.cross_section), p.width, pillar_count)
+    expected = fsolve_pillar_widths(p.cross_section, p.width, pillar_count)
+
+    assert np.allclose(widths, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("p", PROFILES)
+def test_uniform_pillar_widths_exact_areas(p: Union[PillarProfile, Profile]):
+    table = ChordHeightTable(p.cross_section)
+    widths = uniform_pillar_widths(table, p.width, 30, polish=False)
+
+    boundaries = np.cumsum(widths) - widths[0] / 2
+    areas = np.diff(table.area(np.append(0, boundaries)))
+    areas[0] *= 2
+
+    assert np.isclose(np.sum(widths) - widths[0] / 2, p.width / 2)
+    assert np.allclose(areas, areas[0], rtol=1e-9)
+
+
+@pytest.mark.parametrize("p", PROFILES)
+def test_chord_height_table(p: Union[PillarProfile, Profile]):
+    table = ChordHeightTable(p.cross_section)
+    z = np.linspace(-p.width / 2 - 1, p.width / 2 + 1, 201)
+
+    assert np.allclose(table(z), shapely_chord_heights(p.cross_section, z))
+    assert np.isclose(table.area(p.width / 2), p.cross_section.area)
+    assert np.allclose(table.area(table.inverse_area(table.area(z))), table.area(z))
+
+
+def test_uniform_pillar_widths_hook(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 10)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "UNIFORM")
+
+    p: Union[PillarProfile, Profile] = Profile.round(diameter=10)
+    assert len(p.pillar_widths) == 10
+    assert np.allclose(p.pillar_areas, p.pillar_areas[0], rtol=1e-6)
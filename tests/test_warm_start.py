@@ -0,0 +1,174 @@
+import numpy as np
+import pyroll.pillar_model
+
+from pyroll.pillar_model.roll_pass.warm_start import WarmStartStore, warm_start_store
+
+from scenarios import oval_pass, round_oval, round_profile, pillar_spreads
+
+
+def test_warm_start_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    store = WarmStartStore(tmp_path / "warm_start.json")
+    (rp,), in_profile = round_oval()
+    rp.init_solve(in_profile)
+
+    assert store.lookup(rp) is None
+
+    coefficients = np.linspace(1, 1.1, 30)
+    store.record(rp, coefficients)
+    assert np.allclose(store.lookup(rp), coefficients)
+
+    # slightly changed gap falls into the same bin, larger change not
+    (similar,), in_profile = round_oval(gap=4.01e-3)
+    similar.init_solve(in_profile)
+    assert store.fingerprint(similar) == store.fingerprint(rp)
+    (different,), in_profile = round_oval(gap=5e-3)
+    different.init_solve(in_profile)
+    assert store.lookup(different) is None
+
+    # interpolation from the nearest stored pillar count
+    fingerprint = store.fingerprint(rp)
+    del store.entries[fingerprint][30]
+    store.entries[fingerprint][20] = dict(positions=np.linspace(0, 1, 20), coefficients=np.linspace(1, 2, 20))
+    positions = rp.in_profile.pillars / rp.in_profile.pillar_boundaries[-1]
+    assert np.allclose(store.lookup(rp), 1 + positions)
+
+    assert store.statistics.lookups == 4
+    assert store.statistics.hits == 1
+    assert store.statistics.interpolations == 1
+    assert store.statistics.misses == 2
+    assert store.statistics.hit_rate == 0.5
+
+    store.write()
+    loaded = WarmStartStore(tmp_path / "warm_start.json")
+    assert loaded.entries.keys() == store.entries.keys()
+    assert np.allclose(loaded.entries[fingerprint][20]["coefficients"], np.linspace(1, 2, 20))
+
+
+def test_warm_start_solution(monkeypatch, tmp_path):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_WARM_START", True)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "SPREAD_CORRECTION_WARM_START_FILE", tmp_path / "warm_start.json")
+
+    results = []
+    with pillar_spreads(-0.3):
+        for i in range(2):
+            (rp,), in_profile = round_oval()
+            rp.solve(in_profile)
+            results.append(rp)
+
+    cold, warm = results
+    statistics = warm_start_store().statistics
+
+    assert statistics.hits == 1
+    assert statistics.cold_iterations == [len(cold.convergence_history)]
+    assert statistics.warm_iterations == [len(warm.convergence_history)]
+    assert len(warm.convergence_history) < len(cold.convergence_history) / 2
+    assert statistics.iterations_saved > 0
+
+    assert np.allclose(warm.pillar_spread_correction_coefficients, cold.pillar_spread_correction_coefficients, rtol=1e-3)
+    assert np.isclose(warm.out_profile.cross_section.area, cold.out_profile.cross_section.area, rtol=1e-3)
+
+    warm_start_store().write()
+    assert (tmp_path / "warm_start.json").exists()
+
+
+def test_warm_start_records_converged_solutions_only(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    store = WarmStartStore()
+
+    with pillar_spreads(-0.3):
+        (rp,), in_profile = round_oval()
+        rp.max_iteration_count = 5
+        rp._warm_start_store = store
+        rp.solve(in_profile)
+        assert not store.entries
+        assert store.statistics.cold_iterations == [len(rp.convergence_history)]
+
+        (rp,), in_profile = round_oval()
+        rp._warm_start_store = store
+        rp.solve(in_profile)
+
+    entry = store.entries[store.fingerprint(rp)][30]
+    assert np.array_equal(entry["coefficients"], rp.pillar_spread_correction_coefficients)
+
+
+def test_warm_start_solved_again(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    store = WarmStartStore()
+
+    with pillar_spreads(-0.3):
+        (rp,), in_profile = round_oval()
+        rp._warm_start_store = store
+        rp.solve(in_profile)
+        cold_iterations = len(rp.convergence_history)
+
+        rp.solve(in_profile)
+
+    assert store.statistics.lookups == 2
+    assert store.statistics.hits == 1
+    assert store.statistics.cold_iterations == [cold_iterations]
+    assert store.statistics.warm_iterations == [len(rp.convergence_history) - cold_iterations]
+
+
+def test_warm_start_zero_gap(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_TYPE", "EQUIDISTANT")
+
+    store = WarmStartStore()
+
+    with pillar_spreads(-0.3):
+        rp = oval_pass(r1=1e-3, r2=20e-3, gap=0)
+        rp.max_iteration_count = 5
+        rp._warm_start_store = store
+        rp.solve(round_profile())
+
+    assert store.fingerprint(rp).endswith("/0")
+    assert store.statistics.lookups == 1
+
+    store.record(rp, rp.pillar_spread_correction_coefficients)
+    assert np.array_equal(store.lookup(rp), rp.pillar_spread_correction_coefficients)
+
+
+def test_warm_start_fingerprint_groove(monkeypatch):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+
+    store = WarmStartStore()
+
+    rp = oval_pass()
+    rp.init_solve(round_profile())
+    wider = oval_pass(r2=20e-3)
+    wider.init_solve(round_profile())
+
+    assert store.fingerprint(rp) != store.fingerprint(wider)
+
+    store.record(rp, 1.1)
+    assert store.lookup(wider) is None
+
+
+def test_warm_start_write_merges(monkeypatch, tmp_path):
+    monkeypatch.setattr(pyroll.pillar_model.Config, "PILLAR_COUNT", 30)
+
+    path = tmp_path / "warm_start.json"
+    first, second = WarmStartStore(path), WarmStartStore(path)
+
+    (rp,), in_profile = round_oval()
+    rp.init_solve(in_profile)
+    first.record(rp, 1.1)
+    (other,), in_profile = round_oval(gap=5e-3)
+    other.init_solve(in_profile)
+    second.record(other, 1.2)
+
+    first.write()
+    second.write()
+
+    loaded = WarmStartStore(path)
+    assert loaded.entries.keys() == {first.fingerprint(rp), second.fingerprint(other)}
+    assert [p.name for p in tmp_path.iterdir()] == ["warm_start.json"]